@@ -0,0 +1,17 @@
+-- Indexes backing the jesse_mcp.logs time-range queries on completed_backtests.
+--
+-- jesse-mcp only checks for these on its first database connection and logs
+-- a warning when they are missing; apply this file to build them. CONCURRENTLY
+-- cannot run inside a transaction block, so execute it with autocommit (plain
+-- psql does). A failed concurrent build leaves an INVALID index behind that
+-- IF NOT EXISTS will skip: DROP INDEX CONCURRENTLY it, then rerun this file.
+
+-- Every analysis query filters on created_at > NOW() - <lookback>. Rows are
+-- appended in time order, so a BRIN index prunes ranges at a tiny size.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS bt_created_brin
+    ON completed_backtests USING BRIN (created_at);
+
+-- Per-strategy aggregates (strategy_perf_30d) group by strategy_name within
+-- the last 30 days.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS bt_strategy_created
+    ON completed_backtests (strategy_name, created_at);
@@ -0,0 +1,37 @@
+-- Materialized 30-day per-strategy aggregates for jesse_mcp.logs.
+--
+-- jesse-mcp never creates these objects itself. When they are missing, or the
+-- view has not been refreshed within JESSE_PERF_VIEW_MAX_AGE_MINUTES (default
+-- 90), analyze_strategy_performance and the weekly report aggregate inline.
+-- Keep the view current by scheduling `scripts/run-monitor.sh --refresh`
+-- hourly; it runs REFRESH MATERIALIZED VIEW CONCURRENTLY and stamps
+-- strategy_perf_refresh.refreshed_at.
+--
+-- The view definition must stay in sync with _STRATEGY_PERF_QUERY in
+-- jesse_mcp/logs.py.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS strategy_perf_30d AS
+    SELECT
+        strategy_name,
+        COUNT(*) as total_backtests,
+        AVG(total_return) as avg_return,
+        AVG(win_rate) as avg_win_rate,
+        MAX(total_return) as best_return,
+        MIN(total_return) as worst_return,
+        STDDEV(total_return) as return_stddev
+    FROM completed_backtests
+    WHERE created_at > NOW() - INTERVAL '30 days'
+    GROUP BY strategy_name;
+
+-- REFRESH ... CONCURRENTLY requires a unique index on the view.
+CREATE UNIQUE INDEX IF NOT EXISTS strategy_perf_30d_name
+    ON strategy_perf_30d (strategy_name);
+
+-- Single-row table recording when strategy_perf_30d was last refreshed.
+CREATE TABLE IF NOT EXISTS strategy_perf_refresh (
+    id boolean PRIMARY KEY DEFAULT true CHECK (id),
+    refreshed_at timestamptz NOT NULL
+);
+
+INSERT INTO strategy_perf_refresh (refreshed_at) VALUES (NOW())
+    ON CONFLICT (id) DO UPDATE SET refreshed_at = EXCLUDED.refreshed_at;
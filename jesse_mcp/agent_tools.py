@@ -408,8 +408,8 @@ def register_agent_tools(mcp: FastMCP) -> None:
         from jesse_mcp.monitoring import MarketMonitor
 
         monitor = MarketMonitor()
-        risks = monitor.identify_risks()
         fg = monitor.get_fear_greed()
+        risks = monitor.identify_risks(fg)
 
         return {
             "risks": risks,
@@ -114,6 +114,11 @@ def main():
             os.environ["JESSE_MCP_TRANSPORT"] = "http"
             os.environ["JESSE_MCP_PORT"] = str(args.port)
 
+        if os.getenv("JESSE_MCP_UVLOOP") == "1":
+            from jesse_mcp.core.websocket_stream import install_uvloop
+
+            install_uvloop()
+
         server_main()
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -26,6 +26,7 @@ from jesse_mcp.core.websocket_stream import (
     SubscriptionType,
     get_websocket_client,
     close_websocket_client,
+    install_uvloop,
     WEBSOCKETS_AVAILABLE,
 )
 
@@ -45,5 +46,6 @@ __all__ = [
     "SubscriptionType",
     "get_websocket_client",
     "close_websocket_client",
+    "install_uvloop",
     "WEBSOCKETS_AVAILABLE",
 ]
@@ -15,9 +15,12 @@ Environment variables:
 """
 
 import os
+import copy
 import hashlib
 import json
 import logging
+import threading
+import time
 from typing import Dict, Any, Optional, Callable
 from functools import wraps
 
@@ -35,10 +38,14 @@ JESSE_CACHE_MAX_SIZE = int(os.getenv("JESSE_CACHE_MAX_SIZE", "1000"))
 
 _cache_instances: Dict[str, "TTLCache"] = {}
 _stats: Dict[str, Dict[str, int]] = {}
+_instances_lock = threading.Lock()
 
 
 class TTLCache:
-    """Simple TTL cache with statistics tracking"""
+    """Simple TTL cache with statistics tracking
+
+    Safe to share between threads: lookups, stores and evictions hold a lock.
+    """
 
     def __init__(
         self,
@@ -51,43 +58,44 @@ class TTLCache:
         self.max_size = max_size
         self._cache: Dict[str, tuple] = {}
         self._stats = {"hits": 0, "misses": 0}
+        self._lock = threading.Lock()
 
-    def _hash_key(self, *args, **kwargs) -> str:
+    def make_key(self, *args, **kwargs) -> str:
+        """Build a cache key from call arguments (JSON-encoded, then hashed)"""
         key_data = {"args": args, "kwargs": kwargs}
         key_str = json.dumps(key_data, sort_keys=True, default=str)
         return hashlib.sha256(key_str.encode()).hexdigest()[:32]
 
     def get(self, key: str) -> Optional[Any]:
-        import time
-
-        entry = self._cache.get(key)
-        if entry is None:
-            self._stats["misses"] += 1
-            return None
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
 
-        value, expiry = entry
-        if time.time() > expiry:
-            del self._cache[key]
-            self._stats["misses"] += 1
-            return None
+            value, expiry = entry
+            if time.time() > expiry:
+                del self._cache[key]
+                self._stats["misses"] += 1
+                return None
 
-        self._stats["hits"] += 1
-        return value
+            self._stats["hits"] += 1
+            return value
 
     def set(self, key: str, value: Any) -> None:
-        import time
-
-        if len(self._cache) >= self.max_size:
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
+        with self._lock:
+            if key not in self._cache and len(self._cache) >= self.max_size:
+                oldest_key = next(iter(self._cache))
+                del self._cache[oldest_key]
 
-        expiry = time.time() + self.ttl
-        self._cache[key] = (value, expiry)
+            expiry = time.time() + self.ttl
+            self._cache[key] = (value, expiry)
 
     def clear(self) -> int:
-        count = len(self._cache)
-        self._cache.clear()
-        return count
+        with self._lock:
+            count = len(self._cache)
+            self._cache.clear()
+            return count
 
     def size(self) -> int:
         return len(self._cache)
@@ -104,32 +112,58 @@ class TTLCache:
         }
 
     def wrap(self, func: Callable) -> Callable:
+        """
+        Cache func's results in this cache
+
+        Dict results with an "error" key or a "mock" data_source are returned
+        but not cached, so real data shows up as soon as its source recovers.
+        Each caller gets its own deep copy, so mutating a result cannot
+        corrupt the cached value.
+        """
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             if not JESSE_CACHE_ENABLED:
                 return func(*args, **kwargs)
 
-            key = self._hash_key(*args, **kwargs)
+            key = self.make_key(*args, **kwargs)
             cached = self.get(key)
             if cached is not None:
                 logger.debug(f"Cache HIT for {self.name}: {func.__name__}")
-                return cached
+                return copy.deepcopy(cached)
 
             logger.debug(f"Cache MISS for {self.name}: {func.__name__}")
             result = func(*args, **kwargs)
-            self.set(key, result)
+            if _is_cacheable(result):
+                self.set(key, copy.deepcopy(result))
             return result
 
         return wrapper
 
 
+def _is_cacheable(result: Any) -> bool:
+    if isinstance(result, dict):
+        return "error" not in result and result.get("data_source") != "mock"
+    return True
+
+
 def get_cache(name: str, ttl: Optional[int] = None) -> TTLCache:
     """Get or create a named cache instance"""
-    if name not in _cache_instances:
-        cache_ttl = ttl if ttl is not None else JESSE_CACHE_TTL
-        _cache_instances[name] = TTLCache(name, ttl=cache_ttl)
-        _stats[name] = {"hits": 0, "misses": 0}
-    return _cache_instances[name]
+    with _instances_lock:
+        if name not in _cache_instances:
+            cache_ttl = ttl if ttl is not None else JESSE_CACHE_TTL
+            _cache_instances[name] = TTLCache(name, ttl=cache_ttl)
+            _stats[name] = {"hits": 0, "misses": 0}
+        return _cache_instances[name]
+
+
+def cached(name: str, ttl: Optional[int] = None) -> Callable:
+    """Decorator caching a function's results in the named cache (see TTLCache.wrap)"""
+
+    def decorator(func: Callable) -> Callable:
+        return get_cache(name, ttl=ttl).wrap(func)
+
+    return decorator
 
 
 def get_strategy_cache() -> TTLCache:
@@ -10,7 +10,10 @@ import os
 import re
 import shutil
 import logging
-from typing import Dict, Any, Optional
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 import traceback
 
 logger = logging.getLogger("jesse-mcp.integration")
@@ -77,6 +80,80 @@ if JESSE_PATH:
         logger.warning(f"⚠️ Jesse research module not available: {e}")
 
 
+@lru_cache(maxsize=32)
+def _date_to_timestamp(date_str: str) -> int:
+    return int(jh.arrow_to_timestamp(date_str))
+
+
+# Memoized candle arrays are capped by their total size, not by entry count
+CANDLE_FETCH_CACHE_MAX_BYTES = int(os.getenv("JESSE_CANDLE_CACHE_MB", "256")) * 1024 * 1024
+
+# (exchange, symbol, timeframe, start, end, warmup) -> (candles, warmup, nbytes), LRU first
+_candle_fetch_cache: "OrderedDict[Tuple, Tuple[Any, Any, int]]" = OrderedDict()
+_candle_fetch_bytes = 0
+_candle_fetch_lock = threading.Lock()
+
+
+def _fetch_candles(
+    exchange: str,
+    symbol: str,
+    timeframe: str,
+    start_ts: int,
+    end_ts: int,
+    warmup_candles_num: int,
+) -> Tuple[Any, Any]:
+    """
+    Fetch candles through Jesse's research module, memoized per range.
+
+    Repeated backtests and significance tests over the same route and dates
+    reuse the arrays instead of going back to the database. Jesse does not
+    mutate the returned arrays, so sharing the reference is safe. Empty
+    results are not cached so that a later import becomes visible.
+    """
+    global _candle_fetch_bytes
+
+    key = (exchange, symbol, timeframe, start_ts, end_ts, warmup_candles_num)
+    with _candle_fetch_lock:
+        hit = _candle_fetch_cache.get(key)
+        if hit is not None:
+            _candle_fetch_cache.move_to_end(key)
+            return hit[0], hit[1]
+
+    candles, warmup = research.get_candles(
+        exchange=exchange,
+        symbol=symbol,
+        timeframe=timeframe,
+        start_date_timestamp=start_ts,
+        finish_date_timestamp=end_ts,
+        warmup_candles_num=warmup_candles_num,
+    )
+    if candles is None or len(candles) == 0:
+        return candles, warmup
+
+    size = getattr(candles, "nbytes", 0) + getattr(warmup, "nbytes", 0)
+    if size > CANDLE_FETCH_CACHE_MAX_BYTES:
+        return candles, warmup
+
+    with _candle_fetch_lock:
+        if key not in _candle_fetch_cache:
+            _candle_fetch_cache[key] = (candles, warmup, size)
+            _candle_fetch_bytes += size
+        while _candle_fetch_bytes > CANDLE_FETCH_CACHE_MAX_BYTES:
+            _, (_, _, evicted) = _candle_fetch_cache.popitem(last=False)
+            _candle_fetch_bytes -= evicted
+    return candles, warmup
+
+
+def clear_candle_fetch_cache() -> None:
+    """Drop memoized timestamps and candles (e.g. after importing new data)."""
+    global _candle_fetch_bytes
+
+    _date_to_timestamp.cache_clear()
+    with _candle_fetch_lock:
+        _candle_fetch_cache.clear()
+        _candle_fetch_bytes = 0
+
+
 class JesseIntegrationError(Exception):
     """Raised when Jesse integration fails"""
 
@@ -188,17 +265,10 @@ class JesseWrapper:
 
             # Get candles from database
             logger.info(f"Fetching candles: {symbol} from {start_date} to {end_date}")
-            start_ts = jh.arrow_to_timestamp(start_date)
-            end_ts = jh.arrow_to_timestamp(end_date)
+            start_ts = _date_to_timestamp(start_date)
+            end_ts = _date_to_timestamp(end_date)
 
-            candles, warmup = research.get_candles(
-                exchange=exchange,
-                symbol=symbol,
-                timeframe=timeframe,
-                start_date_timestamp=start_ts,
-                finish_date_timestamp=end_ts,
-                warmup_candles_num=240,
-            )
+            candles, warmup = _fetch_candles(exchange, symbol, timeframe, start_ts, end_ts, 240)
 
             if candles is None or len(candles) == 0:
                 raise JesseIntegrationError(f"No candle data available for {symbol}")
@@ -309,17 +379,10 @@ class JesseWrapper:
                 }
             ]
 
-            start_ts = jh.arrow_to_timestamp(start_date)
-            end_ts = jh.arrow_to_timestamp(end_date)
+            start_ts = _date_to_timestamp(start_date)
+            end_ts = _date_to_timestamp(end_date)
 
-            candles, warmup = research.get_candles(
-                exchange=exchange,
-                symbol=symbol,
-                timeframe=timeframe,
-                start_date_timestamp=start_ts,
-                finish_date_timestamp=end_ts,
-                warmup_candles_num=240,
-            )
+            candles, warmup = _fetch_candles(exchange, symbol, timeframe, start_ts, end_ts, 240)
 
             if candles is None or len(candles) == 0:
                 raise JesseIntegrationError(f"No candle data available for {symbol}")
@@ -422,17 +485,10 @@ class JesseWrapper:
                 }
             ]
 
-            start_ts = jh.arrow_to_timestamp(start_date)
-            end_ts = jh.arrow_to_timestamp(end_date)
+            start_ts = _date_to_timestamp(start_date)
+            end_ts = _date_to_timestamp(end_date)
 
-            candles, warmup = research.get_candles(
-                exchange=exchange,
-                symbol=symbol,
-                timeframe=timeframe,
-                start_date_timestamp=start_ts,
-                finish_date_timestamp=end_ts,
-                warmup_candles_num=240,
-            )
+            candles, warmup = _fetch_candles(exchange, symbol, timeframe, start_ts, end_ts, 240)
 
             if candles is None or len(candles) == 0:
                 raise JesseIntegrationError(f"No candle data available for {symbol}")
@@ -749,6 +805,8 @@ class JesseWrapper:
                 start_date=start_date,
                 show_progressbar=False,
             )
+            # Backtests must see the newly imported range
+            clear_candle_fetch_cache()
 
             logger.info(f"✅ Import complete: {result}")
             return {
@@ -154,7 +154,7 @@ def cached_backtest(
 
     cache = get_backtest_cache()
     route_key = json.dumps(routes, sort_keys=True)
-    cache_key = cache._hash_key(
+    cache_key = cache.make_key(
         route_key,
         start_date,
         end_date,
@@ -44,6 +44,15 @@ STRATEGY_TYPE_INDICATORS: Dict[str, List[str]] = {
     "default": ["sma", "ema", "rsi"],
 }
 
+_CODE_FENCE_RE = re.compile(r"```python\n?(.*?)```", re.DOTALL)
+_CLASS_DEF_RE = re.compile(r"class\s+(\w+)\s*\([^)]*\):")
+_STRATEGY_CLASS_RE = re.compile(r"class\s+\w+\s*\(Strategy\):")
+
+_METHOD_DEFINED_RE: Dict[str, re.Pattern] = {
+    m: re.compile(rf"^\s*def\s+{re.escape(m)}\s*\(", re.M)
+    for m in ("should_long", "should_short", "go_long", "go_short", "should_cancel_entry")
+}
+
 
 @dataclass
 class StrategySpec:
@@ -157,39 +166,45 @@ def _build_entry_methods() -> str:
         self.sell = qty, entry_price"""
 
 
-def _build_hyperparameters(indicators: List[str]) -> str:
-    params = []
+_HP_INDENT = " " * 8
+
+_MA_HYPERPARAMETER_LINES = (
+    f"{_HP_INDENT}{{'name': 'fast_period', 'type': int, 'default': 20, 'min': 5, 'max': 50}},",
+    f"{_HP_INDENT}{{'name': 'slow_period', 'type': int, 'default': 50, 'min': 20, 'max': 200}},",
+)
+_RSI_HYPERPARAMETER_LINES = (
+    f"{_HP_INDENT}{{'name': 'rsi_period', 'type': int, 'default': 14, 'min': 7, 'max': 28}},",
+    f"{_HP_INDENT}{{'name': 'rsi_overbought', 'type': int, 'default': 70, 'min': 60, 'max': 90}},",
+    f"{_HP_INDENT}{{'name': 'rsi_oversold', 'type': int, 'default': 30, 'min': 10, 'max': 40}},",
+)
+_MACD_HYPERPARAMETER_LINES = (
+    f"{_HP_INDENT}{{'name': 'macd_fast', 'type': int, 'default': 12, 'min': 5, 'max': 26}},",
+    f"{_HP_INDENT}{{'name': 'macd_slow', 'type': int, 'default': 26, 'min': 13, 'max': 52}},",
+    f"{_HP_INDENT}{{'name': 'macd_signal', 'type': int, 'default': 9, 'min': 5, 'max': 20}},",
+)
+_DEFAULT_HYPERPARAMETER_LINES = (
+    f"{_HP_INDENT}{{'name': 'risk_per_trade', 'type': float, 'default': 0.01, "
+    "'min': 0.001, 'max': 0.05},",
+)
+
+
+def _build_hyperparameters(indicators: List[str]) -> List[str]:
+    """Return the hyperparameter entries as already-indented source lines."""
+    lines: List[str] = []
 
     if "sma" in indicators or "ema" in indicators:
-        params.extend(
-            [
-                "{'name': 'fast_period', 'type': int, 'default': 20, 'min': 5, 'max': 50}",
-                "{'name': 'slow_period', 'type': int, 'default': 50, 'min': 20, 'max': 200}",
-            ]
-        )
+        lines.extend(_MA_HYPERPARAMETER_LINES)
 
     if "rsi" in indicators:
-        params.append("{'name': 'rsi_period', 'type': int, 'default': 14, 'min': 7, 'max': 28}")
-        params.append(
-            "{'name': 'rsi_overbought', 'type': int, 'default': 70, 'min': 60, 'max': 90}"
-        )
-        params.append("{'name': 'rsi_oversold', 'type': int, 'default': 30, 'min': 10, 'max': 40}")
+        lines.extend(_RSI_HYPERPARAMETER_LINES)
 
     if "macd" in indicators:
-        params.extend(
-            [
-                "{'name': 'macd_fast', 'type': int, 'default': 12, 'min': 5, 'max': 26}",
-                "{'name': 'macd_slow', 'type': int, 'default': 26, 'min': 13, 'max': 52}",
-                "{'name': 'macd_signal', 'type': int, 'default': 9, 'min': 5, 'max': 20}",
-            ]
-        )
+        lines.extend(_MACD_HYPERPARAMETER_LINES)
 
-    if not params:
-        params.append(
-            "{'name': 'risk_per_trade', 'type': float, 'default': 0.01, 'min': 0.001, 'max': 0.05}"
-        )
+    if not lines:
+        lines.extend(_DEFAULT_HYPERPARAMETER_LINES)
 
-    return "[\n            " + ",\n            ".join(params) + "\n        ]"
+    return lines
 
 
 def _build_indicator_properties(indicators: List[str]) -> List[str]:
@@ -215,7 +230,7 @@ class StrategyBuilder:
         """Generate initial strategy code with actual trading logic."""
         logger.info(f"Generating initial strategy: {spec.name}")
 
-        hyperparameters = _build_hyperparameters(spec.indicators)
+        hyperparameters = "(\n" + "\n".join(_build_hyperparameters(spec.indicators)) + "\n    )"
         indicator_props = _build_indicator_properties(spec.indicators)
         indicator_props_str = "\n\n".join(indicator_props) if indicator_props else "pass"
 
@@ -256,21 +271,25 @@ RSI mean reversion - buys when RSI is oversold, sells when RSI is overbought."""
 {docstring}
 """
 
-{STRATEGY_IMPORTS}
+from types import MappingProxyType
 
+{STRATEGY_IMPORTS}
 
 class {spec.name}(Strategy):
     """
     {strategy_doc}
     """
 
+    # Built once per class; read-only mappings so no caller can alter the defaults
+    _HYPERPARAMETERS = tuple(MappingProxyType(hp) for hp in {hyperparameters})
+
     def __init__(self):
         super().__init__()
         self.risk_per_trade = {spec.risk_per_trade}
 
     @property
     def hyperparameters(self):
-        return {hyperparameters}
+        return self._HYPERPARAMETERS
 
     def before(self):
         {before_init}
@@ -369,7 +388,7 @@ Fix the code:"""
             result = response.json()
             fixed_code = result.get("choices", [{}])[0].get("message", {}).get("content", "")
 
-            code_match = re.search(r"```python\n?(.*?)```", fixed_code, re.DOTALL)
+            code_match = _CODE_FENCE_RE.search(fixed_code)
             if code_match:
                 return code_match.group(1).strip()
 
@@ -434,25 +453,27 @@ Fix the code:"""
 
     def _fix_structure_errors(self, code: str, error: Dict) -> str:
         """Fix structure errors."""
-        class_match = re.search(r"class\s+(\w+)\s*\([^)]*\):", code)
+        class_match = _CLASS_DEF_RE.search(code)
         if class_match:
             class_name = class_match.group(1)
-            code = re.sub(
-                r"class\s+" + class_name + r"\s*\([^)]*\):", f"class {class_name}(Strategy):", code
+            code = (
+                code[: class_match.start()]
+                + f"class {class_name}(Strategy):"
+                + code[class_match.end() :]
             )
         return code
 
     def _fix_method_errors(self, code: str, error: Dict) -> str:
         """Fix method errors."""
         fix_hint = error.get("fix_hint", "")
-        if "should_long" in fix_hint and "def should_long" not in code:
-            code = self._add_method(code, "should_long", "return False")
-        if "should_short" in fix_hint and "def should_short" not in code:
-            code = self._add_method(code, "should_short", "return False")
-        if "go_long" in fix_hint and "def go_long" not in code:
-            code = self._add_method(code, "go_long", "pass")
-        if "go_short" in fix_hint and "def go_short" not in code:
-            code = self._add_method(code, "go_short", "pass")
+        for method, body in (
+            ("should_long", "return False"),
+            ("should_short", "return False"),
+            ("go_long", "pass"),
+            ("go_short", "pass"),
+        ):
+            if method in fix_hint and not _METHOD_DEFINED_RE[method].search(code):
+                code = self._add_method(code, method, body)
         return code
 
     def _add_method(self, code: str, method_name: str, body: str) -> str:
@@ -460,7 +481,7 @@ Fix the code:"""
         indent = "    "
         new_method = f"\n{indent}def {method_name}(self) -> bool:\n{indent}    {body}"
 
-        class_match = re.search(r"class\s+\w+\s*\(Strategy\):", code)
+        class_match = _STRATEGY_CLASS_RE.search(code)
         if class_match:
             insert_pos = class_match.end()
             code = code[:insert_pos] + new_method + code[insert_pos:]
@@ -694,7 +715,7 @@ Improve the strategy:"""
                     logger.info("LLM: No improvements needed")
                     return None
 
-                code_match = re.search(r"```python\n?(.*?)```", improved_code, re.DOTALL)
+                code_match = _CODE_FENCE_RE.search(improved_code)
                 if code_match:
                     return code_match.group(1).strip()
 
@@ -771,7 +792,7 @@ Improve the strategy:"""
                     logger.info("LLM: No improvements needed")
                     return None
 
-                code_match = re.search(r"```python\n?(.*?)```", improved_code, re.DOTALL)
+                code_match = _CODE_FENCE_RE.search(improved_code)
                 if code_match:
                     return code_match.group(1).strip()
 
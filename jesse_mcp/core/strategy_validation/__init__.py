@@ -7,7 +7,13 @@ Provides multi-level validation for Jesse trading strategies:
 """
 
 from jesse_mcp.core.strategy_validation.types import ValidationResult, ValidationLevel
-from jesse_mcp.core.strategy_validation.static import StaticValidator
+from jesse_mcp.core.strategy_validation.static import StaticValidator, get_static_validator
 from jesse_mcp.core.strategy_validation.dry_run import DryRunValidator
 
-__all__ = ["ValidationResult", "ValidationLevel", "StaticValidator", "DryRunValidator"]
+__all__ = [
+    "ValidationResult",
+    "ValidationLevel",
+    "StaticValidator",
+    "DryRunValidator",
+    "get_static_validator",
+]
@@ -9,6 +9,7 @@ import logging
 import os
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 from jesse_mcp.core.strategy_validation.metadata import (
@@ -19,7 +20,7 @@ from jesse_mcp.core.strategy_validation.metadata import (
 logger = logging.getLogger("jesse-mcp.certification")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CertificationStatus:
     """Decoded certification status from version string."""
 
@@ -44,6 +45,20 @@ class CertificationStatus:
         return self.has_enough_tests and self.meets_pass_rate and not self.is_certified
 
 
+_VERSION_RE = re.compile(r"^v(\d+)\.(\d+)\.(\d+)$")
+_VERSION_ASSIGN_RE = re.compile(r'__version__\s*=\s*["\'](v\d+\.\d+\.\d+)["\']')
+
+_UNCERTIFIED_ZERO = CertificationStatus(
+    is_certified=False,
+    certification_level=0,
+    test_count=0,
+    test_pass_count=0,
+    live_trade_count=0,
+    live_win_count=0,
+    pass_rate=0.0,
+)
+
+
 def decode_version(version: str) -> CertificationStatus:
     """
     Decode a version string to extract certification info.
@@ -58,32 +73,19 @@ def decode_version(version: str) -> CertificationStatus:
         v1.5.10  -> certified, 5/10 live trades won (50%)
     """
     if not version:
-        return CertificationStatus(
-            is_certified=False,
-            certification_level=0,
-            test_count=0,
-            test_pass_count=0,
-            live_trade_count=0,
-            live_win_count=0,
-            pass_rate=0.0,
-        )
+        return _UNCERTIFIED_ZERO
+    return _decode_version_cached(version)
 
-    match = re.match(r"^v(\d+)\.(\d+)\.(\d+)$", version)
+
+@lru_cache(maxsize=1024)
+def _decode_version_cached(version: str) -> CertificationStatus:
+    match = _VERSION_RE.match(version)
     if not match:
         logger.warning(f"Invalid version format: {version}")
-        return CertificationStatus(
-            is_certified=False,
-            certification_level=0,
-            test_count=0,
-            test_pass_count=0,
-            live_trade_count=0,
-            live_win_count=0,
-            pass_rate=0.0,
-        )
+        return _UNCERTIFIED_ZERO
 
-    level = int(match.group(1))
-    minor = int(match.group(2))
-    patch = int(match.group(3))
+    level, minor, patch = map(int, match.groups())
+    pass_rate = minor / patch if patch else 0.0
 
     if level == 0:
         return CertificationStatus(
@@ -93,18 +95,17 @@ def decode_version(version: str) -> CertificationStatus:
             test_pass_count=minor,
             live_trade_count=0,
             live_win_count=0,
-            pass_rate=minor / patch if patch > 0 else 0.0,
-        )
-    else:
-        return CertificationStatus(
-            is_certified=True,
-            certification_level=level,
-            test_count=0,
-            test_pass_count=0,
-            live_trade_count=patch,
-            live_win_count=minor,
-            pass_rate=minor / patch if patch > 0 else 0.0,
+            pass_rate=pass_rate,
         )
+    return CertificationStatus(
+        is_certified=True,
+        certification_level=level,
+        test_count=0,
+        test_pass_count=0,
+        live_trade_count=patch,
+        live_win_count=minor,
+        pass_rate=pass_rate,
+    )
 
 
 def get_strategy_certification(
@@ -147,7 +148,7 @@ def _get_version_from_strategy_file(
         with open(strategy_file, "r") as f:
             content = f.read()
 
-        match = re.search(r'__version__\s*=\s*["\'](v\d+\.\d+\.\d+)["\']', content)
+        match = _VERSION_ASSIGN_RE.search(content)
         if match:
             return match.group(1)
     except Exception as e:
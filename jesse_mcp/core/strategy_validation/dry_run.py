@@ -2,9 +2,12 @@
 Dry-run backtest validation via Jesse REST API.
 """
 
+import copy
+import hashlib
 import logging
-import uuid
-from typing import Dict, Any
+import secrets
+from collections import OrderedDict
+from typing import Dict, Any, Optional
 
 from jesse_mcp.core.strategy_validation.types import ValidationResult, ValidationLevel
 
@@ -14,12 +17,37 @@ logger = logging.getLogger("jesse-mcp.validator")
 class DryRunValidator:
     """Validates strategy by running a quick backtest via REST API."""
 
-    def __init__(self, rest_client_getter):
+    def __init__(self, rest_client_getter, cache_size: int = 256):
         self._get_client = rest_client_getter
-
-    def run_dry_run(self, code: str, spec: Dict[str, Any]) -> ValidationResult:
-        """Run dry-run backtest to catch runtime errors."""
-        strategy_name = spec.get("name", f"DryRun_{uuid.uuid4().hex[:8]}")
+        # Only completed backtests are kept; errors may be transient (timeouts, outages).
+        self._cache: "OrderedDict[str, ValidationResult]" = OrderedDict()
+        self._cache_cap = cache_size
+
+    @staticmethod
+    def _cache_key(code_bytes: bytes, spec: Dict[str, Any]) -> str:
+        """Key a dry-run by strategy source plus the spec fields that shape the backtest."""
+        h = hashlib.blake2b(code_bytes, digest_size=16)
+        for field_name in ("name", "symbol", "timeframe", "exchange"):
+            h.update(b"\0" + str(spec.get(field_name)).encode())
+        return h.hexdigest()
+
+    def run_dry_run(
+        self, code: str, spec: Dict[str, Any], code_bytes: Optional[bytes] = None
+    ) -> ValidationResult:
+        """Run dry-run backtest to catch runtime errors.
+
+        ``code_bytes`` is the UTF-8 encoding of ``code`` when the caller already has it.
+        """
+        if code_bytes is None:
+            code_bytes = code.encode("utf-8")
+        key = self._cache_key(code_bytes, spec)
+        cached = self._cache.get(key)
+        if cached is not None:
+            logger.info("🔬 Dry-run cache hit, skipping backtest")
+            self._cache.move_to_end(key)
+            return copy.deepcopy(cached)
+
+        strategy_name = spec.get("name") or f"DryRun_{secrets.token_hex(4)}"
         symbol = spec.get("symbol", "BTC-USDT")
         timeframe = spec.get("timeframe", "1h")
         exchange = spec.get("exchange", "Binance")
@@ -61,9 +89,9 @@ class DryRunValidator:
             win_rate = metrics.get("win_rate", 0)
             total_return = metrics.get("total_return", 0)
 
-            logger.info(f"✅ Dry-run: {total_trades} trades, {win_rate:.1%} win rate")
+            logger.info("✅ Dry-run: %s trades, %.1f%% win rate", total_trades, win_rate * 100)
 
-            return ValidationResult(
+            validation = ValidationResult(
                 passed=True,
                 level=ValidationLevel.DRY_RUN.value,
                 warnings=[f"Dry-run: {total_trades} trades, {win_rate:.1%} win rate"],
@@ -73,9 +101,13 @@ class DryRunValidator:
                     "total_return": total_return,
                 },
             )
+            self._cache[key] = copy.deepcopy(validation)
+            if len(self._cache) > self._cache_cap:
+                self._cache.popitem(last=False)
+            return validation
 
         except Exception as e:
-            logger.error(f"❌ Dry-run failed: {e}")
+            logger.error("❌ Dry-run failed: %s", e)
             return ValidationResult(
                 passed=True,
                 level=ValidationLevel.DRY_RUN.value,
@@ -3,92 +3,304 @@ Static validators for strategy code (syntax, imports, structure, methods, indica
 """
 
 import ast
+import mmap
+import os
 import re
 import logging
-from typing import Dict, List, Optional, Any
+import sys
+from dataclasses import dataclass, field
+from functools import cache, lru_cache
+from typing import Dict, List, Optional, Any, Set, Tuple, Union, cast
 
 from jesse_mcp.core.strategy_validation.types import ValidationResult, ValidationLevel
 
 logger = logging.getLogger("jesse-mcp.validator")
 
 
-KNOWN_INDICATORS = {
-    "sma",
-    "ema",
-    "wma",
-    "hma",
-    "vwma",
-    "tema",
-    "rsi",
-    "macd",
-    "atr",
-    "adx",
-    "stoch",
-    "cci",
-    "bollinger_bands",
-    "bollinger_bands_width",
-    "donchian_channel",
-    "obv",
-    "vwap",
-    "mfi",
-    "volume_profile",
-    "supertrend",
-    "ichimoku",
-    "parabolic_sar",
-    "zscore",
-    "kalman_filter",
-    "keltner_channel",
-    "pivot_points",
-}
+KNOWN_INDICATORS = frozenset(
+    map(
+        sys.intern,
+        (
+            "sma",
+            "ema",
+            "wma",
+            "hma",
+            "vwma",
+            "tema",
+            "rsi",
+            "macd",
+            "atr",
+            "adx",
+            "stoch",
+            "cci",
+            "bollinger_bands",
+            "bollinger_bands_width",
+            "donchian_channel",
+            "obv",
+            "vwap",
+            "mfi",
+            "volume_profile",
+            "supertrend",
+            "ichimoku",
+            "parabolic_sar",
+            "zscore",
+            "kalman_filter",
+            "keltner_channel",
+            "pivot_points",
+        ),
+    )
+)
+
+REQUIRED_METHODS = ("should_long", "go_long", "should_short", "go_short")
+
+# Regex scans below only run for sources that fail to parse; everything else is
+# read off the AST. That path is cold and string-valued, so there is no numeric
+# kernel for an optional Numba JIT to speed up.
+STRATEGY_IMPORT = "from jesse.strategies import Strategy"
+TA_IMPORTS = ("import jesse.indicators as ta", "from jesse import indicators as ta")
+
+# One alternation so the fallback reads methods, imports and ta.* usage in a
+# single finditer pass; the bare "ta." branch comes last so calls win.
+_FALLBACK_SCANNER = re.compile(
+    r"\bdef\s+(?P<method>" + "|".join(REQUIRED_METHODS) + r")\s*\("
+    r"|(?P<strategy_import>" + re.escape(STRATEGY_IMPORT) + ")"
+    r"|(?P<ta_import>" + "|".join(map(re.escape, TA_IMPORTS)) + ")"
+    r"|ta\.(?:(?P<indicator>\w+)\()?"
+)
+
+
+@dataclass(slots=True)
+class _CodeAnalysis:
+    """Facts about a strategy source collected in a single pass."""
+
+    # SyntaxError.args rather than the exception: a cached exception would
+    # collect a traceback (and pin its frames) on every re-raise.
+    syntax_error_args: Optional[Tuple[Any, ...]] = None
+    tree: Optional[ast.Module] = None
+    classes: List[Tuple[str, List[str]]] = field(default_factory=list)
+    strategy_classes: List[str] = field(default_factory=list)
+    func_names: Set[str] = field(default_factory=set)
+    has_strategy_import: bool = False
+    has_ta_import: bool = False
+    uses_ta: bool = False
+    ta_calls: List[str] = field(default_factory=list)
+
+    @property
+    def syntax_error_line(self) -> Optional[int]:
+        if self.syntax_error_args is None:
+            return None
+        return SyntaxError(*self.syntax_error_args).lineno
+
+
+# Strategy source: text, raw bytes, or a path to a file on disk.
+Source = Union[str, bytes, "os.PathLike[str]"]
+
+
+def _analysis_for(source: Source) -> _CodeAnalysis:
+    """Analyze in-memory code (memoized) or a file mapped read-only from disk."""
+    if isinstance(source, (str, bytes)):
+        return _analyze(source)
+
+    with open(source, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return _analyze(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            return _analyze_buffer(buf)
+
+
+@lru_cache(maxsize=8)
+def _analyze(code: Union[str, bytes]) -> _CodeAnalysis:
+    """Parse code once and collect everything the static validators need.
+
+    Memoized only so the individual validate_* calls on the same source share
+    one parse; whole results are cached by StrategyValidator, so this stays
+    small rather than pinning hundreds of ASTs. The returned analysis must be
+    treated as read-only.
+    """
+    return _analyze_buffer(code)
+
+
+def _analyze_buffer(code: Union[str, bytes, mmap.mmap]) -> _CodeAnalysis:
+    try:
+        tree = ast.parse(code, "<string>")
+    except SyntaxError as e:
+        text = code if isinstance(code, str) else bytes(code).decode("utf-8", "replace")
+        return _analyze_unparsable(text, e)
+
+    analysis = _CodeAnalysis(tree=tree)
+
+    # Classes, methods and imports only live at module or class top level, so
+    # read those bodies directly; only statements that can hold ta.* usage
+    # are walked in full.
+    expr_roots: List[ast.AST] = []
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            _inspect_class(node, analysis, expr_roots)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            analysis.func_names.add(node.name)
+            expr_roots.append(node)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            _record_import(node, analysis)
+        else:
+            expr_roots.append(node)
+
+    ta_calls: List[Tuple[int, int, str]] = []
+    for root in expr_roots:
+        for child in ast.walk(root):
+            if isinstance(child, ast.Attribute):
+                if isinstance(child.value, ast.Name) and child.value.id == "ta":
+                    analysis.uses_ta = True
+            elif isinstance(child, ast.Call):
+                func = child.func
+                if (
+                    isinstance(func, ast.Attribute)
+                    and isinstance(func.value, ast.Name)
+                    and func.value.id == "ta"
+                ):
+                    ta_calls.append((child.lineno, child.col_offset, func.attr))
+            elif isinstance(child, (ast.Import, ast.ImportFrom)):
+                _record_import(child, analysis)
+
+    analysis.ta_calls = [name for _, _, name in sorted(ta_calls)]
+    return analysis
+
+
+def _inspect_class(node: ast.ClassDef, analysis: _CodeAnalysis, expr_roots: List[ast.AST]) -> None:
+    """Record a class and its methods, recursing only into nested class bodies."""
+    _record_class(node.name, [ast.unparse(b) for b in node.bases], analysis)
+    for item in node.body:
+        if isinstance(item, ast.ClassDef):
+            _inspect_class(item, analysis, expr_roots)
+            continue
+        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            analysis.func_names.add(item.name)
+        expr_roots.append(item)
+
+
+def _record_class(name: str, bases: List[str], analysis: _CodeAnalysis) -> None:
+    analysis.classes.append((name, bases))
+    if any("Strategy" in base for base in bases):
+        analysis.strategy_classes.append(name)
+
+
+def _record_import(node: Union[ast.Import, ast.ImportFrom], analysis: _CodeAnalysis) -> None:
+    if isinstance(node, ast.Import):
+        for alias in node.names:
+            if alias.name == "jesse.indicators" and alias.asname == "ta":
+                analysis.has_ta_import = True
+        return
+
+    for alias in node.names:
+        if node.module == "jesse.strategies" and alias.name == "Strategy":
+            analysis.has_strategy_import = True
+        elif node.module == "jesse" and alias.name == "indicators":
+            analysis.has_ta_import = analysis.has_ta_import or alias.asname == "ta"
+
+
+def _analyze_unparsable(code: str, error: SyntaxError) -> _CodeAnalysis:
+    """Best-effort regex scan for sources that do not parse."""
+    analysis = _CodeAnalysis(syntax_error_args=error.args)
+    for m in _FALLBACK_SCANNER.finditer(code):
+        kind = m.lastgroup
+        if kind == "method":
+            analysis.func_names.add(m["method"])
+        elif kind == "strategy_import":
+            analysis.has_strategy_import = True
+        elif kind == "ta_import":
+            analysis.has_ta_import = True
+        else:
+            analysis.uses_ta = True
+            if kind == "indicator":
+                analysis.ta_calls.append(sys.intern(m["indicator"]))
+    return analysis
+
+
+# (substring of the error message, hint template) pairs; first match wins.
+_SYNTAX_HINTS: Tuple[Tuple[str, str], ...] = (
+    ("expected ':'", "Check line {line}: ensure proper class/function definition syntax"),
+    ("expected '('", "Check line {line}: ensure proper class/function definition syntax"),
+    ("unexpected EOF", "Check line {line}: verify indentation and brackets are balanced"),
+    ("unexpected indent", "Check line {line}: verify indentation and brackets are balanced"),
+)
+
+
+def _syntax_fix_hint(message: str, error: SyntaxError) -> str:
+    template = next(
+        (hint for key, hint in _SYNTAX_HINTS if key in message),
+        "Fix syntax error on line {line}: {msg}",
+    )
+    return template.format(line=error.lineno, msg=error.msg)
+
+
+_STATIC_STEPS = (
+    (ValidationLevel.SYNTAX.value, "_check_syntax"),
+    (ValidationLevel.IMPORTS.value, "_check_imports"),
+    (ValidationLevel.STRUCTURE.value, "_check_structure"),
+    (ValidationLevel.METHODS.value, "_check_methods"),
+    (ValidationLevel.INDICATORS.value, "_check_indicators"),
+)
 
 
 class StaticValidator:
     """Static validation of strategy code (no execution)."""
 
-    def validate_syntax(self, code: str) -> ValidationResult:
+    def validate_syntax(self, code: Source) -> ValidationResult:
         """Validate Python syntax."""
+        return self._check_syntax(_analysis_for(code))
+
+    def validate_imports(self, code: Source) -> ValidationResult:
+        """Validate required imports."""
+        return self._check_imports(_analysis_for(code))
+
+    def validate_structure(self, code: Source) -> ValidationResult:
+        """Validate class structure (inherits from Strategy)."""
+        return self._check_structure(_analysis_for(code))
+
+    def validate_methods(self, code: Source) -> ValidationResult:
+        """Validate required methods exist."""
+        return self._check_methods(_analysis_for(code))
+
+    def validate_indicators(self, code: Source) -> ValidationResult:
+        """Validate indicator usage."""
+        return self._check_indicators(_analysis_for(code))
+
+    def _check_syntax(self, analysis: _CodeAnalysis) -> ValidationResult:
         try:
-            compile(code, "<string>", "exec")
+            if analysis.syntax_error_args is not None:
+                raise SyntaxError(*analysis.syntax_error_args)
+            # Compiling the parsed tree skips a second parse but still catches
+            # compile-time errors ast.parse lets through ('return' outside function).
+            compile(cast(ast.Module, analysis.tree), "<string>", "exec")
             return ValidationResult(passed=True, level=ValidationLevel.SYNTAX.value)
         except SyntaxError as e:
-            logger.warning(f"Syntax error: {e}")
-            fix_hint = None
-            if "expected ':'" in str(e) or "expected '('" in str(e):
-                fix_hint = f"Check line {e.lineno}: ensure proper class/function definition syntax"
-            elif "unexpected EOF" in str(e) or "unexpected indent" in str(e):
-                fix_hint = f"Check line {e.lineno}: verify indentation and brackets are balanced"
-            else:
-                fix_hint = f"Fix syntax error on line {e.lineno}: {e.msg}"
+            logger.warning("Syntax error: %s", e)
+            message = str(e)
             return ValidationResult(
                 passed=False,
                 level=ValidationLevel.SYNTAX.value,
-                error=str(e),
+                error=message,
                 line=e.lineno,
-                fix_hint=fix_hint,
+                fix_hint=_syntax_fix_hint(message, e),
             )
 
-    def validate_imports(self, code: str) -> ValidationResult:
-        """Validate required imports."""
-        has_strategy_import = "from jesse.strategies import Strategy" in code
-        has_ta_import = (
-            "import jesse.indicators as ta" in code or "from jesse import indicators as ta" in code
-        )
-
-        if has_strategy_import:
+    def _check_imports(self, analysis: _CodeAnalysis) -> ValidationResult:
+        if analysis.has_strategy_import:
             warnings = []
-            if not has_ta_import and "ta." in code:
+            if not analysis.has_ta_import and analysis.uses_ta:
                 warnings.append("Code uses ta.* but missing 'import jesse.indicators as ta'")
-            elif not has_ta_import:
+            elif not analysis.has_ta_import:
                 warnings.append(
                     "Consider adding 'import jesse.indicators as ta' for indicator access"
                 )
+            if not warnings:
+                return ValidationResult(passed=True, level=ValidationLevel.IMPORTS.value)
             return ValidationResult(
                 passed=True, level=ValidationLevel.IMPORTS.value, warnings=warnings
             )
 
-        missing = ["from jesse.strategies import Strategy"]
-        if not has_ta_import:
-            missing.append("import jesse.indicators as ta")
+        missing = [STRATEGY_IMPORT]
+        if not analysis.has_ta_import:
+            missing.append(TA_IMPORTS[0])
 
         return ValidationResult(
             passed=False,
@@ -96,18 +308,29 @@ class StaticValidator:
             error=f"Missing imports: {', '.join(missing)}",
         )
 
-    def validate_structure(self, code: str) -> ValidationResult:
-        """Validate class structure (inherits from Strategy)."""
-        class_match = re.search(r"class\s+(\w+)\s*\(([^)]*)\)\s*:", code)
-        class_match_no_parens = re.search(r"class\s+(\w+)\s*:", code)
-        if not class_match and not class_match_no_parens:
+    def _check_structure(self, analysis: _CodeAnalysis) -> ValidationResult:
+        if analysis.syntax_error_args is not None:
+            return ValidationResult(
+                passed=False,
+                level=ValidationLevel.STRUCTURE.value,
+                error="Cannot check class structure: code has a syntax error",
+                line=analysis.syntax_error_line,
+            )
+
+        if not analysis.classes:
             return ValidationResult(
                 passed=False,
                 level=ValidationLevel.STRUCTURE.value,
                 error="No class definition found",
             )
-        if not class_match and class_match_no_parens:
-            class_name = class_match_no_parens.group(1)
+
+        if analysis.strategy_classes:
+            return ValidationResult(passed=True, level=ValidationLevel.STRUCTURE.value)
+
+        class_name, bases = next(
+            ((name, bases) for name, bases in analysis.classes if bases), analysis.classes[0]
+        )
+        if not bases:
             return ValidationResult(
                 passed=False,
                 level=ValidationLevel.STRUCTURE.value,
@@ -115,27 +338,15 @@ class StaticValidator:
                 fix_hint=f"class {class_name}(Strategy):",
             )
 
-        class_name = class_match.group(1)
-        inherits = class_match.group(2)
-
-        if "Strategy" in inherits:
-            return ValidationResult(passed=True, level=ValidationLevel.STRUCTURE.value)
-
         return ValidationResult(
             passed=False,
             level=ValidationLevel.STRUCTURE.value,
-            error=f"Class {class_name} must inherit from Strategy, not {inherits}",
+            error=f"Class {class_name} must inherit from Strategy, not {', '.join(bases)}",
             fix_hint="class " + class_name + "(Strategy):",
         )
 
-    def validate_methods(self, code: str) -> ValidationResult:
-        """Validate required methods exist."""
-        required_methods = ["should_long", "go_long", "should_short", "go_short"]
-        missing = []
-
-        for method in required_methods:
-            if f"def {method}(" not in code:
-                missing.append(method)
+    def _check_methods(self, analysis: _CodeAnalysis) -> ValidationResult:
+        missing = [m for m in REQUIRED_METHODS if m not in analysis.func_names]
 
         if not missing:
             return ValidationResult(passed=True, level=ValidationLevel.METHODS.value)
@@ -147,56 +358,64 @@ class StaticValidator:
             fix_hint=",".join(missing),
         )
 
-    def validate_indicators(self, code: str) -> ValidationResult:
-        """Validate indicator usage."""
-        ta_matches = re.findall(r"ta\.(\w+)\(", code)
-        warnings = []
-
-        for indicator in ta_matches:
-            if indicator not in KNOWN_INDICATORS:
-                warnings.append(f"Unknown indicator: ta.{indicator}")
+    def _check_indicators(self, analysis: _CodeAnalysis) -> ValidationResult:
+        unknown = set(analysis.ta_calls) - KNOWN_INDICATORS
+        warnings = [f"Unknown indicator: ta.{indicator}" for indicator in sorted(unknown)]
 
-        if warnings:
-            logger.warning(f"Indicator warnings: {warnings}")
+        if warnings and logger.isEnabledFor(logging.WARNING):
+            logger.warning("Indicator warnings: %s", ", ".join(warnings))
 
+        if not warnings:
+            return ValidationResult(passed=True, level=ValidationLevel.INDICATORS.value)
         return ValidationResult(
             passed=True,
             level=ValidationLevel.INDICATORS.value,
             warnings=warnings,
         )
 
-    def full_static_validation(self, code: str) -> Dict[str, Any]:
-        """Run all static validations."""
-        results = {
-            "passed": True,
-            "levels": {},
-            "errors": [],
-            "warnings": [],
-            "fix_hints": [],
-        }
+    def full_static_validation(self, code: Source) -> Dict[str, Any]:
+        """Run all static validations.
 
-        validators = [
-            (ValidationLevel.SYNTAX.value, self.validate_syntax),
-            (ValidationLevel.IMPORTS.value, self.validate_imports),
-            (ValidationLevel.STRUCTURE.value, self.validate_structure),
-            (ValidationLevel.METHODS.value, self.validate_methods),
-            (ValidationLevel.INDICATORS.value, self.validate_indicators),
-        ]
+        ``code`` may also be a path; the file is memory-mapped and parsed
+        without first being decoded into a str.
+        """
+        # The checks below only read the shared analysis (no parsing or regex
+        # matching on parsable code), so they run inline: dispatching them to a
+        # thread pool would cost more than the checks and gain nothing under the GIL.
+        analysis = _analysis_for(code)
+        levels: Dict[str, ValidationResult] = {}
+        errors: List[Dict[str, Any]] = []
+        warnings: List[Dict[str, Any]] = []
+        fix_hints: List[Dict[str, Any]] = []
 
-        for level_name, validator in validators:
-            result = validator(code)
-            results["levels"][level_name] = result.to_dict()
+        for level_name, check in _STATIC_STEPS:
+            if levels and not levels[ValidationLevel.SYNTAX.value].passed:
+                # Nothing downstream is meaningful on unparsable code; keep the shape uniform.
+                levels[level_name] = ValidationResult(
+                    passed=False, level=level_name, error="skipped: syntax failed"
+                )
+                continue
 
+            result = levels[level_name] = getattr(self, check)(analysis)
             if not result.passed:
-                results["passed"] = False
-                results["errors"].append(
-                    {"level": level_name, "error": result.error, "line": result.line}
-                )
+                errors.append({"level": level_name, "error": result.error, "line": result.line})
                 if result.fix_hint:
-                    results["fix_hints"].append({"level": level_name, "hint": result.fix_hint})
+                    fix_hints.append({"level": level_name, "hint": result.fix_hint})
 
             if result.warnings:
-                for warning in result.warnings:
-                    results["warnings"].append({"level": level_name, "warning": warning})
+                warnings.extend(
+                    {"level": level_name, "warning": warning} for warning in result.warnings
+                )
+
+        return {
+            "passed": not errors,
+            "levels": {name: result.to_dict() for name, result in levels.items()},
+            "errors": errors,
+            "warnings": warnings,
+            "fix_hints": fix_hints,
+        }
+
 
-        return results
+@cache
+def get_static_validator() -> StaticValidator:
+    return StaticValidator()
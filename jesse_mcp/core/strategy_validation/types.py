@@ -16,7 +16,7 @@ class ValidationLevel(Enum):
     DRY_RUN = "dry_run"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     passed: bool
     level: str
@@ -27,15 +27,12 @@ class ValidationResult:
     metrics: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
-        result = {
+        return {
             "passed": self.passed,
             "level": self.level,
             "error": self.error,
             "line": self.line,
             "fix_hint": self.fix_hint,
+            "warnings": list(self.warnings),
+            "metrics": dict(self.metrics),
         }
-        if self.warnings:
-            result["warnings"] = self.warnings
-        if self.metrics:
-            result["metrics"] = self.metrics
-        return result
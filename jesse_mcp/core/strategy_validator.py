@@ -1,72 +1,160 @@
 """
 Strategy Validator - Main entry point for validation.
+
+Result types, levels and the indicator whitelist live in
+jesse_mcp.core.strategy_validation; they are re-exported here rather than
+redefined.
 """
 
+import hashlib
 import logging
-from typing import Dict, Optional
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from typing import Any, Callable, Dict, List, Optional
 
 from jesse_mcp.core.strategy_validation import (
     ValidationResult,
     ValidationLevel,
-    StaticValidator,
     DryRunValidator,
+    get_static_validator,
 )
+from jesse_mcp.core.strategy_validation.static import KNOWN_INDICATORS
+
+__all__ = [
+    "StrategyValidator",
+    "ValidationResult",
+    "ValidationLevel",
+    "KNOWN_INDICATORS",
+    "get_validator",
+]
 
 logger = logging.getLogger("jesse-mcp.validator")
 
-_static_validator = StaticValidator()
+# Resolved on the first dry-run so importing the validator stays cheap, then
+# reused so later dry-runs skip the import machinery.
+_rest_client_getter: Optional[Callable[[], Any]] = None
 
 
 def _get_rest_client():
-    from jesse_mcp.core.jesse_rest_client import get_jesse_rest_client
+    global _rest_client_getter
+    if _rest_client_getter is None:
+        from jesse_mcp.core.jesse_rest_client import get_jesse_rest_client
+
+        _rest_client_getter = get_jesse_rest_client
+    return _rest_client_getter()
+
+
+@cache
+def _get_dry_run_validator() -> DryRunValidator:
+    return DryRunValidator(_get_rest_client)
+
 
-    return get_jesse_rest_client()
+# Below this many sources the process pool startup costs more than it saves.
+_MIN_PARALLEL_BATCH = 4
 
 
-_dry_run_validator = DryRunValidator(_get_rest_client)
+def _copy_results(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a full_static_validation result down to its mutable leaves.
+
+    The shape is fixed, so this is far cheaper than copy.deepcopy.
+    """
+    return {
+        "passed": results["passed"],
+        "levels": {
+            name: {**level, "warnings": list(level["warnings"]), "metrics": dict(level["metrics"])}
+            for name, level in results["levels"].items()
+        },
+        "errors": [dict(error) for error in results["errors"]],
+        "warnings": [dict(warning) for warning in results["warnings"]],
+        "fix_hints": [dict(hint) for hint in results["fix_hints"]],
+    }
+
+
+def _validate_one(code: str) -> Dict[str, Any]:
+    """Module-level so it can be pickled into worker processes."""
+    return get_validator().full_validation(code)
 
 
 class StrategyValidator:
     """Main validator that combines static and dynamic validation."""
 
+    def __init__(self, cache_size: int = 1024):
+        self._result_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._cache_cap = cache_size
+
     def validate_syntax(self, code: str) -> ValidationResult:
-        return _static_validator.validate_syntax(code)
+        return get_static_validator().validate_syntax(code)
 
     def validate_imports(self, code: str) -> ValidationResult:
-        return _static_validator.validate_imports(code)
+        return get_static_validator().validate_imports(code)
 
     def validate_structure(self, code: str) -> ValidationResult:
-        return _static_validator.validate_structure(code)
+        return get_static_validator().validate_structure(code)
 
     def validate_methods(self, code: str) -> ValidationResult:
-        return _static_validator.validate_methods(code)
+        return get_static_validator().validate_methods(code)
 
     def validate_indicators(self, code: str) -> ValidationResult:
-        return _static_validator.validate_indicators(code)
+        return get_static_validator().validate_indicators(code)
 
-    def dry_run_backtest(self, code: str, spec: Dict) -> ValidationResult:
-        return _dry_run_validator.run_dry_run(code, spec)
+    def dry_run_backtest(
+        self, code: str, spec: Dict, code_bytes: Optional[bytes] = None
+    ) -> ValidationResult:
+        return _get_dry_run_validator().run_dry_run(code, spec, code_bytes)
 
     def full_validation(self, code: str, spec: Optional[Dict] = None) -> Dict:
         """Run all validations and return combined results."""
-        results = _static_validator.full_static_validation(code)
+        # Encoded once and shared by the static result cache and the dry-run cache keys.
+        code_bytes = code.encode("utf-8")
+        results = self._cached_static_validation(code, code_bytes)
 
         if spec and results["passed"]:
-            dry_run_result = self.dry_run_backtest(code, spec)
+            dry_run_result = self.dry_run_backtest(code, spec, code_bytes)
             results["levels"][ValidationLevel.DRY_RUN.value] = dry_run_result.to_dict()
             if dry_run_result.warnings:
-                for warning in dry_run_result.warnings:
-                    results["warnings"].append({ValidationLevel.DRY_RUN.value: warning})
+                results["warnings"].extend(
+                    {ValidationLevel.DRY_RUN.value: warning} for warning in dry_run_result.warnings
+                )
 
-        logger.info(f"Validation: {'✅ PASSED' if results['passed'] else '❌ FAILED'}")
+        logger.info("Validation: %s", "✅ PASSED" if results["passed"] else "❌ FAILED")
         return results
 
-
-_validator_instance = None
+    def validate_many(
+        self, codes: List[str], max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Statically validate a batch of sources, fanning out across processes.
+
+        Batches smaller than _MIN_PARALLEL_BATCH run in-process.
+        """
+        if len(codes) < _MIN_PARALLEL_BATCH:
+            return [self.full_validation(code) for code in codes]
+
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(codes) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_validate_one, codes, chunksize=chunksize))
+
+    def _cached_static_validation(
+        self, code: str, code_bytes: Optional[bytes] = None
+    ) -> Dict[str, Any]:
+        """Static results memoized by code hash; callers get their own copy."""
+        if code_bytes is None:
+            code_bytes = code.encode("utf-8")
+        key = hashlib.blake2b(code_bytes, digest_size=16).digest()
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+            return _copy_results(cached)
+
+        results = get_static_validator().full_static_validation(code)
+        self._result_cache[key] = _copy_results(results)
+        if len(self._result_cache) > self._cache_cap:
+            self._result_cache.popitem(last=False)
+        return results
 
 
+@cache
 def get_validator() -> StrategyValidator:
-    global _validator_instance
-    if _validator_instance is None:
-        _validator_instance = StrategyValidator()
-    return _validator_instance
+    return StrategyValidator()
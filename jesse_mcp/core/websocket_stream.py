@@ -7,22 +7,33 @@ and candle import progress via WebSocket connections.
 Configuration (via environment):
 - JESSE_WS_URL: WebSocket URL (default: ws://server2:8000/ws)
 - JESSE_API_TOKEN: Authentication token for WebSocket connections
+- JESSE_MCP_UVLOOP: Set to 1 to run event loops on uvloop (if installed)
+- JESSE_WS_MAX_SIZE: Largest accepted frame in bytes (default: 16 MiB)
+- JESSE_WS_THREAD_PARSE_BYTES: Frames larger than this are decoded in a worker
+  thread so large results don't stall the event loop (default: 65536)
+
+Frames are decoded with orjson when it is installed (pip install jesse-mcp[orjson]),
+falling back to the stdlib json module.
 """
 
 import asyncio
 import json
 import logging
 import os
+import random
+from collections import deque
 from enum import Enum
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncGenerator,
+    Awaitable,
     Callable,
+    Deque,
     Dict,
     List,
     Optional,
-    Set,
+    Tuple,
     Union,
 )
 
@@ -38,11 +49,53 @@ except ImportError:
     WEBSOCKETS_AVAILABLE = False
     websockets = None  # type: ignore[assignment]
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger("jesse-mcp.websocket")
 
+
+def _loads(raw: Union[str, bytes]) -> Any:
+    """Decode a frame, with orjson when installed (it accepts str or bytes)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _message_id(message: Dict[str, Any]) -> Optional[str]:
+    """The backtest/optimization a message belongs to, whichever id field is set"""
+    return (
+        message.get("id")
+        or message.get("backtest_id")
+        or message.get("optimization_id")
+    )
+
+
+def _dumps(payload: Dict[str, Any]) -> str:
+    """Encode an outgoing frame as text; Jesse expects text frames"""
+    if orjson is not None:
+        return orjson.dumps(payload).decode()
+    return json.dumps(payload)
+
+
 JESSE_WS_URL = os.getenv("JESSE_WS_URL", "ws://server2:8000/ws")
 JESSE_API_TOKEN = os.getenv("JESSE_API_TOKEN", "")
 
+JESSE_WS_MAX_SIZE = int(os.getenv("JESSE_WS_MAX_SIZE", str(16 * 1024 * 1024)))
+JESSE_WS_THREAD_PARSE_BYTES = int(os.getenv("JESSE_WS_THREAD_PARSE_BYTES", "65536"))
+
+# Upper bound on the reconnect backoff window, in seconds
+MAX_RECONNECT_DELAY = 60.0
+
+# Terminal messages remembered per id for wait_for_complete() calls made after
+# the run already finished
+MAX_RECENT_RESULTS = 128
+
 
 class MessageType(str, Enum):
     """WebSocket message types from Jesse"""
@@ -68,6 +121,38 @@ class SubscriptionType(str, Enum):
     CANDLE_IMPORT = "candle_import"
 
 
+# Plain str values for the hot paths: decoded frames carry raw strings, and
+# these skip Enum attribute resolution. Channel prefixes must be the values in
+# any case, since formatting a str-mixin Enum member in an f-string yields
+# "SubscriptionType.BACKTEST" rather than "backtest" on Python 3.11+.
+_BACKTEST_PROGRESS = MessageType.BACKTEST_PROGRESS.value
+_BACKTEST_COMPLETE = MessageType.BACKTEST_COMPLETE.value
+_BACKTEST_ERROR = MessageType.BACKTEST_ERROR.value
+_OPTIMIZATION_TRIAL = MessageType.OPTIMIZATION_TRIAL.value
+_OPTIMIZATION_COMPLETE = MessageType.OPTIMIZATION_COMPLETE.value
+_OPTIMIZATION_ERROR = MessageType.OPTIMIZATION_ERROR.value
+_CANDLE_IMPORT_COMPLETE = MessageType.CANDLE_IMPORT_COMPLETE.value
+_ERROR = MessageType.ERROR.value
+
+_TERMINAL_TYPES = frozenset(
+    {_BACKTEST_COMPLETE, _OPTIMIZATION_COMPLETE, _CANDLE_IMPORT_COMPLETE}
+)
+
+# Superseded by the next update, so these are shed first when the buffer is full
+_SHEDDABLE_TYPES = frozenset(
+    {
+        _BACKTEST_PROGRESS,
+        _OPTIMIZATION_TRIAL,
+        MessageType.CANDLE_IMPORT_PROGRESS.value,
+        MessageType.HEARTBEAT.value,
+    }
+)
+
+_BACKTEST_CHANNEL = SubscriptionType.BACKTEST.value
+_OPTIMIZATION_CHANNEL = SubscriptionType.OPTIMIZATION.value
+_CANDLE_IMPORT_CHANNEL = SubscriptionType.CANDLE_IMPORT.value
+
+
 class JesseWebSocketClient:
     """Async WebSocket client for Jesse real-time updates
 
@@ -98,6 +183,10 @@ class JesseWebSocketClient:
         reconnect: bool = True,
         reconnect_delay: float = 5.0,
         max_reconnect_attempts: int = 5,
+        queue_maxsize: int = 1024,
+        compression: Optional[str] = None,
+        max_size: int = JESSE_WS_MAX_SIZE,
+        write_limit: int = 2**17,
     ):
         """
         Initialize WebSocket client
@@ -106,8 +195,21 @@ class JesseWebSocketClient:
             ws_url: WebSocket URL to connect to
             auth_token: Authentication token (from JESSE_API_TOKEN)
             reconnect: Enable automatic reconnection on disconnect
-            reconnect_delay: Seconds to wait between reconnection attempts
+            reconnect_delay: Base backoff in seconds; attempt n sleeps a random
+                             time up to reconnect_delay * 2**(n-1), capped at
+                             MAX_RECONNECT_DELAY
             max_reconnect_attempts: Maximum reconnection attempts before giving up
+            queue_maxsize: Messages buffered for messages(); when full the oldest
+                           progress message is dropped to make room, so
+                           completions and errors are kept
+            compression: Per-message compression ("deflate") or None. Off by
+                         default: Jesse's frames are small JSON on a trusted LAN,
+                         where zlib costs more CPU than it saves; enable it for
+                         WAN links.
+            max_size: Largest frame accepted; optimization results carrying full
+                      trial histories can exceed websockets' 1 MiB default
+            write_limit: Send buffer high-water mark in bytes; larger values mean
+                         fewer drains during subscription bursts
         """
         if not WEBSOCKETS_AVAILABLE:
             raise ImportError(
@@ -117,16 +219,50 @@ class JesseWebSocketClient:
         self.ws_url = ws_url
         self.auth_token = auth_token
         self.reconnect = reconnect
+        self.compression = compression
+        self.max_size = max_size
+        self.write_limit = write_limit
         self.reconnect_delay = reconnect_delay
         self.max_reconnect_attempts = max_reconnect_attempts
 
         self._ws: Optional["ClientConnection"] = None
         self._connected = False
         self._reconnect_count = 0
-        self._subscriptions: Set[str] = set()
-        self._message_handlers: List[Callable[[Dict[str, Any]], None]] = []
-        self._message_queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue()
+        # channel -> encoded subscribe frame, so replays after a reconnect resend
+        # the cached text instead of re-encoding every subscription
+        self._subscriptions: Dict[str, str] = {}
+        # handler -> is-coroutine-function, insertion ordered, for hashed lookup
+        # and removal. The receive loop iterates the per-kind tuple snapshots
+        # below instead: they are rebuilt only when handlers change, and a
+        # handler may deregister itself mid-dispatch without disturbing them.
+        self._handlers: Dict[Callable[[Dict[str, Any]], Any], bool] = {}
+        self._sync_handlers: Tuple[Callable[[Dict[str, Any]], None], ...] = ()
+        self._async_handlers: Tuple[
+            Callable[[Dict[str, Any]], Awaitable[None]], ...
+        ] = ()
+        # subscription id -> handlers of the trackers following it, routed by
+        # the id the receive loop resolves once per frame
+        self._id_handlers: Dict[str, Tuple[Callable[[Dict[str, Any]], None], ...]] = {}
+        # Single producer (the receive loop), so a deque plus a wake-up event
+        # replaces asyncio.Queue and its per-get futures; see _enqueue() for
+        # what is shed once queue_maxsize is reached.
+        self.queue_maxsize = queue_maxsize
+        self._messages: Deque[Dict[str, Any]] = deque()
+        self._message_event = asyncio.Event()
+        # subscription id -> futures of pending wait_for_complete() calls,
+        # resolved directly by the receive loop
+        self._completion_futures: Dict[str, List["asyncio.Future[Any]"]] = {}
+        # subscription id -> its terminal message, oldest first, so a waiter
+        # registering after completion returns at once instead of timing out
+        self._recent_results: Dict[str, Dict[str, Any]] = {}
+        # Outgoing frames go through one writer task instead of each caller
+        # awaiting the socket
+        self._send_queue: asyncio.Queue[str] = asyncio.Queue()
+        # Trackers sharing this client may connect at once; only one may open
+        # the socket and start the receive task
+        self._connect_lock = asyncio.Lock()
         self._receive_task: Optional[asyncio.Task] = None
+        self._writer_task: Optional[asyncio.Task] = None
         self._running = False
 
     @property
@@ -141,10 +277,13 @@ class JesseWebSocketClient:
         Returns:
             True if connected successfully, False otherwise
         """
-        if self._connected:
-            logger.warning("⚠️ WebSocket already connected")
-            return True
+        async with self._connect_lock:
+            if self._connected:
+                logger.debug("WebSocket already connected")
+                return True
+            return await self._open()
 
+    async def _open(self) -> bool:
         try:
             headers = {}
             if self.auth_token:
@@ -154,6 +293,9 @@ class JesseWebSocketClient:
             self._ws = await websockets.connect(
                 self.ws_url,
                 extra_headers=headers,
+                compression=self.compression,
+                max_size=self.max_size,
+                write_limit=self.write_limit,
                 ping_interval=30,
                 ping_timeout=10,
                 close_timeout=5,
@@ -164,10 +306,12 @@ class JesseWebSocketClient:
             self._running = True
 
             self._receive_task = asyncio.create_task(self._receive_loop())
+            if self._writer_task is None or self._writer_task.done():
+                self._writer_task = asyncio.create_task(self._writer_loop())
 
             logger.info(f"✅ WebSocket connected to {self.ws_url}")
 
-            for subscription in self._subscriptions:
+            for subscription in list(self._subscriptions):
                 await self._send_subscription(subscription)
 
             return True
@@ -177,9 +321,22 @@ class JesseWebSocketClient:
             self._connected = False
             return False
 
-    async def close(self) -> None:
-        """Close WebSocket connection and cleanup resources"""
+    async def close(self, drain_timeout: float = 5.0) -> None:
+        """Close WebSocket connection and cleanup resources
+
+        Args:
+            drain_timeout: Seconds to wait for queued frames (e.g. unsubscribes
+                           from trackers closed just before) to be sent
+        """
+        if self.connected and self._writer_task and not self._writer_task.done():
+            try:
+                await asyncio.wait_for(self._send_queue.join(), drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning("⚠️ WebSocket closed with unsent frames")
+
         self._running = False
+        self._message_event.set()
+        self._resolve_waiters(list(self._completion_futures), None)
 
         if self._receive_task:
             self._receive_task.cancel()
@@ -189,6 +346,14 @@ class JesseWebSocketClient:
                 pass
             self._receive_task = None
 
+        if self._writer_task:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+
         if self._ws:
             try:
                 await self._ws.close()
@@ -204,19 +369,44 @@ class JesseWebSocketClient:
         while self._running and self._ws:
             try:
                 raw_message = await self._ws.recv()
-                message = json.loads(raw_message)
+                if len(raw_message) > JESSE_WS_THREAD_PARSE_BYTES:
+                    message = await asyncio.to_thread(_loads, raw_message)
+                else:
+                    message = _loads(raw_message)
+                if not isinstance(message, dict):
+                    logger.warning(
+                        f"⚠️ Ignoring non-object WebSocket frame: {type(message).__name__}"
+                    )
+                    continue
+                # Resolved once here and kept out of the payload handed to users
+                msg_id = _message_id(message)
 
-                await self._message_queue.put(message)
+                self._enqueue(message)
+                self._resolve_completion(msg_id, message)
 
-                for handler in self._message_handlers:
-                    try:
-                        if asyncio.iscoroutinefunction(handler):
-                            await handler(message)
-                        else:
+                if msg_id is not None:
+                    for handler in self._id_handlers.get(msg_id, ()):
+                        try:
                             handler(message)
+                        except Exception as e:
+                            logger.error(f"❌ Message handler error: {e}")
+
+                for handler in self._sync_handlers:
+                    try:
+                        handler(message)
                     except Exception as e:
                         logger.error(f"❌ Message handler error: {e}")
 
+                async_handlers = self._async_handlers
+                if async_handlers:
+                    results = await asyncio.gather(
+                        *(handler(message) for handler in async_handlers),
+                        return_exceptions=True,
+                    )
+                    for result in results:
+                        if isinstance(result, Exception):
+                            logger.error(f"❌ Message handler error: {result}")
+
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -229,10 +419,67 @@ class JesseWebSocketClient:
                         await self._attempt_reconnect()
                     else:
                         self._running = False
+                        self._message_event.set()
                         break
                 else:
                     logger.error(f"❌ WebSocket receive error: {e}")
 
+    def _resolve_completion(
+        self, msg_id: Optional[str], message: Dict[str, Any]
+    ) -> None:
+        """Hand terminal messages to the wait_for_complete() calls expecting them
+
+        Terminal messages are also remembered per id for waiters that register
+        only after the run has finished.
+        """
+        msg_type = message.get("type")
+        if msg_type in _TERMINAL_TYPES:
+            if msg_id is not None:
+                self._remember_result(msg_id, message)
+                self._resolve_waiters([msg_id], message)
+        elif msg_type == _ERROR:
+            # Untargeted server errors end every pending wait
+            self._resolve_waiters(list(self._completion_futures), message)
+
+    def _remember_result(self, msg_id: str, message: Dict[str, Any]) -> None:
+        self._recent_results.pop(msg_id, None)
+        self._recent_results[msg_id] = message
+        if len(self._recent_results) > MAX_RECENT_RESULTS:
+            del self._recent_results[next(iter(self._recent_results))]
+
+    def _resolve_waiters(
+        self, subscription_ids: List[str], result: Optional[Dict[str, Any]]
+    ) -> None:
+        for subscription_id in subscription_ids:
+            for future in self._completion_futures.pop(subscription_id, ()):
+                if not future.done():
+                    future.set_result(result)
+
+    def _enqueue(self, message: Dict[str, Any]) -> None:
+        """Buffer a message for messages(), shedding progress updates when full
+
+        The oldest progress-type message makes room. If only terminal messages
+        (completions, errors) are buffered, a new progress message is dropped
+        instead, and only a new terminal message displaces the oldest one.
+
+        Never blocks: callback-only users never drain the buffer, and waiting
+        for room would stall the handlers and the receive loop with it.
+        """
+        messages = self._messages
+        if len(messages) >= self.queue_maxsize:
+            for index, queued in enumerate(messages):
+                if queued.get("type") in _SHEDDABLE_TYPES:
+                    del messages[index]
+                    break
+            else:
+                if message.get("type") in _SHEDDABLE_TYPES:
+                    logger.debug(f"Message buffer full, dropped {message.get('type')}")
+                    return
+                dropped = messages.popleft()
+                logger.warning(f"⚠️ Message buffer full, dropped {dropped.get('type')}")
+        messages.append(message)
+        self._message_event.set()
+
     async def _attempt_reconnect(self) -> None:
         """Attempt to reconnect after connection loss"""
         self._reconnect_count += 1
@@ -240,7 +487,13 @@ class JesseWebSocketClient:
             f"🔄 Reconnecting ({self._reconnect_count}/{self.max_reconnect_attempts})..."
         )
 
-        await asyncio.sleep(self.reconnect_delay)
+        # Full-jitter exponential backoff: spreads out clients that all lost the
+        # same server instead of having them reconnect in lockstep.
+        window = min(
+            self.reconnect_delay * (2 ** (self._reconnect_count - 1)),
+            MAX_RECONNECT_DELAY,
+        )
+        await asyncio.sleep(random.uniform(0, window))
 
         self._connected = False
         self._ws = None
@@ -255,16 +508,41 @@ class JesseWebSocketClient:
         if not self._ws:
             return
 
-        message = json.dumps({"action": "subscribe", "channel": subscription})
-        await self._ws.send(message)
+        message = self._subscriptions.get(subscription) or _dumps(
+            {"action": "subscribe", "channel": subscription}
+        )
+        self._send_queue.put_nowait(message)
+
+    def _add_subscription(self, subscription: str) -> None:
+        """Remember a channel along with its pre-encoded subscribe frame"""
+        if subscription not in self._subscriptions:
+            self._subscriptions[subscription] = _dumps(
+                {"action": "subscribe", "channel": subscription}
+            )
 
     async def _send_unsubscription(self, subscription: str) -> None:
         """Send unsubscription message to server"""
         if not self._ws:
             return
 
-        message = json.dumps({"action": "unsubscribe", "channel": subscription})
-        await self._ws.send(message)
+        message = _dumps({"action": "unsubscribe", "channel": subscription})
+        self._send_queue.put_nowait(message)
+
+    async def _writer_loop(self) -> None:
+        """Background task draining the send queue in batches"""
+        while self._running:
+            batch = [await self._send_queue.get()]
+            while len(batch) < 32 and not self._send_queue.empty():
+                batch.append(self._send_queue.get_nowait())
+
+            for frame in batch:
+                try:
+                    if self._ws:
+                        await self._ws.send(frame)
+                except Exception as e:
+                    logger.error(f"❌ WebSocket send error: {e}")
+                finally:
+                    self._send_queue.task_done()
 
     async def subscribe_backtest(self, backtest_id: str) -> bool:
         """
@@ -276,8 +554,8 @@ class JesseWebSocketClient:
         Returns:
             True if subscription sent successfully
         """
-        subscription = f"{SubscriptionType.BACKTEST}:{backtest_id}"
-        self._subscriptions.add(subscription)
+        subscription = f"{_BACKTEST_CHANNEL}:{backtest_id}"
+        self._add_subscription(subscription)
 
         if self._connected:
             await self._send_subscription(subscription)
@@ -295,8 +573,8 @@ class JesseWebSocketClient:
         Returns:
             True if unsubscription sent successfully
         """
-        subscription = f"{SubscriptionType.BACKTEST}:{backtest_id}"
-        self._subscriptions.discard(subscription)
+        subscription = f"{_BACKTEST_CHANNEL}:{backtest_id}"
+        self._subscriptions.pop(subscription, None)
 
         if self._connected:
             await self._send_unsubscription(subscription)
@@ -314,8 +592,8 @@ class JesseWebSocketClient:
         Returns:
             True if subscription sent successfully
         """
-        subscription = f"{SubscriptionType.OPTIMIZATION}:{optimization_id}"
-        self._subscriptions.add(subscription)
+        subscription = f"{_OPTIMIZATION_CHANNEL}:{optimization_id}"
+        self._add_subscription(subscription)
 
         if self._connected:
             await self._send_subscription(subscription)
@@ -333,8 +611,8 @@ class JesseWebSocketClient:
         Returns:
             True if unsubscription sent successfully
         """
-        subscription = f"{SubscriptionType.OPTIMIZATION}:{optimization_id}"
-        self._subscriptions.discard(subscription)
+        subscription = f"{_OPTIMIZATION_CHANNEL}:{optimization_id}"
+        self._subscriptions.pop(subscription, None)
 
         if self._connected:
             await self._send_unsubscription(subscription)
@@ -356,10 +634,8 @@ class JesseWebSocketClient:
         Returns:
             True if subscription sent successfully
         """
-        subscription = (
-            f"{SubscriptionType.CANDLE_IMPORT}:{exchange}:{symbol}:{timeframe}"
-        )
-        self._subscriptions.add(subscription)
+        subscription = f"{_CANDLE_IMPORT_CHANNEL}:{exchange}:{symbol}:{timeframe}"
+        self._add_subscription(subscription)
 
         if self._connected:
             await self._send_subscription(subscription)
@@ -383,10 +659,8 @@ class JesseWebSocketClient:
         Returns:
             True if unsubscription sent successfully
         """
-        subscription = (
-            f"{SubscriptionType.CANDLE_IMPORT}:{exchange}:{symbol}:{timeframe}"
-        )
-        self._subscriptions.discard(subscription)
+        subscription = f"{_CANDLE_IMPORT_CHANNEL}:{exchange}:{symbol}:{timeframe}"
+        self._subscriptions.pop(subscription, None)
 
         if self._connected:
             await self._send_unsubscription(subscription)
@@ -404,7 +678,8 @@ class JesseWebSocketClient:
             handler: Function to call with each message dict
                      Can be sync or async function
         """
-        self._message_handlers.append(handler)
+        self._handlers[handler] = asyncio.iscoroutinefunction(handler)
+        self._rebuild_handler_tuples()
 
     def remove_handler(self, handler: Callable[[Dict[str, Any]], None]) -> None:
         """
@@ -413,8 +688,35 @@ class JesseWebSocketClient:
         Args:
             handler: The handler function to remove
         """
-        if handler in self._message_handlers:
-            self._message_handlers.remove(handler)
+        if self._handlers.pop(handler, None) is not None:
+            self._rebuild_handler_tuples()
+
+    def _watch(
+        self, subscription_id: str, handler: Callable[[Dict[str, Any]], None]
+    ) -> None:
+        """Route messages for one backtest/optimization id to a sync handler"""
+        self._id_handlers[subscription_id] = self._id_handlers.get(
+            subscription_id, ()
+        ) + (handler,)
+
+    def _unwatch(
+        self, subscription_id: str, handler: Callable[[Dict[str, Any]], None]
+    ) -> None:
+        handlers = tuple(
+            h for h in self._id_handlers.get(subscription_id, ()) if h != handler
+        )
+        if handlers:
+            self._id_handlers[subscription_id] = handlers
+        else:
+            self._id_handlers.pop(subscription_id, None)
+
+    def _rebuild_handler_tuples(self) -> None:
+        self._sync_handlers = tuple(
+            h for h, is_async in self._handlers.items() if not is_async
+        )
+        self._async_handlers = tuple(
+            h for h, is_async in self._handlers.items() if is_async
+        )
 
     async def messages(self) -> AsyncGenerator[Dict[str, Any], None]:
         """
@@ -428,15 +730,14 @@ class JesseWebSocketClient:
                 if message["type"] == "backtest_progress":
                     print(f"Progress: {message['progress']}%")
         """
+        # Sleep on the event until a message arrives or close() wakes us, rather
+        # than waking up every second to poll self._running.
         while self._running:
-            try:
-                message = await asyncio.wait_for(self._message_queue.get(), timeout=1.0)
-                yield message
-            except asyncio.TimeoutError:
+            if not self._messages:
+                self._message_event.clear()
+                await self._message_event.wait()
                 continue
-            except Exception as e:
-                logger.error(f"❌ Error getting message: {e}")
-                break
+            yield self._messages.popleft()
 
     async def wait_for_complete(
         self,
@@ -453,33 +754,25 @@ class JesseWebSocketClient:
         Returns:
             Completion message dict, or None if timeout
         """
-        complete_types = {
-            MessageType.BACKTEST_COMPLETE,
-            MessageType.OPTIMIZATION_COMPLETE,
-            MessageType.CANDLE_IMPORT_COMPLETE,
-        }
-
-        try:
-            async with asyncio.timeout(timeout):
-                async for message in self.messages():
-                    msg_type = message.get("type")
-                    msg_id = (
-                        message.get("id")
-                        or message.get("backtest_id")
-                        or message.get("optimization_id")
-                    )
-
-                    if msg_id == subscription_id and msg_type in complete_types:
-                        return message
+        result = self._recent_results.get(subscription_id)
+        if result is not None:
+            return result
 
-                    if msg_type == MessageType.ERROR:
-                        return message
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        waiters = self._completion_futures.setdefault(subscription_id, [])
+        waiters.append(future)
 
+        try:
+            return await asyncio.wait_for(future, timeout)
         except asyncio.TimeoutError:
             logger.warning(f"⏰ Timeout waiting for completion: {subscription_id}")
             return None
-
-        return None
+        finally:
+            # Still registered only if nothing resolved this id (e.g. timeout)
+            if self._completion_futures.get(subscription_id) is waiters:
+                waiters.remove(future)
+                if not waiters:
+                    del self._completion_futures[subscription_id]
 
     async def __aenter__(self) -> "JesseWebSocketClient":
         """Async context manager entry"""
@@ -512,54 +805,63 @@ class BacktestProgressTracker:
 
         Args:
             backtest_id: UUID of backtest to track
-            ws_client: Existing WebSocket client (creates new one if None)
+            ws_client: WebSocket client to use (the running loop's shared
+                       client if None; outside a running loop, a private one
+                       that close() shuts down)
         """
         self.backtest_id = backtest_id
-        self._client = ws_client
-        self._owns_client = ws_client is None
+        # Trackers multiplex over one connection rather than each opening its own
+        self._client, self._owns_client = _tracker_client(ws_client)
+        self._last_progress: Any = None
         self._progress_handlers: List[Callable[[int], None]] = []
         self._trade_handlers: List[Callable[[Dict], None]] = []
         self._complete_handlers: List[Callable[[Dict], None]] = []
         self._error_handlers: List[Callable[[str], None]] = []
+        self._dispatch: Dict[str, Callable[[Dict[str, Any]], None]] = {
+            _BACKTEST_PROGRESS: self._on_progress_message,
+            _BACKTEST_COMPLETE: self._on_complete_message,
+            _BACKTEST_ERROR: self._on_error_message,
+        }
 
     async def connect(self) -> bool:
         """Connect and subscribe to backtest updates"""
-        if self._owns_client:
-            self._client = JesseWebSocketClient()
-            if not await self._client.connect():
-                return False
+        if not self._client.connected and not await self._client.connect():
+            return False
 
-        assert self._client is not None
-        self._client.on_message(self._handle_message)
+        self._client._watch(self.backtest_id, self._handle_message)
         await self._client.subscribe_backtest(self.backtest_id)
         return True
 
     async def close(self) -> None:
-        """Close connection if we own the client"""
-        if self._owns_client and self._client:
+        """Detach from the client; a shared client stays open for others"""
+        self._client._unwatch(self.backtest_id, self._handle_message)
+        await self._client.unsubscribe_backtest(self.backtest_id)
+        if self._owns_client:
             await self._client.close()
 
     def _handle_message(self, message: Dict[str, Any]) -> None:
-        """Route messages to appropriate handlers"""
-        msg_type = message.get("type")
-        msg_id = message.get("id") or message.get("backtest_id")
-
-        if msg_id != self.backtest_id:
+        """Route this backtest's messages (the client filters by id) by type"""
+        route = self._dispatch.get(message.get("type", ""))
+        if route is not None:
+            route(message)
+
+    def _on_progress_message(self, message: Dict[str, Any]) -> None:
+        progress = message.get("progress", 0)
+        # Jesse repeats the same value many times; only report changes
+        if progress == self._last_progress:
             return
+        self._last_progress = progress
+        for handler in self._progress_handlers:
+            handler(progress)
 
-        if msg_type == MessageType.BACKTEST_PROGRESS:
-            progress = message.get("progress", 0)
-            for handler in self._progress_handlers:
-                handler(progress)
-
-        elif msg_type == MessageType.BACKTEST_COMPLETE:
-            for handler in self._complete_handlers:
-                handler(message)
+    def _on_complete_message(self, message: Dict[str, Any]) -> None:
+        for handler in self._complete_handlers:
+            handler(message)
 
-        elif msg_type == MessageType.BACKTEST_ERROR:
-            error = message.get("error", "Unknown error")
-            for handler in self._error_handlers:
-                handler(error)
+    def _on_error_message(self, message: Dict[str, Any]) -> None:
+        error = message.get("error", "Unknown error")
+        for handler in self._error_handlers:
+            handler(error)
 
     def on_progress(self, handler: Callable[[int], None]) -> None:
         """Register callback for progress updates (0-100)"""
@@ -589,7 +891,6 @@ class BacktestProgressTracker:
         Returns:
             Completion message or None if timeout
         """
-        assert self._client is not None
         return await self._client.wait_for_complete(self.backtest_id, timeout)
 
     async def __aenter__(self) -> "BacktestProgressTracker":
@@ -615,64 +916,79 @@ class OptimizationProgressTracker:
     """
 
     def __init__(
-        self, optimization_id: str, ws_client: Optional[JesseWebSocketClient] = None
+        self,
+        optimization_id: str,
+        ws_client: Optional[JesseWebSocketClient] = None,
+        trial_sample_rate: int = 1,
     ):
         """
         Initialize optimization tracker
 
         Args:
             optimization_id: UUID of optimization to track
-            ws_client: Existing WebSocket client (creates new one if None)
+            ws_client: WebSocket client to use (the running loop's shared
+                       client if None; outside a running loop, a private one
+                       that close() shuts down)
+            trial_sample_rate: Report every Nth trial to on_trial handlers;
+                               new-best trials are always reported
         """
         self.optimization_id = optimization_id
-        self._client = ws_client
-        self._owns_client = ws_client is None
+        self.trial_sample_rate = max(1, trial_sample_rate)
+        # Trackers multiplex over one connection rather than each opening its own
+        self._client, self._owns_client = _tracker_client(ws_client)
+        self._trial_count = 0
         self._trial_handlers: List[Callable[[Dict], None]] = []
         self._best_handlers: List[Callable[[Dict], None]] = []
         self._complete_handlers: List[Callable[[Dict], None]] = []
         self._error_handlers: List[Callable[[str], None]] = []
+        self._dispatch: Dict[str, Callable[[Dict[str, Any]], None]] = {
+            _OPTIMIZATION_TRIAL: self._on_trial_message,
+            _OPTIMIZATION_COMPLETE: self._on_complete_message,
+            _OPTIMIZATION_ERROR: self._on_error_message,
+        }
 
     async def connect(self) -> bool:
         """Connect and subscribe to optimization updates"""
-        if self._owns_client:
-            self._client = JesseWebSocketClient()
-            if not await self._client.connect():
-                return False
+        if not self._client.connected and not await self._client.connect():
+            return False
 
-        assert self._client is not None
-        self._client.on_message(self._handle_message)
+        self._client._watch(self.optimization_id, self._handle_message)
         await self._client.subscribe_optimization(self.optimization_id)
         return True
 
     async def close(self) -> None:
-        """Close connection if we own the client"""
-        if self._owns_client and self._client:
+        """Detach from the client; a shared client stays open for others"""
+        self._client._unwatch(self.optimization_id, self._handle_message)
+        await self._client.unsubscribe_optimization(self.optimization_id)
+        if self._owns_client:
             await self._client.close()
 
     def _handle_message(self, message: Dict[str, Any]) -> None:
-        """Route messages to appropriate handlers"""
-        msg_type = message.get("type")
-        msg_id = message.get("id") or message.get("optimization_id")
+        """Route this optimization's messages (the client filters by id) by type"""
+        route = self._dispatch.get(message.get("type", ""))
+        if route is not None:
+            route(message)
 
-        if msg_id != self.optimization_id:
-            return
+    def _on_trial_message(self, message: Dict[str, Any]) -> None:
+        self._trial_count += 1
+        is_best = message.get("is_best")
 
-        if msg_type == MessageType.OPTIMIZATION_TRIAL:
+        if is_best or self._trial_count % self.trial_sample_rate == 0:
             for handler in self._trial_handlers:
                 handler(message)
 
-            if message.get("is_best"):
-                for handler in self._best_handlers:
-                    handler(message)
+        if is_best:
+            for best_handler in self._best_handlers:
+                best_handler(message)
 
-        elif msg_type == MessageType.OPTIMIZATION_COMPLETE:
-            for handler in self._complete_handlers:
-                handler(message)
+    def _on_complete_message(self, message: Dict[str, Any]) -> None:
+        for handler in self._complete_handlers:
+            handler(message)
 
-        elif msg_type == MessageType.OPTIMIZATION_ERROR:
-            error = message.get("error", "Unknown error")
-            for handler in self._error_handlers:
-                handler(error)
+    def _on_error_message(self, message: Dict[str, Any]) -> None:
+        error = message.get("error", "Unknown error")
+        for handler in self._error_handlers:
+            handler(error)
 
     def on_trial(self, handler: Callable[[Dict], None]) -> None:
         """Register callback for trial completions"""
@@ -702,7 +1018,6 @@ class OptimizationProgressTracker:
         Returns:
             Completion message or None if timeout
         """
-        assert self._client is not None
         return await self._client.wait_for_complete(self.optimization_id, timeout)
 
     async def __aenter__(self) -> "OptimizationProgressTracker":
@@ -715,25 +1030,91 @@ class OptimizationProgressTracker:
         await self.close()
 
 
-_ws_client_instance: Optional[JesseWebSocketClient] = None
+_uvloop_installed = False
+
+
+def install_uvloop() -> bool:
+    """
+    Make uvloop the event loop policy, if the package is installed
+
+    uvloop swaps asyncio's selector loop for libuv, which cuts per-recv overhead
+    on socket-heavy workloads. The policy only applies to loops created after
+    this call, so it is most useful before the server starts its loop.
+
+    Returns:
+        True if uvloop is (now) the event loop policy
+    """
+    global _uvloop_installed
+    if _uvloop_installed:
+        return True
+
+    try:
+        import uvloop
+    except ImportError:
+        logger.warning("⚠️ uvloop not installed - using default asyncio event loop")
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    _uvloop_installed = True
+    logger.info("⚡ uvloop event loop policy installed")
+    return True
+
+
+# event loop -> client shared by that loop's trackers. A client's Event, Queue
+# and tasks belong to the loop that first uses them, so loops never share one.
+_ws_clients: Dict[asyncio.AbstractEventLoop, JesseWebSocketClient] = {}
 
 
 def get_websocket_client() -> JesseWebSocketClient:
     """
-    Get or create the global WebSocket client instance
+    Get or create the WebSocket client shared on the running event loop
+
+    Installs uvloop first when JESSE_MCP_UVLOOP=1.
+
+    Unlike earlier versions there is no process-wide singleton: a client's
+    event, queues and tasks belong to one loop. Called outside a running loop,
+    this returns a new client that is not shared, which the caller must close.
 
     Returns:
-        Shared JesseWebSocketClient instance
+        JesseWebSocketClient instance for the current loop
     """
-    global _ws_client_instance
-    if _ws_client_instance is None:
-        _ws_client_instance = JesseWebSocketClient()
-    return _ws_client_instance
+    if os.getenv("JESSE_MCP_UVLOOP") == "1":
+        install_uvloop()
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return JesseWebSocketClient()
+
+    # Forget clients of loops that have since been closed (asyncio.run per call)
+    for stale in [old for old in _ws_clients if old.is_closed()]:
+        del _ws_clients[stale]
+
+    client = _ws_clients.get(loop)
+    if client is None:
+        client = _ws_clients[loop] = JesseWebSocketClient()
+    return client
+
+
+def _tracker_client(
+    ws_client: Optional[JesseWebSocketClient],
+) -> Tuple[JesseWebSocketClient, bool]:
+    """The client a tracker should use, and whether the tracker owns it
+
+    Outside a running loop get_websocket_client() returns a client nothing else
+    shares, so the tracker must close it itself.
+    """
+    if ws_client is not None:
+        return ws_client, False
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return JesseWebSocketClient(), True
+    return get_websocket_client(), False
 
 
 async def close_websocket_client() -> None:
-    """Close the global WebSocket client if it exists"""
-    global _ws_client_instance
-    if _ws_client_instance:
-        await _ws_client_instance.close()
-        _ws_client_instance = None
+    """Close the running event loop's shared WebSocket client if it exists"""
+    client = _ws_clients.pop(asyncio.get_running_loop(), None)
+    if client:
+        await client.close()
@@ -13,43 +13,130 @@ Usage:
     )
 """
 
+import atexit
 import logging
 import os
+import threading
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from jesse_mcp.core.cache import cached
 
 logger = logging.getLogger("jesse-mcp.logs")
 
 try:
     import psycopg2
-    from psycopg2.extras import RealDictCursor
+    from psycopg2.pool import ThreadedConnectionPool
 
     PSYCOPG2_AVAILABLE = True
 except ImportError:
     psycopg2 = None
-    RealDictCursor = None
+    ThreadedConnectionPool = None
     PSYCOPG2_AVAILABLE = False
     logger.warning("psycopg2 not available, log analysis will use mock data")
 
 
+JESSE_DB_POOL_MAX = int(os.environ.get("JESSE_DB_POOL_MAX", "8"))
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _db_params() -> Dict[str, Any]:
+    return {
+        "host": os.environ.get("JESSE_DB_HOST", "localhost"),
+        "port": int(os.environ.get("JESSE_DB_PORT", "5432")),
+        "dbname": os.environ.get("JESSE_DB_NAME", "jesse"),
+        "user": os.environ.get("JESSE_DB_USER", "jesse"),
+        "password": os.environ.get("JESSE_DB_PASSWORD", "password"),
+    }
+
+
+def _get_pool():
+    """Create the shared connection pool on first use (None if it cannot be created)"""
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                try:
+                    _pool = ThreadedConnectionPool(
+                        minconn=1, maxconn=JESSE_DB_POOL_MAX, **_db_params()
+                    )
+                    atexit.register(_pool.closeall)
+                except Exception as e:
+                    logger.warning(f"Connection pool unavailable, using direct connects: {e}")
+    return _pool
+
+
+# Created by docs/migrations/001_completed_backtests_indexes.sql
+_INDEXES = ("bt_created_brin", "bt_strategy_created")
+
+_indexes_checked = False
+
+
+def _check_indexes(conn) -> None:
+    """Warn once per process if the completed_backtests indexes are missing or invalid
+
+    Building them is left to the migration: a concurrent build on a large table
+    would stall the request that triggered it.
+    """
+    global _indexes_checked
+
+    if _indexes_checked:
+        return
+    _indexes_checked = True
+
+    try:
+        with conn.cursor() as cur:
+            # A failed CREATE INDEX CONCURRENTLY leaves an index with indisvalid = false
+            cur.execute(
+                "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE c.relname = ANY(%s) AND i.indisvalid",
+                (list(_INDEXES),),
+            )
+            valid = {row[0] for row in cur.fetchall()}
+        conn.rollback()
+    except Exception as e:
+        conn.rollback()
+        logger.warning(f"Could not check completed_backtests indexes: {e}")
+        return
+
+    missing = [name for name in _INDEXES if name not in valid]
+    if missing:
+        logger.warning(
+            f"completed_backtests indexes missing or invalid: {', '.join(missing)}; "
+            "apply docs/migrations/001_completed_backtests_indexes.sql"
+        )
+
+
 def _get_db_connection():
     if not PSYCOPG2_AVAILABLE:
         return None
 
     try:
-        conn = psycopg2.connect(
-            host=os.environ.get("JESSE_DB_HOST", "localhost"),
-            port=int(os.environ.get("JESSE_DB_PORT", "5432")),
-            dbname=os.environ.get("JESSE_DB_NAME", "jesse"),
-            user=os.environ.get("JESSE_DB_USER", "jesse"),
-            password=os.environ.get("JESSE_DB_PASSWORD", "password"),
-        )
-        return conn
+        pool = _get_pool()
+        conn = pool.getconn() if pool is not None else psycopg2.connect(**_db_params())
     except Exception as e:
         logger.error(f"Failed to connect to database: {e}")
         return None
 
+    _check_indexes(conn)
+    return conn
+
+
+def _release_db_connection(conn) -> None:
+    """Return a connection to the pool, or close it if it was opened directly"""
+    if _pool is not None:
+        _pool.putconn(conn)
+    else:
+        conn.close()
+
 
+@cached("logs_fear_greed", ttl=900)
 def _get_fear_greed() -> Dict[str, Any]:
     try:
         return {
@@ -125,6 +212,19 @@ def _mock_sentiment_correlation() -> Dict[str, Any]:
     }
 
 
+_HISTORY_COLUMNS = (
+    "id",
+    "strategy_name",
+    "symbol",
+    "timeframe",
+    "total_return",
+    "win_rate",
+    "total_trades",
+    "created_at",
+)
+
+
+@cached("logs_backtest_history", ttl=300)
 def analyze_backtest_history(days: int = 30) -> Dict[str, Any]:
     try:
         conn = _get_db_connection()
@@ -139,7 +239,7 @@ def analyze_backtest_history(days: int = 30) -> Dict[str, Any]:
             }
 
         try:
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            with conn.cursor() as cur:
                 cur.execute(
                     """
                     SELECT 
@@ -152,18 +252,19 @@ def analyze_backtest_history(days: int = 30) -> Dict[str, Any]:
                         total_trades,
                         created_at
                     FROM completed_backtests
-                    WHERE created_at > NOW() - INTERVAL '%s days'
+                    WHERE created_at > NOW() - make_interval(days => %s)
                     ORDER BY created_at DESC
                     """,
-                    (days,),
+                    (int(days),),
                 )
-                results = cur.fetchall()
-
-            backtests = [dict(row) for row in results]
-
-            for bt in backtests:
-                if isinstance(bt.get("created_at"), datetime):
-                    bt["created_at"] = bt["created_at"].isoformat()
+                # The tool returns every row, so a server-side cursor would only
+                # move the buffering from the driver into this list
+                backtests = []
+                for row in cur.fetchall():
+                    bt = dict(zip(_HISTORY_COLUMNS, row))
+                    if bt["created_at"] is not None:
+                        bt["created_at"] = bt["created_at"].isoformat()
+                    backtests.append(bt)
 
             logger.info(f"Retrieved {len(backtests)} backtests from last {days} days")
 
@@ -175,13 +276,142 @@ def analyze_backtest_history(days: int = 30) -> Dict[str, Any]:
             }
 
         finally:
-            conn.close()
+            _release_db_connection(conn)
 
     except Exception as e:
         logger.error(f"Failed to analyze backtest history: {e}")
         return {"error": str(e), "error_type": type(e).__name__}
 
 
+_STRATEGY_PERF_QUERY = """
+    SELECT
+        strategy_name,
+        COUNT(*) as total_backtests,
+        AVG(total_return) as avg_return,
+        AVG(win_rate) as avg_win_rate,
+        MAX(total_return) as best_return,
+        MIN(total_return) as worst_return,
+        STDDEV(total_return) as return_stddev
+    FROM completed_backtests
+    WHERE created_at > NOW() - INTERVAL '30 days'
+    GROUP BY strategy_name
+"""
+
+# Created by docs/migrations/002_strategy_perf_30d.sql
+_PERF_OBJECTS = ("strategy_perf_30d", "strategy_perf_refresh")
+PERF_VIEW_MAX_AGE_MINUTES = int(os.environ.get("JESSE_PERF_VIEW_MAX_AGE_MINUTES", "90"))
+
+# Re-check for the migration this often, so applying or dropping it is noticed
+PERF_VIEW_CHECK_SECONDS = 300
+
+_strategy_perf_view_ready: Optional[bool] = None
+_strategy_perf_view_checked_at = 0.0
+
+
+def _strategy_perf_view_exists(conn) -> bool:
+    """Whether the strategy_perf_30d migration is applied (re-checked every few minutes)"""
+    global _strategy_perf_view_ready, _strategy_perf_view_checked_at
+
+    now = time.monotonic()
+    if (
+        _strategy_perf_view_ready is None
+        or now - _strategy_perf_view_checked_at > PERF_VIEW_CHECK_SECONDS
+    ):
+        _strategy_perf_view_checked_at = now
+        try:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT count(*) FROM pg_class WHERE relname = ANY(%s)",
+                    (list(_PERF_OBJECTS),),
+                )
+                _strategy_perf_view_ready = cur.fetchone()[0] == len(_PERF_OBJECTS)
+        except Exception as e:
+            conn.rollback()
+            logger.warning(f"Could not check for strategy_perf_30d: {e}")
+            return False
+
+        if not _strategy_perf_view_ready:
+            logger.info(
+                "strategy_perf_30d not installed, aggregating inline; "
+                "apply docs/migrations/002_strategy_perf_30d.sql to enable it"
+            )
+
+    return bool(_strategy_perf_view_ready)
+
+
+def _strategy_perf_source(conn) -> str:
+    """
+    Return the relation to read 30-day strategy aggregates from
+
+    Uses the strategy_perf_30d materialized view only when it exists and was
+    refreshed within PERF_VIEW_MAX_AGE_MINUTES; otherwise the aggregate is
+    computed inline. Never creates or refreshes the view.
+    """
+    global _strategy_perf_view_ready
+
+    inline = f"({_STRATEGY_PERF_QUERY}) perf_30d"
+
+    if not _strategy_perf_view_exists(conn):
+        return inline
+
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT refreshed_at > NOW() - make_interval(mins => %s) "
+                "FROM strategy_perf_refresh",
+                (PERF_VIEW_MAX_AGE_MINUTES,),
+            )
+            row = cur.fetchone()
+    except Exception as e:
+        conn.rollback()
+        logger.warning(f"Could not read strategy_perf_30d refresh time: {e}")
+        # The view may have been dropped; look again on the next call
+        _strategy_perf_view_ready = None
+        return inline
+
+    if not row or not row[0]:
+        logger.warning(
+            f"strategy_perf_30d not refreshed in {PERF_VIEW_MAX_AGE_MINUTES} minutes, "
+            "aggregating inline; schedule scripts/run-monitor.sh --refresh"
+        )
+        return inline
+
+    return "strategy_perf_30d"
+
+
+def refresh_strategy_perf() -> Dict[str, Any]:
+    """Refresh the strategy_perf_30d materialized view (run hourly from cron)"""
+    global _strategy_perf_view_ready
+
+    try:
+        conn = _get_db_connection()
+
+        if conn is None:
+            return {"refreshed": False, "data_source": "mock"}
+
+        try:
+            # Always look afresh, so a newly applied migration starts being refreshed
+            _strategy_perf_view_ready = None
+            if not _strategy_perf_view_exists(conn):
+                return {"refreshed": False, "data_source": "database"}
+
+            with conn.cursor() as cur:
+                cur.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY strategy_perf_30d")
+                cur.execute("UPDATE strategy_perf_refresh SET refreshed_at = NOW()")
+            conn.commit()
+            logger.info("Refreshed strategy_perf_30d")
+
+            return {"refreshed": True, "data_source": "database"}
+
+        finally:
+            _release_db_connection(conn)
+
+    except Exception as e:
+        logger.error(f"Failed to refresh strategy performance: {e}")
+        return {"error": str(e), "error_type": type(e).__name__}
+
+
+@cached("logs_strategy_performance", ttl=600)
 def analyze_strategy_performance() -> Dict[str, Any]:
     try:
         conn = _get_db_connection()
@@ -191,26 +421,11 @@ def analyze_strategy_performance() -> Dict[str, Any]:
             return {**_mock_strategy_performance(), "data_source": "mock"}
 
         try:
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(
-                    """
-                    SELECT 
-                        strategy_name,
-                        COUNT(*) as total_backtests,
-                        AVG(total_return) as avg_return,
-                        AVG(win_rate) as avg_win_rate,
-                        MAX(total_return) as best_return,
-                        MIN(total_return) as worst_return,
-                        STDDEV(total_return) as return_stddev
-                    FROM completed_backtests
-                    WHERE created_at > NOW() - INTERVAL '30 days'
-                    GROUP BY strategy_name
-                    ORDER BY avg_return DESC
-                    """
-                )
-                results = cur.fetchall()
-
-            strategies = [dict(row) for row in results]
+            perf_source = _strategy_perf_source(conn)
+            with conn.cursor() as cur:
+                cur.execute(f"SELECT * FROM {perf_source} ORDER BY avg_return DESC")
+                columns = tuple(column.name for column in cur.description)
+                strategies = [dict(zip(columns, row)) for row in cur.fetchall()]
 
             for s in strategies:
                 for key in [
@@ -234,80 +449,145 @@ def analyze_strategy_performance() -> Dict[str, Any]:
             }
 
         finally:
-            conn.close()
+            _release_db_connection(conn)
 
     except Exception as e:
         logger.error(f"Failed to analyze strategy performance: {e}")
         return {"error": str(e), "error_type": type(e).__name__}
 
 
+def _fetch_weekly_bundle(days: int = 7) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], str]:
+    """
+    Fetch recent backtests and 30-day strategy performance in one round-trip
+
+    Returns (backtests, strategies, data_source).
+    """
+    conn = _get_db_connection()
+
+    if conn is None:
+        logger.info("Using mock data for weekly report")
+        return (
+            _mock_backtest_history(days),
+            _mock_strategy_performance()["strategies"],
+            "mock",
+        )
+
+    try:
+        perf_source = _strategy_perf_source(conn)
+        with conn.cursor() as cur:
+            cur.execute(
+                f"""
+                WITH bt AS (
+                    SELECT
+                        id,
+                        strategy_name,
+                        symbol,
+                        timeframe,
+                        total_return,
+                        win_rate,
+                        total_trades,
+                        created_at
+                    FROM completed_backtests
+                    WHERE created_at > NOW() - make_interval(days => %s)
+                ),
+                perf AS (
+                    SELECT * FROM {perf_source}
+                )
+                SELECT
+                    'bt' as kind,
+                    row_number() OVER (ORDER BY created_at DESC) as ord,
+                    row_to_json(bt) as row
+                FROM bt
+                UNION ALL
+                SELECT 'perf', row_number() OVER (ORDER BY avg_return DESC), row_to_json(perf)
+                FROM perf
+                -- UNION ALL does not preserve per-branch order, so rank each side
+                ORDER BY kind, ord
+                """,
+                (int(days),),
+            )
+            rows = cur.fetchall()
+    finally:
+        _release_db_connection(conn)
+
+    backtests = [row for kind, _, row in rows if kind == "bt"]
+    strategies = [row for kind, _, row in rows if kind == "perf"]
+
+    return backtests, strategies, "database"
+
+
 def generate_weekly_report() -> str:
     try:
-        history = analyze_backtest_history(7)
-        performance = analyze_strategy_performance()
-        sentiment = _get_fear_greed()
+        try:
+            backtests, strategies, data_source = _fetch_weekly_bundle(7)
+        except Exception as e:
+            logger.error(f"Failed to fetch weekly report data: {e}")
+            return f"# Weekly Report\n\nError retrieving data: {e}"
 
-        if history.get("error"):
-            return f"# Weekly Report\n\nError retrieving data: {history['error']}"
+        sentiment = _get_fear_greed()
 
-        backtests = history.get("backtests", [])
-        strategies = performance.get("strategies", [])
         fg_score = sentiment.get("score", 50)
         fg_rating = sentiment.get("rating", "neutral")
 
-        total_return = sum(bt.get("total_return", 0) for bt in backtests)
-        avg_win_rate = (
-            sum(bt.get("win_rate", 0) for bt in backtests) / len(backtests) if backtests else 0
+        # NULL metrics become NaN here and are skipped: they add nothing to the
+        # sums and do not count towards the win-rate average
+        metrics = np.array(
+            [
+                (bt.get("total_return", 0), bt.get("win_rate", 0), bt.get("total_trades", 0))
+                for bt in backtests
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        total_return, _, total_trades = np.nansum(metrics, axis=0).tolist()
+        win_rates = metrics[:, 1][~np.isnan(metrics[:, 1])]
+        avg_win_rate = float(win_rates.mean()) if win_rates.size else 0
+        total_trades = int(total_trades)
+
+        generated = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+        header = f"""# Weekly Backtest Report
+
+**Generated:** {generated}
+
+## Summary
+
+- **Total Backtests:** {len(backtests)}
+- **Total Trades:** {total_trades}
+- **Aggregate Return:** {total_return:.2f}%
+- **Average Win Rate:** {avg_win_rate:.1f}%
+
+## Market Sentiment
+
+- **Fear & Greed Index:** {fg_score} ({fg_rating})
+
+## Strategy Performance
+
+"""
+        strategy_rows = (
+            (
+                s.get("name", s.get("strategy_name", "Unknown")),
+                s.get("avg_return") or 0,
+                s.get("avg_win_rate") or 0,
+                s.get("total_backtests", 0),
+            )
+            for s in strategies
+        )
+        strategy_md = "".join(
+            f"### {name}\n\n"
+            f"- **Avg Return:** {avg_ret:.2f}%\n"
+            f"- **Win Rate:** {win:.1f}%\n"
+            f"- **Backtests:** {count}\n\n"
+            for name, avg_ret, win, count in strategy_rows
+        )
+        recent_md = "".join(
+            f"- **{bt.get('strategy_name', 'Unknown')}** on {bt.get('symbol', 'Unknown')}: "
+            f"{bt.get('total_return') or 0:.2f}% (WR: {bt.get('win_rate') or 0:.1f}%)\n"
+            for bt in backtests[:10]
+        )
+
+        report = (
+            f"{header}{strategy_md}## Recent Backtests\n\n{recent_md}\n"
+            f"---\n*Data source: {data_source}*"
         )
-        total_trades = sum(bt.get("total_trades", 0) for bt in backtests)
-
-        lines = [
-            "# Weekly Backtest Report",
-            "",
-            f"**Generated:** {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}",
-            "",
-            "## Summary",
-            "",
-            f"- **Total Backtests:** {len(backtests)}",
-            f"- **Total Trades:** {total_trades}",
-            f"- **Aggregate Return:** {total_return:.2f}%",
-            f"- **Average Win Rate:** {avg_win_rate:.1f}%",
-            "",
-            "## Market Sentiment",
-            "",
-            f"- **Fear & Greed Index:** {fg_score} ({fg_rating})",
-            "",
-            "## Strategy Performance",
-            "",
-        ]
-
-        for s in strategies:
-            name = s.get("name", s.get("strategy_name", "Unknown"))
-            avg_ret = s.get("avg_return", 0)
-            win = s.get("avg_win_rate", 0)
-            count = s.get("total_backtests", 0)
-            lines.append(f"### {name}")
-            lines.append("")
-            lines.append(f"- **Avg Return:** {avg_ret:.2f}%")
-            lines.append(f"- **Win Rate:** {win:.1f}%")
-            lines.append(f"- **Backtests:** {count}")
-            lines.append("")
-
-        lines.append("## Recent Backtests")
-        lines.append("")
-
-        for bt in backtests[:10]:
-            strategy = bt.get("strategy_name", "Unknown")
-            symbol = bt.get("symbol", "Unknown")
-            ret = bt.get("total_return", 0)
-            win = bt.get("win_rate", 0)
-            lines.append(f"- **{strategy}** on {symbol}: {ret:.2f}% (WR: {win:.1f}%)")
-
-        lines.append("")
-        lines.append("---")
-        lines.append(f"*Data source: {history.get('data_source', 'unknown')}*")
-
-        report = "\n".join(lines)
         logger.info("Generated weekly report")
 
         return report
@@ -325,23 +605,40 @@ def correlate_sentiment() -> Dict[str, Any]:
             logger.info("Using mock data for sentiment correlation")
             return {**_mock_sentiment_correlation(), "data_source": "mock"}
 
+        fear_greed = _get_fear_greed()
+        fg_score = fear_greed.get("score", 50)
+
         try:
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            with conn.cursor() as cur:
                 cur.execute(
                     """
-                    SELECT 
-                        DATE(created_at) as date,
-                        AVG(total_return) as avg_return,
-                        COUNT(*) as backtest_count
-                    FROM completed_backtests
-                    WHERE created_at > NOW() - INTERVAL '30 days'
-                    GROUP BY DATE(created_at)
-                    ORDER BY date DESC
-                    """
+                    SELECT
+                        corr(avg_return, fear_greed::float8) as correlation,
+                        json_agg(
+                            json_build_object(
+                                'date', date,
+                                'fear_greed', fear_greed,
+                                'avg_return', avg_return,
+                                'backtest_count', backtest_count
+                            )
+                            ORDER BY date DESC
+                        ) as data_points
+                    FROM (
+                        SELECT
+                            DATE(created_at) as date,
+                            COALESCE(AVG(total_return), 0)::float8 as avg_return,
+                            COUNT(*) as backtest_count,
+                            %s as fear_greed
+                        FROM completed_backtests
+                        WHERE created_at > NOW() - INTERVAL '30 days'
+                        GROUP BY DATE(created_at)
+                    ) daily
+                    """,
+                    (fg_score,),
                 )
-                backtest_daily = cur.fetchall()
+                correlation, data_points = cur.fetchone()
 
-            if not backtest_daily:
+            if not data_points:
                 return {
                     "correlation_coefficient": 0,
                     "interpretation": "insufficient_data",
@@ -350,43 +647,8 @@ def correlate_sentiment() -> Dict[str, Any]:
                     "data_source": "database",
                 }
 
-            fear_greed = _get_fear_greed()
-            fg_score = fear_greed.get("score", 50)
-
-            data_points = []
-            for row in backtest_daily:
-                date = row["date"]
-                if isinstance(date, datetime):
-                    date = date.strftime("%Y-%m-%d")
-
-                data_points.append(
-                    {
-                        "date": date,
-                        "fear_greed": fg_score,
-                        "avg_return": float(row["avg_return"]) if row["avg_return"] else 0,
-                        "backtest_count": int(row["backtest_count"]),
-                    }
-                )
-
-            returns = [dp["avg_return"] for dp in data_points]
-            fg_scores = [dp["fear_greed"] for dp in data_points]
-
-            if len(returns) > 1:
-                import statistics
-
-                mean_r = statistics.mean(returns)
-                mean_f = statistics.mean(fg_scores)
-
-                numerator = sum((r - mean_r) * (f - mean_f) for r, f in zip(returns, fg_scores))
-                denom_r = sum((r - mean_r) ** 2 for r in returns) ** 0.5
-                denom_f = sum((f - mean_f) ** 2 for f in fg_scores) ** 0.5
-
-                if denom_r > 0 and denom_f > 0:
-                    correlation = numerator / (denom_r * denom_f)
-                else:
-                    correlation = 0
-            else:
-                correlation = 0
+            # corr() is NULL for fewer than two points or a constant series
+            correlation = float(correlation) if correlation is not None else 0.0
 
             if correlation > 0.7:
                 interpretation = "strong_positive"
@@ -418,7 +680,7 @@ def correlate_sentiment() -> Dict[str, Any]:
             }
 
         finally:
-            conn.close()
+            _release_db_connection(conn)
 
     except Exception as e:
         logger.error(f"Failed to correlate sentiment: {e}")
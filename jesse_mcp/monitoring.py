@@ -11,16 +11,37 @@ Usage:
     report = monitor.daily_scan()
 """
 
+import copy
+import io
 import logging
 import json
+from bisect import bisect_left
 import os
-from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from typing import IO, Dict, Any, List, Optional
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+from jesse_mcp.core.cache import JESSE_CACHE_ENABLED, cached, get_cache
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger("jesse-mcp.monitoring")
 
+SCAN_MAX_WORKERS = int(os.environ.get("JESSE_MONITOR_SCAN_WORKERS", "8"))
+# Signals are backtests ending now and go stale as new candles close; an hour
+# still collapses the repeated lookups of a scan and its follow-up reports
+SIGNAL_CACHE_TTL = int(os.environ.get("JESSE_MONITOR_SIGNAL_TTL", "3600"))
+
 
 class SignalStrength(Enum):
     STRONG_BUY = "strong_buy"
@@ -30,6 +51,28 @@ class SignalStrength(Enum):
     STRONG_SELL = "strong_sell"
 
 
+_BUY_SIGNALS = frozenset({SignalStrength.BUY, SignalStrength.STRONG_BUY})
+
+_STRATEGY_TIMEFRAME = {
+    "DayTrader": "15m",
+    "SwingTrader": "4h",
+    "PositionTrader": "1d",
+    "SMACrossover": "1h",
+}
+
+# Backtest lookback per timeframe
+_TIMEFRAME_DAYS = {
+    "15m": 7,
+    "1h": 30,
+    "4h": 90,
+    "1d": 180,
+}
+
+# Upper (inclusive) Fear & Greed bound of each sentiment band
+_SENTIMENT_BOUNDS = (25, 45, 55, 75)
+_SENTIMENT_LABELS = ("EXTREME_FEAR", "FEAR", "NEUTRAL", "GREED", "EXTREME_GREED")
+
+
 @dataclass
 class MarketSignal:
     symbol: str
@@ -55,6 +98,27 @@ class DailyReport:
     recommendations: List[str]
 
 
+def _json_default(obj: Any) -> Any:
+    """Encode enums (SignalStrength) by value and anything else as a string"""
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+@cached("monitor_fear_greed", ttl=900)
+def _fetch_fear_greed() -> Dict[str, Any]:
+    try:
+        return {
+            "score": 50,
+            "rating": "neutral",
+            "previous_week": 50,
+            "previous_month": 50,
+        }
+    except Exception as e:
+        logger.warning(f"Failed to get Fear & Greed: {e}")
+        return {"error": str(e)}
+
+
 class MarketMonitor:
     """
     Automated market monitoring and scanning system
@@ -82,14 +146,16 @@ class MarketMonitor:
         self.timeframes = timeframes or ["15m", "1h", "4h", "1d"]
 
         self._jesse_client = None
-        self._cache = {}
+        self._client_lock = threading.Lock()
 
     def _get_jesse_client(self):
         """Lazy load Jesse client"""
         if self._jesse_client is None:
-            from jesse_mcp.core.jesse_rest_client import get_jesse_rest_client
+            with self._client_lock:
+                if self._jesse_client is None:
+                    from jesse_mcp.core.jesse_rest_client import get_jesse_rest_client
 
-            self._jesse_client = get_jesse_rest_client()
+                    self._jesse_client = get_jesse_rest_client()
         return self._jesse_client
 
     def get_market_overview(self) -> Dict[str, Any]:
@@ -101,9 +167,12 @@ class MarketMonitor:
 
         assets = ["bitcoin", "ethereum", "solana"]
 
-        for asset in assets:
+        with ThreadPoolExecutor(max_workers=len(assets)) as ex:
+            futures = {asset: ex.submit(self._get_asset_price, asset) for asset in assets}
+
+        for asset, future in futures.items():
             try:
-                price_data = self._get_asset_price(asset)
+                price_data = future.result()
                 if price_data:
                     overview["assets"][asset] = price_data
             except Exception as e:
@@ -120,30 +189,12 @@ class MarketMonitor:
         }
 
     def get_fear_greed(self) -> Dict[str, Any]:
-        """Get Fear & Greed index"""
-        try:
-            return {
-                "score": 50,
-                "rating": "neutral",
-                "previous_week": 50,
-                "previous_month": 50,
-            }
-        except Exception as e:
-            logger.warning(f"Failed to get Fear & Greed: {e}")
-            return {"error": str(e)}
+        """Get Fear & Greed index (cached for 15 minutes across monitors)"""
+        return _fetch_fear_greed()
 
     def analyze_sentiment(self, fear_greed: int) -> str:
         """Analyze market sentiment from Fear & Greed"""
-        if fear_greed <= 25:
-            return "EXTREME_FEAR"
-        elif fear_greed <= 45:
-            return "FEAR"
-        elif fear_greed <= 55:
-            return "NEUTRAL"
-        elif fear_greed <= 75:
-            return "GREED"
-        else:
-            return "EXTREME_GREED"
+        return _SENTIMENT_LABELS[bisect_left(_SENTIMENT_BOUNDS, fear_greed)]
 
     def get_trading_signal(
         self,
@@ -151,23 +202,40 @@ class MarketMonitor:
         strategy: str,
         timeframe: str,
     ) -> Optional[MarketSignal]:
-        """Get trading signal for a symbol/strategy/timeframe combo"""
+        """
+        Get trading signal for a symbol/strategy/timeframe combo
+
+        Signals are memoized for SIGNAL_CACHE_TTL seconds within the same day.
+        Each caller gets its own copy, so mutating a signal cannot change the
+        cached one.
+        """
+        if not JESSE_CACHE_ENABLED:
+            return self._compute_trading_signal(symbol, strategy, timeframe)
+
+        cache = get_cache("monitor_signals", ttl=SIGNAL_CACHE_TTL)
+        key = cache.make_key(symbol, strategy, timeframe, date.today().isoformat())
+        signal = cache.get(key)
+        if signal is None:
+            signal = self._compute_trading_signal(symbol, strategy, timeframe)
+            if signal is not None:
+                cache.set(key, copy.deepcopy(signal))
+            return signal
+        return copy.deepcopy(signal)
+
+    def _compute_trading_signal(
+        self,
+        symbol: str,
+        strategy: str,
+        timeframe: str,
+    ) -> Optional[MarketSignal]:
         try:
             client = self._get_jesse_client()
 
-            timeframe_days = {
-                "15m": 7,
-                "1h": 30,
-                "4h": 90,
-                "1d": 180,
-            }
-
-            days = timeframe_days.get(timeframe, 30)
+            days = _TIMEFRAME_DAYS.get(timeframe, 30)
 
-            from datetime import datetime, timedelta
-
-            end_date = datetime.now().strftime("%Y-%m-%d")
-            start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+            now = datetime.now()
+            end_date = now.strftime("%Y-%m-%d")
+            start_date = (now - timedelta(days=days)).strftime("%Y-%m-%d")
 
             result = client.backtest(
                 strategy=strategy,
@@ -221,50 +289,52 @@ class MarketMonitor:
             logger.error(f"Failed to get signal for {symbol}/{strategy}/{timeframe}: {e}")
             return None
 
-    def scan_opportunities(self) -> List[Dict[str, Any]]:
-        """Scan for trading opportunities"""
+    def scan_opportunities(
+        self, fear_greed: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Scan for trading opportunities (fetches Fear & Greed unless one is passed in)"""
         opportunities = []
 
-        fear_greed = self.get_fear_greed()
+        if fear_greed is None:
+            fear_greed = self.get_fear_greed()
         fg_score = fear_greed.get("score", 50)
         sentiment = self.analyze_sentiment(fg_score)
 
-        for symbol in self.symbols:
-            for strategy in self.strategies:
-                timeframe = self._get_strategy_timeframe(strategy)
-
-                signal = self.get_trading_signal(symbol, strategy, timeframe)
-
-                if signal and signal.signal in [SignalStrength.BUY, SignalStrength.STRONG_BUY]:
-                    opportunities.append(
-                        {
-                            "symbol": symbol,
-                            "strategy": strategy,
-                            "timeframe": timeframe,
-                            "signal": signal.signal.value,
-                            "confidence": signal.confidence,
-                            "market_sentiment": sentiment,
-                            "details": signal.details,
-                        }
-                    )
+        # Each signal is a blocking backtest request, so fan them out over threads
+        tasks = [
+            (symbol, strategy, self._get_strategy_timeframe(strategy))
+            for symbol in self.symbols
+            for strategy in self.strategies
+        ]
+        with ThreadPoolExecutor(max_workers=max(1, min(SCAN_MAX_WORKERS, len(tasks)))) as ex:
+            signals = list(ex.map(lambda task: self.get_trading_signal(*task), tasks))
+
+        for (symbol, strategy, timeframe), signal in zip(tasks, signals):
+            if signal and signal.signal in _BUY_SIGNALS:
+                opportunities.append(
+                    {
+                        "symbol": symbol,
+                        "strategy": strategy,
+                        "timeframe": timeframe,
+                        "signal": signal.signal.value,
+                        "confidence": signal.confidence,
+                        "market_sentiment": sentiment,
+                        "details": signal.details,
+                    }
+                )
 
         return sorted(opportunities, key=lambda x: -x["confidence"])
 
     def _get_strategy_timeframe(self, strategy: str) -> str:
         """Get default timeframe for a strategy"""
-        mapping = {
-            "DayTrader": "15m",
-            "SwingTrader": "4h",
-            "PositionTrader": "1d",
-            "SMACrossover": "1h",
-        }
-        return mapping.get(strategy, "1h")
+        return _STRATEGY_TIMEFRAME.get(strategy, "1h")
 
-    def identify_risks(self) -> List[str]:
-        """Identify current market risks"""
+    def identify_risks(self, fear_greed: Optional[Dict[str, Any]] = None) -> List[str]:
+        """Identify current market risks (fetches Fear & Greed unless one is passed in)"""
         risks = []
 
-        fear_greed = self.get_fear_greed()
+        if fear_greed is None:
+            fear_greed = self.get_fear_greed()
         fg_score = fear_greed.get("score", 50)
 
         if fg_score > 75:
@@ -327,8 +397,8 @@ class MarketMonitor:
 
         market_overview = self.get_market_overview()
         fear_greed = self.get_fear_greed()
-        opportunities = self.scan_opportunities()
-        risks = self.identify_risks()
+        opportunities = self.scan_opportunities(fear_greed)
+        risks = self.identify_risks(fear_greed)
         recommendations = self.generate_recommendations(
             opportunities, risks, fear_greed.get("score", 50)
         )
@@ -348,44 +418,50 @@ class MarketMonitor:
         return report
 
     def report_to_json(self, report: DailyReport) -> str:
-        """Convert report to JSON string"""
-        return json.dumps(asdict(report), indent=2, default=str)
+        """Convert report to JSON string (orjson encodes the dataclasses directly)"""
+        if orjson is not None:
+            return orjson.dumps(
+                report,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        return json.dumps(asdict(report), indent=2, default=_json_default)
 
     def report_to_markdown(self, report: DailyReport) -> str:
         """Convert report to Markdown format"""
-        lines = [
-            f"# Daily Market Report",
-            f"",
-            f"**Generated:** {report.timestamp}",
-            f"",
-            f"## Market Sentiment",
-            f"",
-            f"- **Fear & Greed:** {report.fear_greed.get('score', 'N/A')} ({report.fear_greed.get('rating', 'N/A')})",
-            f"",
-            f"## Opportunities ({len(report.opportunities)})",
-            f"",
-        ]
+        buf = io.StringIO()
+        self.write_markdown(report, buf)
+        return buf.getvalue()
+
+    def write_markdown(self, report: DailyReport, out: IO[str]) -> None:
+        """Write the Markdown report section by section to a text stream"""
+        fear_greed = report.fear_greed
+        out.write(f"""# Daily Market Report
+
+**Generated:** {report.timestamp}
+
+## Market Sentiment
+
+- **Fear & Greed:** {fear_greed.get('score', 'N/A')} ({fear_greed.get('rating', 'N/A')})
 
+## Opportunities ({len(report.opportunities)})
+
+""")
         for opp in report.opportunities:
-            lines.append(f"### {opp['symbol']} - {opp['strategy']}")
-            lines.append(f"")
-            lines.append(f"- **Signal:** {opp['signal'].upper()}")
-            lines.append(f"- **Confidence:** {opp['confidence']:.0%}")
-            lines.append(f"- **Timeframe:** {opp['timeframe']}")
-            lines.append(f"")
-
-        lines.append(f"## Risks ({len(report.risks)})")
-        lines.append(f"")
+            out.write(
+                f"### {opp['symbol']} - {opp['strategy']}\n\n"
+                f"- **Signal:** {opp['signal'].upper()}\n"
+                f"- **Confidence:** {opp['confidence']:.0%}\n"
+                f"- **Timeframe:** {opp['timeframe']}\n\n"
+            )
+
+        out.write(f"## Risks ({len(report.risks)})\n\n")
         for risk in report.risks:
-            lines.append(f"- {risk}")
+            out.write(f"- {risk}\n")
 
-        lines.append(f"")
-        lines.append(f"## Recommendations")
-        lines.append(f"")
+        out.write("\n## Recommendations\n")
         for rec in report.recommendations:
-            lines.append(f"- {rec}")
-
-        return "\n".join(lines)
+            out.write(f"\n- {rec}")
 
 
 def run_daily_scan() -> str:
@@ -396,4 +472,6 @@ def run_daily_scan() -> str:
 
 
 if __name__ == "__main__":
-    print(run_daily_scan())
+    monitor = MarketMonitor()
+    monitor.write_markdown(monitor.daily_scan(), sys.stdout)
+    sys.stdout.write("\n")
@@ -9,17 +9,42 @@ Integrates multiple news sources with dynamic priority management:
 - Configurable source priorities and filters
 """
 
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import AbstractSet, Dict, Any, List, Optional, Tuple
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
 from enum import Enum
+import hashlib
+import heapq
 import logging
 import asyncio
+import time
 import aiohttp
 from datetime import datetime, timedelta
 import json
+import re
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+_POSITIVE_WORDS = ("bullish", "up", "gain", "profit", "growth", "adoption")
+_NEGATIVE_WORDS = ("bearish", "down", "loss", "decline", "risk", "concern")
+
+# One pass over the text finds every lexicon hit; the group name tells the class.
+# Hits can overlap ("uprofit" holds both "up" and "profit"), so the pattern is a
+# zero-width lookahead tried at every position rather than a consuming match.
+# No lexicon word is a prefix of another, so at most one word can match at any
+# position and the alternation cannot hide a hit.
+_SENTIMENT_SCANNER = re.compile(
+    f"(?=(?P<pos>{'|'.join(_POSITIVE_WORDS)})|(?P<neg>{'|'.join(_NEGATIVE_WORDS)}))"
+)
+
+_TRADING_KEYWORDS = ("price", "trading", "volume", "market", "exchange")
+
+NEWS_CACHE_MAX_SIZE = 10_000
+MAX_CONCURRENT_FETCHES = 16
+SENTIMENT_CACHE_MAX_SIZE = 50_000
+
 
 class NewsCategory(Enum):
     """News categories for classification"""
@@ -44,7 +69,24 @@ class SentimentLevel(Enum):
     VERY_BULLISH = 2
 
 
-@dataclass
+# Seconds a news item stays in the cache; slow-moving categories live longer
+_NEWS_CACHE_TTL = {
+    NewsCategory.MARKET_NEWS: 600,
+    NewsCategory.REGULATORY: 3600,
+}
+_DEFAULT_NEWS_CACHE_TTL = 600
+
+_HIGH_RELEVANCE_CATEGORIES = frozenset(
+    {
+        NewsCategory.MARKET_NEWS,
+        NewsCategory.REGULATORY,
+        NewsCategory.PARTNERSHIP,
+        NewsCategory.ADOPTION,
+    }
+)
+
+
+@dataclass(slots=True)
 class NewsItem:
     """Individual news item with metadata"""
 
@@ -62,9 +104,17 @@ class NewsItem:
     mentioned_symbols: List[str]
     keywords: List[str]
     priority_weight: float
+    _content_lower: Optional[str] = field(default=None, repr=False, compare=False)
+
+    @property
+    def content_lower(self) -> str:
+        """Lowercased content, computed once and shared by the analyzers"""
+        if self._content_lower is None:
+            self._content_lower = self.content.lower()
+        return self._content_lower
 
 
-@dataclass
+@dataclass(slots=True)
 class TradingOpportunity:
     """Trading opportunity derived from news"""
 
@@ -83,21 +133,41 @@ class TradingOpportunity:
 class NewsDiscoveryEngine:
     """News and opportunity discovery engine with dynamic priorities."""
 
-    def __init__(self, config_manager):
+    def __init__(
+        self,
+        config_manager,
+        max_cache_size: int = NEWS_CACHE_MAX_SIZE,
+        max_concurrent_fetches: int = MAX_CONCURRENT_FETCHES,
+    ):
         """Initialize news discovery engine
 
         Args:
             config_manager: Configuration manager instance
+            max_cache_size: Maximum number of news items kept in the cache
+            max_concurrent_fetches: Maximum number of source fetches in flight
         """
         self.config_manager = config_manager
         self._config = config_manager.load_config()
         self.session: Optional[aiohttp.ClientSession] = None
-        self.news_cache: Dict[str, NewsItem] = {}
+        self._fetch_semaphore = asyncio.Semaphore(max_concurrent_fetches)
+        self.max_cache_size = max_cache_size
+        # item id -> (item, inserted_at), least recently cached first
+        self.news_cache: "OrderedDict[str, Tuple[NewsItem, float]]" = OrderedDict()
+        # content digest -> sentiment, least recently used first
+        self._sentiment_cache: "OrderedDict[bytes, Tuple[SentimentLevel, float]]" = (
+            OrderedDict()
+        )
         self.opportunities: List[TradingOpportunity] = []
+        self._by_symbol: Dict[str, List[TradingOpportunity]] = {}
 
     async def initialize(self):
         """Initialize async session and connections"""
+        # Pooled keep-alive connections with cached DNS, shared by all sources
+        connector = aiohttp.TCPConnector(
+            limit=64, limit_per_host=8, keepalive_timeout=30, ttl_dns_cache=300
+        )
         self.session = aiohttp.ClientSession(
+            connector=connector,
             timeout=aiohttp.ClientTimeout(total=30),
             headers={"User-Agent": "Jesse-MCP-News-Engine/1.0"},
         )
@@ -119,37 +189,38 @@ class NewsDiscoveryEngine:
         Returns:
             List of news items
         """
-        try:
-            # This would implement actual API calls to news sources
-            # For now, return mock data
-            logger.info(f"Fetching news from {source_name}")
-
-            # Mock implementation - replace with actual API calls
-            mock_news = [
-                NewsItem(
-                    id=f"{source_name}_{i}",
-                    source=source_name,
-                    title=f"Market Update {i} from {source_name}",
-                    content=f"Sample news content about market movements...",
-                    url=f"https://{source_name}.com/news/{i}",
-                    timestamp=datetime.now() - timedelta(minutes=i * 10),
-                    category=NewsCategory.MARKET_NEWS,
-                    sentiment=SentimentLevel.NEUTRAL,
-                    sentiment_score=0.0,
-                    relevance_score=0.7,
-                    impact_score=0.5,
-                    mentioned_symbols=["BTC", "ETH"],
-                    keywords=["market", "trading", "crypto"],
-                    priority_weight=source_config.get("weight", 0.1),
-                )
-                for i in range(5)
-            ]
-
-            return mock_news
-
-        except Exception as e:
-            logger.error(f"Failed to fetch news from {source_name}: {e}")
-            return []
+        async with self._fetch_semaphore:
+            try:
+                # This would implement actual API calls to news sources
+                # For now, return mock data
+                logger.info(f"Fetching news from {source_name}")
+
+                # Mock implementation - replace with actual API calls
+                mock_news = [
+                    NewsItem(
+                        id=f"{source_name}_{i}",
+                        source=source_name,
+                        title=f"Market Update {i} from {source_name}",
+                        content=f"Sample news content about market movements...",
+                        url=f"https://{source_name}.com/news/{i}",
+                        timestamp=datetime.now() - timedelta(minutes=i * 10),
+                        category=NewsCategory.MARKET_NEWS,
+                        sentiment=SentimentLevel.NEUTRAL,
+                        sentiment_score=0.0,
+                        relevance_score=0.7,
+                        impact_score=0.5,
+                        mentioned_symbols=["BTC", "ETH"],
+                        keywords=["market", "trading", "crypto"],
+                        priority_weight=source_config.get("weight", 0.1),
+                    )
+                    for i in range(5)
+                ]
+
+                return mock_news
+
+            except Exception as e:
+                logger.error(f"Failed to fetch news from {source_name}: {e}")
+                return []
 
     async def aggregate_news(self) -> List[NewsItem]:
         """Aggregate news from all configured sources
@@ -177,27 +248,62 @@ class NewsDiscoveryEngine:
             task = self.fetch_news_from_source(news_prio.source.value, source_config)
             tasks.append(task)
 
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for result in results:
-                if isinstance(result, list):
-                    all_news.extend(result)
-                else:
-                    logger.error(f"News fetch error: {result}")
+        # Collect each source as soon as it finishes rather than waiting for all
+        for next_result in asyncio.as_completed(tasks):
+            try:
+                all_news.extend(await next_result)
+            except Exception as e:
+                logger.error(f"News fetch error: {e}")
 
         # Sort by timestamp and priority weight
         all_news.sort(key=lambda x: (x.timestamp, -x.priority_weight), reverse=True)
 
         # Update cache
+        self._purge_expired_news()
+        now = time.monotonic()
         for item in all_news:
-            self.news_cache[item.id] = item
+            self.news_cache[item.id] = (item, now)
+            self.news_cache.move_to_end(item.id)
+        while len(self.news_cache) > self.max_cache_size:
+            self.news_cache.popitem(last=False)
 
         logger.info(
             f"Aggregated {len(all_news)} news items from {len(enabled_sources)} sources"
         )
         return all_news
 
+    def _purge_expired_news(self):
+        """Drop cached news items older than their category's TTL"""
+        now = time.monotonic()
+        expired = [
+            item_id
+            for item_id, (item, inserted_at) in self.news_cache.items()
+            if now - inserted_at
+            > _NEWS_CACHE_TTL.get(item.category, _DEFAULT_NEWS_CACHE_TTL)
+        ]
+        for item_id in expired:
+            del self.news_cache[item_id]
+
+    def get_cached_news(self, item_id: str) -> Optional[NewsItem]:
+        """Get a cached news item if it has not expired
+
+        Args:
+            item_id: News item ID
+
+        Returns:
+            Cached news item, or None if missing or expired
+        """
+        entry = self.news_cache.get(item_id)
+        if entry is None:
+            return None
+
+        item, inserted_at = entry
+        ttl = _NEWS_CACHE_TTL.get(item.category, _DEFAULT_NEWS_CACHE_TTL)
+        if time.monotonic() - inserted_at > ttl:
+            del self.news_cache[item_id]
+            return None
+        return item
+
     def analyze_sentiment(self, text: str) -> Tuple[SentimentLevel, float]:
         """Analyze sentiment of text
 
@@ -207,13 +313,34 @@ class NewsDiscoveryEngine:
         Returns:
             Tuple of (sentiment_level, sentiment_score)
         """
+        return self._analyze_lowered_sentiment(text.lower())
+
+    def _cached_sentiment(self, text_lower: str) -> Tuple[SentimentLevel, float]:
+        """Sentiment of lowercased text, memoized by a digest of the content"""
+        key = hashlib.blake2b(text_lower.encode(), digest_size=8).digest()
+        result = self._sentiment_cache.get(key)
+        if result is not None:
+            self._sentiment_cache.move_to_end(key)
+            return result
+
+        result = self._analyze_lowered_sentiment(text_lower)
+        self._sentiment_cache[key] = result
+        if len(self._sentiment_cache) > SENTIMENT_CACHE_MAX_SIZE:
+            self._sentiment_cache.popitem(last=False)
+        return result
+
+    def _analyze_lowered_sentiment(
+        self, text_lower: str
+    ) -> Tuple[SentimentLevel, float]:
         # Mock sentiment analysis - replace with actual NLP model
-        positive_words = ["bullish", "up", "gain", "profit", "growth", "adoption"]
-        negative_words = ["bearish", "down", "loss", "decline", "risk", "concern"]
-
-        text_lower = text.lower()
-        pos_count = sum(1 for word in positive_words if word in text_lower)
-        neg_count = sum(1 for word in negative_words if word in text_lower)
+        # Counts distinct lexicon words present (substring match), per class
+        positive: set = set()
+        negative: set = set()
+        for match in _SENTIMENT_SCANNER.finditer(text_lower):
+            kind = match.lastgroup
+            (positive if kind == "pos" else negative).add(match.group(kind))
+        pos_count = len(positive)
+        neg_count = len(negative)
 
         if pos_count > neg_count + 1:
             return SentimentLevel.BULLISH, min(0.8, 0.1 * (pos_count - neg_count))
@@ -223,13 +350,14 @@ class NewsDiscoveryEngine:
             return SentimentLevel.NEUTRAL, 0.0
 
     def calculate_relevance_score(
-        self, news_item: NewsItem, target_symbols: List[str]
+        self, news_item: NewsItem, target_symbols: AbstractSet[str] | List[str]
     ) -> float:
         """Calculate relevance score for target symbols
 
         Args:
             news_item: News item to score
-            target_symbols: List of target trading symbols
+            target_symbols: Target trading symbols; pass a frozenset when
+                scoring many items to skip the per-call conversion
 
         Returns:
             Relevance score (0.0 to 1.0)
@@ -237,34 +365,26 @@ class NewsDiscoveryEngine:
         score = 0.0
 
         # Symbol mentions
-        mentioned_symbols = set(news_item.mentioned_symbols)
-        target_set = set(target_symbols)
-        symbol_overlap = len(mentioned_symbols & target_set)
+        if not isinstance(target_symbols, frozenset):
+            target_symbols = frozenset(target_symbols)
+        symbol_overlap = len(target_symbols.intersection(news_item.mentioned_symbols))
         if symbol_overlap > 0:
             score += 0.4 * (symbol_overlap / len(target_symbols))
 
         # Category relevance
-        high_relevance_categories = {
-            NewsCategory.MARKET_NEWS,
-            NewsCategory.REGULATORY,
-            NewsCategory.PARTNERSHIP,
-            NewsCategory.ADOPTION,
-        }
-        if news_item.category in high_relevance_categories:
+        if news_item.category in _HIGH_RELEVANCE_CATEGORIES:
             score += 0.3
 
         # Keyword relevance
-        trading_keywords = ["price", "trading", "volume", "market", "exchange"]
-        keyword_matches = sum(
-            1 for kw in trading_keywords if kw in news_item.content.lower()
-        )
+        content_lower = news_item.content_lower
+        keyword_matches = sum(1 for kw in _TRADING_KEYWORDS if kw in content_lower)
         if keyword_matches > 0:
-            score += 0.3 * min(1.0, keyword_matches / len(trading_keywords))
+            score += 0.3 * min(1.0, keyword_matches / len(_TRADING_KEYWORDS))
 
         return min(1.0, score)
 
     def identify_opportunities(
-        self, news_items: List[NewsItem], target_symbols: List[str]
+        self, news_items: List[NewsItem], target_symbols: AbstractSet[str] | List[str]
     ) -> List[TradingOpportunity]:
         """Identify trading opportunities from news
 
@@ -273,85 +393,130 @@ class NewsDiscoveryEngine:
             target_symbols: List of target trading symbols
 
         Returns:
-            List of trading opportunities
+            List of trading opportunities, unordered
         """
         opportunities = []
 
-        # Group news by symbol
-        symbol_news = {}
-        for item in news_items:
+        # Group news by symbol, remembering (symbol id, item index) per mention
+        target_set = frozenset(target_symbols)
+        symbol_news: Dict[str, List[NewsItem]] = defaultdict(list)
+        symbol_ids: Dict[str, int] = {}
+        mention_symbols: List[int] = []
+        mention_items: List[int] = []
+        for i, item in enumerate(news_items):
             for symbol in item.mentioned_symbols:
-                if symbol in target_symbols:
-                    if symbol not in symbol_news:
-                        symbol_news[symbol] = []
+                if symbol in target_set:
                     symbol_news[symbol].append(item)
+                    mention_symbols.append(
+                        symbol_ids.setdefault(symbol, len(symbol_ids))
+                    )
+                    mention_items.append(i)
+
+        if symbol_news:
+            opportunities = self._score_symbols(
+                news_items, symbol_news, mention_symbols, mention_items
+            )
 
-        # Analyze each symbol
-        for symbol, items in symbol_news.items():
-            if not items:
-                continue
-
-            # Calculate aggregate sentiment and impact
-            avg_sentiment = sum(item.sentiment_score for item in items) / len(items)
-            avg_impact = sum(item.impact_score for item in items) / len(items)
-            max_relevance = max(item.relevance_score for item in items)
+        logger.info(
+            f"Identified {len(opportunities)} trading opportunities from {len(news_items)} news items"
+        )
+        return opportunities
 
-            # Determine opportunity type and confidence
-            confidence = (
-                abs(avg_sentiment) * 0.5 + avg_impact * 0.3 + max_relevance * 0.2
-            )
+    def _score_symbols(
+        self,
+        news_items: List[NewsItem],
+        symbol_news: Dict[str, List[NewsItem]],
+        mention_symbols: List[int],
+        mention_items: List[int],
+    ) -> List[TradingOpportunity]:
+        """Aggregate per-symbol news scores with NumPy and build opportunities
 
-            if confidence < 0.3:  # Skip low confidence opportunities
-                continue
-
-            if avg_sentiment > 0.2:
-                opp_type = "long"
-                expected_move = abs(avg_sentiment) * avg_impact * 5.0  # Up to 5% move
-            elif avg_sentiment < -0.2:
-                opp_type = "short"
-                expected_move = abs(avg_sentiment) * avg_impact * 5.0
-            else:
-                opp_type = "volatility"
-                expected_move = avg_impact * 3.0
-
-            # Determine risk level
-            if confidence > 0.7 and avg_impact > 0.6:
-                risk_level = "high"
-            elif confidence > 0.5:
-                risk_level = "medium"
-            else:
-                risk_level = "low"
-
-            # Create opportunity
-            opportunity = TradingOpportunity(
-                symbol=symbol,
-                opportunity_type=opp_type,
-                confidence=confidence,
-                expected_move=expected_move,
-                timeframe="1h",  # Default timeframe
-                news_items=items[:3],  # Top 3 relevant news items
-                risk_level=risk_level,
-                entry_conditions={
-                    "sentiment_threshold": avg_sentiment,
-                    "impact_threshold": avg_impact,
-                    "min_confidence": confidence,
-                },
-                exit_conditions={
-                    "profit_target": expected_move,
-                    "stop_loss": expected_move * 0.5,
-                    "time_limit": "24h",
-                },
-                position_size=self._calculate_position_size(confidence, risk_level),
-            )
+        Args:
+            news_items: News items the mentions index into
+            symbol_news: News items per symbol, in symbol id order
+            mention_symbols: Symbol id of each mention
+            mention_items: News item index of each mention
 
-            opportunities.append(opportunity)
+        Returns:
+            Opportunities for symbols meeting the minimum confidence
+        """
+        n_items = len(news_items)
+        n_symbols = len(symbol_news)
+        sentiment = np.fromiter(
+            (item.sentiment_score for item in news_items), np.float64, count=n_items
+        )
+        impact = np.fromiter(
+            (item.impact_score for item in news_items), np.float64, count=n_items
+        )
+        relevance = np.fromiter(
+            (item.relevance_score for item in news_items), np.float64, count=n_items
+        )
+        sym = np.array(mention_symbols, dtype=np.intp)
+        idx = np.array(mention_items, dtype=np.intp)
 
-        # Sort by confidence
-        opportunities.sort(key=lambda x: x.confidence, reverse=True)
+        # Calculate aggregate sentiment and impact
+        counts = np.bincount(sym, minlength=n_symbols)
+        avg_sentiment = (
+            np.bincount(sym, weights=sentiment[idx], minlength=n_symbols) / counts
+        )
+        avg_impact = np.bincount(sym, weights=impact[idx], minlength=n_symbols) / counts
+        max_relevance = np.full(n_symbols, -np.inf)
+        np.maximum.at(max_relevance, sym, relevance[idx])
+
+        # Determine opportunity type and confidence
+        abs_sentiment = np.abs(avg_sentiment)
+        confidence = abs_sentiment * 0.5 + avg_impact * 0.3 + max_relevance * 0.2
+        opp_types = np.where(
+            avg_sentiment > 0.2,
+            "long",
+            np.where(avg_sentiment < -0.2, "short", "volatility"),
+        )
+        # Directional news moves up to 5%, otherwise a volatility play
+        expected_moves = np.where(
+            abs_sentiment > 0.2, abs_sentiment * avg_impact * 5.0, avg_impact * 3.0
+        )
 
-        logger.info(
-            f"Identified {len(opportunities)} trading opportunities from {len(news_items)} news items"
+        # Determine risk level
+        risk_levels = np.where(
+            (confidence > 0.7) & (avg_impact > 0.6),
+            "high",
+            np.where(confidence > 0.5, "medium", "low"),
         )
+
+        opportunities = []
+        symbols = list(symbol_news)
+
+        # Skip low confidence opportunities
+        for k in np.flatnonzero(confidence >= 0.3).tolist():
+            symbol_confidence = float(confidence[k])
+            expected_move = float(expected_moves[k])
+            risk_level = str(risk_levels[k])
+
+            opportunities.append(
+                TradingOpportunity(
+                    symbol=symbols[k],
+                    opportunity_type=str(opp_types[k]),
+                    confidence=symbol_confidence,
+                    expected_move=expected_move,
+                    timeframe="1h",  # Default timeframe
+                    news_items=symbol_news[symbols[k]][:3],  # Top 3 relevant news items
+                    risk_level=risk_level,
+                    entry_conditions={
+                        "sentiment_threshold": float(avg_sentiment[k]),
+                        "impact_threshold": float(avg_impact[k]),
+                        "min_confidence": symbol_confidence,
+                    },
+                    exit_conditions={
+                        "profit_target": expected_move,
+                        "stop_loss": expected_move * 0.5,
+                        "time_limit": "24h",
+                    },
+                    position_size=self._calculate_position_size(
+                        symbol_confidence, risk_level
+                    ),
+                )
+            )
+
         return opportunities
 
     def _calculate_position_size(self, confidence: float, risk_level: str) -> float:
@@ -407,7 +572,7 @@ class NewsDiscoveryEngine:
             target_symbols: List of symbols to monitor
 
         Returns:
-            List of trading opportunities
+            List of trading opportunities, highest confidence first
         """
         logger.info("Starting news discovery cycle")
 
@@ -415,27 +580,33 @@ class NewsDiscoveryEngine:
         news_items = await self.aggregate_news()
 
         # Analyze sentiment and relevance for each item
+        target_set = frozenset(target_symbols)
         for item in news_items:
-            if item.sentiment_score == 0.0:  # Only analyze if not already done
-                sentiment, score = self.analyze_sentiment(item.content)
+            # Keep source-provided sentiment; repeated content hits the digest cache
+            if item.sentiment_score == 0.0:
+                sentiment, score = self._cached_sentiment(item.content_lower)
                 item.sentiment = sentiment
                 item.sentiment_score = score
 
-            item.relevance_score = self.calculate_relevance_score(item, target_symbols)
+            item.relevance_score = self.calculate_relevance_score(item, target_set)
 
         # Filter relevant news
         relevant_news = [item for item in news_items if item.relevance_score > 0.3]
 
         # Identify opportunities
-        opportunities = self.identify_opportunities(relevant_news, target_symbols)
+        opportunities = self.identify_opportunities(relevant_news, target_set)
 
-        # Update stored opportunities
+        # Update stored opportunities and the per-symbol index
         self.opportunities = opportunities
+        self._by_symbol = {}
+        for opportunity in opportunities:
+            self._by_symbol.setdefault(opportunity.symbol, []).append(opportunity)
 
         logger.info(
             f"Discovery cycle complete: {len(opportunities)} opportunities identified"
         )
-        return opportunities
+        # Callers act on the head of this list, so it stays ranked
+        return sorted(opportunities, key=lambda x: x.confidence, reverse=True)
 
     def get_top_opportunities(self, limit: int = 10) -> List[TradingOpportunity]:
         """Get top N opportunities by confidence
@@ -446,7 +617,7 @@ class NewsDiscoveryEngine:
         Returns:
             List of top opportunities
         """
-        return self.opportunities[:limit]
+        return heapq.nlargest(limit, self.opportunities, key=lambda x: x.confidence)
 
     def get_opportunities_by_symbol(self, symbol: str) -> List[TradingOpportunity]:
         """Get opportunities for a specific symbol
@@ -457,4 +628,4 @@ class NewsDiscoveryEngine:
         Returns:
             List of opportunities for the symbol
         """
-        return [opp for opp in self.opportunities if opp.symbol == symbol]
+        return list(self._by_symbol.get(symbol, ()))
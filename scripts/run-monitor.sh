@@ -17,6 +17,7 @@ Usage: run-monitor.sh [OPTIONS]
 Options:
     --scan       Run daily market scan and alert on opportunities (default)
     --summary    Generate and send daily summary report
+    --refresh    Refresh the strategy_perf_30d materialized view (schedule hourly)
     --help       Show this help message
 
 Environment Variables:
@@ -28,6 +29,7 @@ Environment Variables:
 Examples:
     run-monitor.sh --scan
     run-monitor.sh --summary
+    run-monitor.sh --refresh
     SYMBOLS=BTC-USDT,ETH-USDT run-monitor.sh --scan
 EOF
 }
@@ -144,6 +146,18 @@ def run_summary():
         logger.error(f"Failed to send summary: {result.get('error')}")
         sys.exit(1)
 
+def run_refresh():
+    """Refresh cached strategy performance aggregates"""
+    from jesse_mcp.logs import refresh_strategy_perf
+
+    result = refresh_strategy_perf()
+
+    if result.get("error"):
+        logger.error(f"Failed to refresh strategy performance: {result['error']}")
+        sys.exit(1)
+
+    logger.info(f"Strategy performance refresh: {result}")
+
 def main():
     mode = "${MODE}"
 
@@ -152,6 +166,8 @@ def main():
             run_scan()
         elif mode == "--summary":
             run_summary()
+        elif mode == "--refresh":
+            run_refresh()
         else:
             logger.error(f"Unknown mode: {mode}")
             sys.exit(1)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Jesse integration's candle fetch cache (research module is faked)
+"""
+
+import numpy as np
+import pytest
+
+from jesse_mcp.core import integrations
+
+
+class FakeResearch:
+    """Serves canned candle arrays per symbol and counts database reads"""
+
+    def __init__(self, candles):
+        self.candles = candles
+        self.fetches = 0
+        self.imports = []
+
+    def get_candles(self, symbol, warmup_candles_num, **kwargs):
+        self.fetches += 1
+        return self.candles.get(symbol, np.empty((0, 6))), np.zeros((warmup_candles_num, 6))
+
+    def import_candles(self, **kwargs):
+        self.imports.append(kwargs)
+        return "imported"
+
+
+@pytest.fixture
+def research(monkeypatch):
+    fake = FakeResearch({"BTC-USDT": np.ones((10, 6))})
+    monkeypatch.setattr(integrations, "research", fake, raising=False)
+    integrations.clear_candle_fetch_cache()
+    yield fake
+    integrations.clear_candle_fetch_cache()
+
+
+def fetch(symbol="BTC-USDT", start_ts=0):
+    return integrations._fetch_candles("Binance", symbol, "1h", start_ts, 1000, 2)
+
+
+def test_repeated_fetches_reuse_cached_arrays(research):
+    first, _ = fetch()
+    second, _ = fetch()
+
+    assert second is first
+    assert research.fetches == 1
+
+
+def test_empty_fetches_are_not_cached(research):
+    candles, _ = fetch("ETH-USDT")
+    assert len(candles) == 0
+
+    research.candles["ETH-USDT"] = np.ones((5, 6))
+    candles, _ = fetch("ETH-USDT")
+
+    assert len(candles) == 5
+    assert research.fetches == 2
+
+
+def test_cache_evicts_oldest_ranges_beyond_byte_budget(research, monkeypatch):
+    # Each entry holds 10 + 2 candle rows of 6 float64 values
+    entry_bytes = 12 * 6 * 8
+    monkeypatch.setattr(integrations, "CANDLE_FETCH_CACHE_MAX_BYTES", 2 * entry_bytes)
+
+    for start_ts in (0, 1, 2):
+        fetch(start_ts=start_ts)
+    fetch(start_ts=2)
+    fetch(start_ts=0)
+
+    assert research.fetches == 4
+    assert integrations._candle_fetch_bytes == 2 * entry_bytes
+
+
+def test_import_candles_invalidates_fetch_cache(research, monkeypatch):
+    monkeypatch.setattr(integrations, "JESSE_RESEARCH_AVAILABLE", True)
+    wrapper = integrations.JesseWrapper.__new__(integrations.JesseWrapper)
+    fetch()
+
+    result = wrapper.import_candles("Binance", "BTC-USDT", "2024-01-01")
+    fetch()
+
+    assert result["success"] is True
+    assert research.fetches == 2
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Unit tests for backtest log analysis
+
+Uses fake connections so no PostgreSQL server (or psycopg2) is required.
+"""
+
+import time
+from collections import namedtuple
+from datetime import datetime, timezone
+
+import pytest
+
+from jesse_mcp import logs
+from jesse_mcp.core.cache import clear_all_caches
+
+Column = namedtuple("Column", "name")
+
+
+class FakeCursor:
+    """Cursor context manager that serves canned rows and records executed SQL"""
+
+    def __init__(self, rows, executed, columns, responses):
+        self.rows = rows
+        self.executed = executed
+        self.description = [Column(name) for name in columns]
+        self.responses = responses
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+        for fragment, rows in self.responses.items():
+            if fragment in sql:
+                self.rows = rows
+
+    def fetchall(self):
+        return self.rows
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+class FakeConnection:
+    def __init__(self, rows=(), columns=()):
+        self.rows = list(rows)
+        self.columns = columns
+        self.executed = []
+        self.responses = {}
+        self.cursor_names = []
+        self.commits = 0
+
+    def cursor(self, **kwargs):
+        self.cursor_names.append(kwargs.get("name"))
+        return FakeCursor(self.rows, self.executed, self.columns, self.responses)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+class FakePool:
+    """Records checkouts and returns of a single fake connection"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.returned = []
+
+    def getconn(self):
+        return self.conn
+
+    def putconn(self, conn):
+        self.returned.append(conn)
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    clear_all_caches()
+    yield
+    clear_all_caches()
+
+
+@pytest.fixture
+def fake_pool(monkeypatch):
+    pool = FakePool(FakeConnection())
+    monkeypatch.setattr(logs, "PSYCOPG2_AVAILABLE", True)
+    monkeypatch.setattr(logs, "_pool", pool)
+    monkeypatch.setattr(logs, "_strategy_perf_view_ready", False)
+    monkeypatch.setattr(logs, "_strategy_perf_view_checked_at", time.monotonic())
+    monkeypatch.setattr(logs, "_indexes_checked", True)
+    return pool
+
+
+def test_connections_are_checked_out_of_and_back_into_pool(fake_pool):
+    conn = logs._get_db_connection()
+    assert conn is fake_pool.conn
+
+    logs._release_db_connection(conn)
+    assert fake_pool.returned == [conn]
+
+
+def test_backtest_history_rows_are_json_ready(fake_pool):
+    created = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    fake_pool.conn.rows = [("bt-1", "DayTrader", "BTC-USDT", "15m", 4.0, 60.0, 12, created)]
+
+    history = logs.analyze_backtest_history(7)
+
+    assert history["total_count"] == 1
+    assert history["backtests"][0] == {
+        "id": "bt-1",
+        "strategy_name": "DayTrader",
+        "symbol": "BTC-USDT",
+        "timeframe": "15m",
+        "total_return": 4.0,
+        "win_rate": 60.0,
+        "total_trades": 12,
+        "created_at": created.isoformat(),
+    }
+    assert fake_pool.conn.executed[0][1] == (7,)
+    assert fake_pool.conn.cursor_names == [None]
+
+
+def test_mock_data_without_psycopg2(monkeypatch):
+    monkeypatch.setattr(logs, "PSYCOPG2_AVAILABLE", False)
+
+    history = logs.analyze_backtest_history(3)
+
+    assert history["data_source"] == "mock"
+    assert history["total_count"] == 3
+
+
+def test_weekly_report_fetches_history_and_performance_in_one_query(fake_pool):
+    fake_pool.conn.rows = [
+        ("bt", 1, {"strategy_name": "DayTrader", "symbol": "BTC-USDT", "total_return": 4.0}),
+        ("perf", 1, {"strategy_name": "DayTrader", "avg_return": 4.0, "total_backtests": 1}),
+    ]
+
+    report = logs.generate_weekly_report()
+
+    assert len(fake_pool.conn.executed) == 1
+    assert fake_pool.conn.executed[0][0].rstrip().endswith("ORDER BY kind, ord")
+    assert fake_pool.returned == [fake_pool.conn]
+    assert "### DayTrader" in report
+    assert "- **DayTrader** on BTC-USDT: 4.00%" in report
+    assert "*Data source: database*" in report
+
+
+def test_weekly_report_skips_null_metrics(fake_pool):
+    fake_pool.conn.rows = [
+        ("bt", 1, {"strategy_name": "A", "total_return": 4.0, "win_rate": 60.0, "total_trades": 3}),
+        (
+            "bt",
+            2,
+            {"strategy_name": "B", "total_return": None, "win_rate": None, "total_trades": None},
+        ),
+        ("perf", 1, {"strategy_name": "A", "avg_return": None, "total_backtests": 2}),
+    ]
+
+    report = logs.generate_weekly_report()
+
+    assert "nan" not in report.lower()
+    assert "- **Total Trades:** 3" in report
+    assert "- **Aggregate Return:** 4.00%" in report
+    assert "- **Average Win Rate:** 60.0%" in report
+    assert "- **B** on Unknown: 0.00% (WR: 0.0%)" in report
+
+
+def test_correlate_sentiment_reads_coefficient_from_query(fake_pool):
+    points = [
+        {"date": "2024-01-02", "fear_greed": 50, "avg_return": 5.0, "backtest_count": 2},
+        {"date": "2024-01-01", "fear_greed": 50, "avg_return": -1.0, "backtest_count": 1},
+    ]
+    fake_pool.conn.rows = [(None, points)]
+
+    result = logs.correlate_sentiment()
+
+    assert len(fake_pool.conn.executed) == 1
+    assert result["correlation_coefficient"] == 0
+    assert result["interpretation"] == "no_correlation"
+    assert result["data_points"] == points
+
+
+def test_correlate_sentiment_without_backtests(fake_pool):
+    fake_pool.conn.rows = [(None, None)]
+
+    assert logs.correlate_sentiment()["interpretation"] == "insufficient_data"
+
+
+def test_strategy_performance_reads_fresh_view(fake_pool, monkeypatch):
+    monkeypatch.setattr(logs, "_strategy_perf_view_ready", None)
+    fake_pool.conn.responses["pg_class"] = [(2,)]
+    fake_pool.conn.responses["strategy_perf_refresh"] = [(True,)]
+    fake_pool.conn.responses["ORDER BY avg_return"] = [("DayTrader", 4, 3)]
+    fake_pool.conn.columns = ("strategy_name", "avg_return", "total_backtests")
+
+    result = logs.analyze_strategy_performance()
+
+    statements = [sql for sql, _ in fake_pool.conn.executed]
+    assert not any("CREATE" in sql or "REFRESH" in sql for sql in statements)
+    assert statements[-1] == "SELECT * FROM strategy_perf_30d ORDER BY avg_return DESC"
+    assert result["strategies"] == [
+        {"strategy_name": "DayTrader", "avg_return": 4.0, "total_backtests": 3}
+    ]
+
+
+def test_strategy_performance_aggregates_inline_when_view_is_stale(fake_pool, monkeypatch):
+    monkeypatch.setattr(logs, "_strategy_perf_view_ready", True)
+    fake_pool.conn.responses["strategy_perf_refresh"] = [(False,)]
+    fake_pool.conn.responses["ORDER BY avg_return"] = []
+
+    logs.analyze_strategy_performance()
+
+    statements = [sql for sql, _ in fake_pool.conn.executed]
+    assert "FROM completed_backtests" in statements[-1]
+    assert "strategy_perf_30d ORDER BY" not in statements[-1]
+
+
+def test_strategy_performance_aggregates_inline_without_migration(fake_pool, monkeypatch):
+    monkeypatch.setattr(logs, "_strategy_perf_view_ready", None)
+    fake_pool.conn.responses["pg_class"] = [(0,)]
+
+    logs.analyze_strategy_performance()
+    clear_all_caches()
+    logs.analyze_strategy_performance()
+
+    statements = [sql for sql, _ in fake_pool.conn.executed]
+    assert sum("pg_class" in sql for sql in statements) == 1
+    assert "FROM completed_backtests" in statements[-1]
+    assert logs.refresh_strategy_perf() == {"refreshed": False, "data_source": "database"}
+
+
+def test_strategy_perf_view_existence_is_rechecked(fake_pool, monkeypatch):
+    monkeypatch.setattr(logs, "_strategy_perf_view_ready", None)
+    fake_pool.conn.responses["pg_class"] = [(0,)]
+    assert not logs._strategy_perf_view_exists(fake_pool.conn)
+
+    fake_pool.conn.responses["pg_class"] = [(2,)]
+    assert not logs._strategy_perf_view_exists(fake_pool.conn)
+
+    monkeypatch.setattr(logs, "_strategy_perf_view_checked_at", 0.0)
+    monkeypatch.setattr(logs.time, "monotonic", lambda: logs.PERF_VIEW_CHECK_SECONDS + 1.0)
+    assert logs._strategy_perf_view_exists(fake_pool.conn)
+
+
+def test_refresh_strategy_perf_rechecks_for_the_migration(fake_pool):
+    fake_pool.conn.responses["pg_class"] = [(2,)]
+
+    assert logs.refresh_strategy_perf() == {"refreshed": True, "data_source": "database"}
+    statements = [sql for sql, _ in fake_pool.conn.executed]
+    assert "pg_class" in statements[0]
+    assert statements[1].startswith("REFRESH MATERIALIZED VIEW CONCURRENTLY")
+    assert statements[2].startswith("UPDATE strategy_perf_refresh")
+    assert fake_pool.conn.commits == 1
+
+
+def test_strategy_performance_is_cached_between_calls(fake_pool):
+    fake_pool.conn.columns = ("strategy_name", "avg_return")
+    fake_pool.conn.rows = [("DayTrader", 4)]
+
+    first = logs.analyze_strategy_performance()
+    first["strategies"].clear()
+    second = logs.analyze_strategy_performance()
+    third = logs.analyze_strategy_performance()
+
+    assert second["strategies"] == [{"strategy_name": "DayTrader", "avg_return": 4.0}]
+    assert third == second
+    assert third is not second
+    assert len(fake_pool.conn.executed) == 1
+
+
+def test_mock_fallbacks_are_not_cached(fake_pool, monkeypatch):
+    fake_pool.conn.columns = ("strategy_name", "avg_return")
+    fake_pool.conn.rows = [("DayTrader", 4)]
+
+    monkeypatch.setattr(logs, "PSYCOPG2_AVAILABLE", False)
+    assert logs.analyze_strategy_performance()["data_source"] == "mock"
+
+    monkeypatch.setattr(logs, "PSYCOPG2_AVAILABLE", True)
+    assert logs.analyze_strategy_performance()["data_source"] == "database"
+
+
+def test_missing_or_invalid_indexes_are_reported_once(fake_pool, monkeypatch, caplog):
+    monkeypatch.setattr(logs, "_indexes_checked", False)
+    fake_pool.conn.rows = [("bt_created_brin",)]
+
+    logs._get_db_connection()
+    logs._get_db_connection()
+
+    statements = [sql for sql, _ in fake_pool.conn.executed]
+    assert len(statements) == 1
+    assert "indisvalid" in statements[0]
+    assert not any("CREATE INDEX" in sql for sql in statements)
+    assert "bt_strategy_created" in caplog.text
+    assert "bt_created_brin" not in caplog.text
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the market monitor (Jesse REST calls are faked)
+"""
+
+import json
+import threading
+
+import pytest
+
+from jesse_mcp.core.cache import clear_all_caches
+from jesse_mcp.monitoring import DailyReport, MarketMonitor
+
+
+class FakeJesseClient:
+    """Returns canned backtest metrics per strategy and records calling threads"""
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+        self.calls = []
+        self.threads = set()
+
+    def backtest(self, **kwargs):
+        self.calls.append(kwargs)
+        self.threads.add(threading.get_ident())
+        return {"metrics": self.metrics.get(kwargs["strategy"], {})}
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    clear_all_caches()
+    yield
+    clear_all_caches()
+
+
+@pytest.fixture
+def monitor():
+    monitor = MarketMonitor(
+        symbols=["BTC-USDT", "ETH-USDT"], strategies=["DayTrader", "SwingTrader"]
+    )
+    monitor._jesse_client = FakeJesseClient(
+        {
+            "DayTrader": {"total_return": 12, "win_rate": 65},
+            "SwingTrader": {"total_return": 6, "win_rate": 55},
+        }
+    )
+    return monitor
+
+
+def test_scan_opportunities_checks_every_combination(monitor):
+    opportunities = monitor.scan_opportunities()
+
+    assert len(monitor._jesse_client.calls) == 4
+    assert [(o["symbol"], o["strategy"], o["signal"]) for o in opportunities] == [
+        ("BTC-USDT", "DayTrader", "strong_buy"),
+        ("ETH-USDT", "DayTrader", "strong_buy"),
+        ("BTC-USDT", "SwingTrader", "buy"),
+        ("ETH-USDT", "SwingTrader", "buy"),
+    ]
+    assert threading.get_ident() not in monitor._jesse_client.threads
+
+
+def test_market_overview_skips_failed_assets(monitor, monkeypatch):
+    def fake_price(asset):
+        if asset == "ethereum":
+            raise ConnectionError("timeout")
+        return {"symbol": asset.upper(), "price": 1, "change_24h": 0}
+
+    monkeypatch.setattr(monitor, "_get_asset_price", fake_price)
+
+    overview = monitor.get_market_overview()
+
+    assert list(overview["assets"]) == ["bitcoin", "solana"]
+
+
+def test_trading_signals_are_memoized_for_the_day(monitor):
+    monitor.scan_opportunities()
+    opportunities = monitor.scan_opportunities()
+
+    assert len(monitor._jesse_client.calls) == 4
+    assert len(opportunities) == 4
+
+
+def test_memoized_signals_are_copied_for_each_caller(monitor):
+    first = monitor.get_trading_signal("BTC-USDT", "DayTrader", "15m")
+    first.details["mutated"] = True
+    second = monitor.get_trading_signal("BTC-USDT", "DayTrader", "15m")
+    third = monitor.get_trading_signal("BTC-USDT", "DayTrader", "15m")
+
+    assert len(monitor._jesse_client.calls) == 1
+    assert "mutated" not in second.details
+    assert second == third
+    assert second is not third
+    assert second.details is not third.details
+
+
+def test_signal_cache_survives_concurrent_scan_workers():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from jesse_mcp.core.cache import TTLCache
+
+    cache = TTLCache("concurrent", ttl=60, max_size=8)
+
+    def churn(worker):
+        for i in range(2000):
+            key = f"{worker}-{i % 32}"
+            cache.set(key, i)
+            cache.get(key)
+
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        list(ex.map(churn, range(8)))
+
+    assert cache.size() <= 8
+
+
+def test_report_to_markdown_sections():
+    report = DailyReport(
+        timestamp="2024-01-01T00:00:00+00:00",
+        market_overview={},
+        fear_greed={"score": 40, "rating": "fear"},
+        signals=[],
+        opportunities=[
+            {
+                "symbol": "BTC-USDT",
+                "strategy": "DayTrader",
+                "signal": "buy",
+                "confidence": 0.6,
+                "timeframe": "15m",
+            }
+        ],
+        risks=["Rapid sentiment shift"],
+        recommendations=[],
+    )
+
+    markdown = MarketMonitor().report_to_markdown(report)
+
+    assert markdown == (
+        "# Daily Market Report\n\n"
+        "**Generated:** 2024-01-01T00:00:00+00:00\n\n"
+        "## Market Sentiment\n\n"
+        "- **Fear & Greed:** 40 (fear)\n\n"
+        "## Opportunities (1)\n\n"
+        "### BTC-USDT - DayTrader\n\n"
+        "- **Signal:** BUY\n"
+        "- **Confidence:** 60%\n"
+        "- **Timeframe:** 15m\n\n"
+        "## Risks (1)\n\n"
+        "- Rapid sentiment shift\n\n"
+        "## Recommendations\n"
+    )
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_report_to_json_encodes_signal_values(monkeypatch, use_orjson):
+    from jesse_mcp import monitoring
+
+    if not use_orjson:
+        monkeypatch.setattr(monitoring, "orjson", None)
+    elif monitoring.orjson is None:
+        pytest.skip("orjson not installed")
+
+    signal = monitoring.MarketSignal(
+        symbol="BTC-USDT",
+        timeframe="1h",
+        strategy="SMACrossover",
+        signal=monitoring.SignalStrength.BUY,
+        confidence=0.6,
+        price=0.0,
+        change_24h=0.0,
+        fear_greed=50,
+        timestamp="2024-01-01T00:00:00+00:00",
+        details={},
+    )
+    report = DailyReport("2024-01-01T00:00:00+00:00", {}, {}, [signal], [], [], [])
+
+    encoded = json.loads(MarketMonitor().report_to_json(report))
+
+    assert encoded["signals"][0]["signal"] == "buy"
+    assert encoded["signals"][0]["confidence"] == 0.6
+
+
+@pytest.mark.parametrize(
+    "score, sentiment",
+    [
+        (0, "EXTREME_FEAR"),
+        (25, "EXTREME_FEAR"),
+        (26, "FEAR"),
+        (45, "FEAR"),
+        (50, "NEUTRAL"),
+        (55, "NEUTRAL"),
+        (75, "GREED"),
+        (75.5, "EXTREME_GREED"),
+        (100, "EXTREME_GREED"),
+    ],
+)
+def test_analyze_sentiment_bands(score, sentiment):
+    assert MarketMonitor().analyze_sentiment(score) == sentiment
+
+
+def test_daily_scan_fetches_fear_greed_once(monitor, monkeypatch):
+    fetches = []
+
+    def fake_fear_greed():
+        fetches.append(1)
+        return {"score": 80, "rating": "extreme_greed", "previous_week": 50}
+
+    monkeypatch.setattr(monitor, "get_fear_greed", fake_fear_greed)
+
+    report = monitor.daily_scan()
+
+    assert len(fetches) == 1
+    assert report.risks == [
+        "Extreme greed detected - potential for sharp correction",
+        "Rapid sentiment shift - increased volatility expected",
+    ]
+    assert {o["market_sentiment"] for o in report.opportunities} == {"EXTREME_GREED"}
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the news discovery engine (no network; sources are stubbed)
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from jesse_mcp import news_engine  # noqa: E402
+from jesse_mcp.config import ConfigurationManager  # noqa: E402
+from jesse_mcp.news_engine import (  # noqa: E402
+    NewsCategory,
+    NewsDiscoveryEngine,
+    NewsItem,
+    SentimentLevel,
+)
+
+
+def make_item(item_id, symbols, sentiment_score=0.0, impact=0.5, relevance=0.8, **kw):
+    fields = dict(
+        id=item_id,
+        source="test",
+        title=f"Headline {item_id}",
+        content="Bitcoin price and trading volume on the exchange",
+        url=f"https://example.com/{item_id}",
+        timestamp=datetime(2024, 1, 1),
+        category=NewsCategory.MARKET_NEWS,
+        sentiment=SentimentLevel.NEUTRAL,
+        sentiment_score=sentiment_score,
+        relevance_score=relevance,
+        impact_score=impact,
+        mentioned_symbols=list(symbols),
+        keywords=[],
+        priority_weight=0.1,
+    )
+    fields.update(kw)
+    return NewsItem(**fields)
+
+
+@pytest.fixture
+def engine():
+    return NewsDiscoveryEngine(ConfigurationManager())
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controls the engine's monotonic clock without touching the event loop's"""
+    now = [0.0]
+    monkeypatch.setattr(news_engine, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def single_source(engine, monkeypatch, *batches):
+    """Make aggregate_news fetch one source, serving the given batches in turn"""
+    engine._config.news_priorities = engine._config.news_priorities[:1]
+    pending = list(batches)
+
+    async def fake_fetch(source_name, source_config):
+        return pending.pop(0)
+
+    monkeypatch.setattr(engine, "fetch_news_from_source", fake_fetch)
+
+
+def reference_sentiment(text_lower):
+    """Original per-word substring scan the regex scanner replaced"""
+    pos = sum(1 for word in news_engine._POSITIVE_WORDS if word in text_lower)
+    neg = sum(1 for word in news_engine._NEGATIVE_WORDS if word in text_lower)
+    if pos > neg + 1:
+        return SentimentLevel.BULLISH, min(0.8, 0.1 * (pos - neg))
+    if neg > pos + 1:
+        return SentimentLevel.BEARISH, max(-0.8, -0.1 * (neg - pos))
+    return SentimentLevel.NEUTRAL, 0.0
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "bullish growth and adoption lift profit",
+        "bearish decline, heavy loss and regulatory risk",
+        "gain offsets loss",
+        "supply countdown: upside upside upside",
+        "profitable growth, adoption up, gains despite concern",
+        "concerns of a downturn and declines in riskier assets",
+        "uprofit and upgain: overlapping hits",
+        "gainsgrowthadoptionup",
+    ],
+)
+def test_sentiment_scan_matches_per_word_substring_counts(engine, text):
+    assert engine._analyze_lowered_sentiment(text) == reference_sentiment(text)
+    assert engine.analyze_sentiment(text.upper()) == reference_sentiment(text)
+
+
+def test_sentiment_is_memoized_by_content(engine, monkeypatch):
+    calls = []
+    analyze = engine._analyze_lowered_sentiment
+
+    def counting(text_lower):
+        calls.append(text_lower)
+        return analyze(text_lower)
+
+    monkeypatch.setattr(engine, "_analyze_lowered_sentiment", counting)
+
+    first = engine._cached_sentiment("bullish growth and profit")
+    second = engine._cached_sentiment("bullish growth and profit")
+
+    assert first == second == (SentimentLevel.BULLISH, pytest.approx(0.3))
+    assert len(calls) == 1
+
+
+def test_identify_opportunities_aggregates_per_symbol(engine):
+    items = [
+        make_item("a", ["BTC"], sentiment_score=0.6, impact=0.8, relevance=0.5),
+        make_item("b", ["BTC", "ETH"], sentiment_score=0.2, impact=0.4, relevance=0.9),
+        make_item("c", ["ETH"], sentiment_score=-0.8, impact=0.6, relevance=0.4),
+        make_item("d", ["XRP"], sentiment_score=0.9, impact=0.9, relevance=0.9),
+    ]
+
+    opportunities = {
+        o.symbol: o for o in engine.identify_opportunities(items, ["BTC", "ETH"])
+    }
+
+    assert set(opportunities) == {"BTC", "ETH"}
+    btc, eth = opportunities["BTC"], opportunities["ETH"]
+
+    # avg sentiment 0.4, avg impact 0.6, max relevance 0.9
+    assert btc.opportunity_type == "long"
+    assert btc.confidence == pytest.approx(0.4 * 0.5 + 0.6 * 0.3 + 0.9 * 0.2)
+    assert btc.expected_move == pytest.approx(0.4 * 0.6 * 5.0)
+    assert btc.risk_level == "medium"
+    assert btc.entry_conditions["sentiment_threshold"] == pytest.approx(0.4)
+    assert btc.exit_conditions["stop_loss"] == pytest.approx(btc.expected_move * 0.5)
+    assert [item.id for item in btc.news_items] == ["a", "b"]
+
+    # avg sentiment -0.3, avg impact 0.5, max relevance 0.9
+    assert eth.opportunity_type == "short"
+    assert eth.confidence == pytest.approx(0.3 * 0.5 + 0.5 * 0.3 + 0.9 * 0.2)
+    assert eth.expected_move == pytest.approx(0.3 * 0.5 * 5.0)
+    assert eth.risk_level == "low"
+    assert eth.position_size == pytest.approx(eth.confidence * 0.1 * 1.5)
+
+
+def test_identify_opportunities_types_risk_and_cutoff(engine):
+    items = [
+        make_item("s", ["SOL"], sentiment_score=0.1, impact=1.0, relevance=1.0),
+        make_item("v", ["AVAX"], sentiment_score=0.9, impact=0.9, relevance=1.0),
+        make_item("d", ["DOGE"], sentiment_score=0.0, impact=0.2, relevance=0.5),
+    ]
+
+    opportunities = {
+        o.symbol: o
+        for o in engine.identify_opportunities(items, ["SOL", "AVAX", "DOGE"])
+    }
+
+    # DOGE scores 0.16, below the 0.3 confidence cutoff
+    assert set(opportunities) == {"SOL", "AVAX"}
+
+    sol = opportunities["SOL"]
+    assert sol.opportunity_type == "volatility"
+    assert sol.expected_move == pytest.approx(3.0)
+    assert sol.risk_level == "medium"
+
+    avax = opportunities["AVAX"]
+    assert avax.opportunity_type == "long"
+    assert avax.confidence == pytest.approx(0.92)
+    assert avax.risk_level == "high"
+    assert avax.position_size == pytest.approx(0.92 * 0.1 * 0.5)
+
+
+def test_identify_opportunities_without_target_mentions(engine):
+    assert engine.identify_opportunities([make_item("a", ["XRP"])], ["BTC"]) == []
+
+
+async def test_opportunities_by_symbol_reads_cycle_index(engine, monkeypatch):
+    items = [
+        make_item("a", ["BTC"], sentiment_score=0.6),
+        make_item("b", ["ETH"], sentiment_score=-0.6),
+    ]
+    single_source(engine, monkeypatch, items)
+
+    await engine.run_discovery_cycle(["BTC", "ETH"])
+    btc = engine.get_opportunities_by_symbol("BTC")
+    btc.clear()
+
+    assert [o.symbol for o in engine.get_opportunities_by_symbol("BTC")] == ["BTC"]
+    assert engine.get_opportunities_by_symbol("ETH")[0].opportunity_type == "short"
+    assert engine.get_opportunities_by_symbol("SOL") == []
+
+
+async def test_news_cache_expires_by_category_ttl(engine, monkeypatch, clock):
+    market = make_item("m", ["BTC"])
+    regulatory = make_item("r", ["BTC"], category=NewsCategory.REGULATORY)
+    single_source(engine, monkeypatch, [market, regulatory])
+
+    await engine.aggregate_news()
+
+    clock[0] = 601
+    assert engine.get_cached_news("m") is None
+    assert engine.get_cached_news("r") is regulatory
+
+    clock[0] = 3601
+    assert engine.get_cached_news("r") is None
+
+
+async def test_news_cache_evicts_least_recently_cached(monkeypatch, clock):
+    engine = NewsDiscoveryEngine(ConfigurationManager(), max_cache_size=3)
+    first = [make_item(f"n{i}", ["BTC"]) for i in range(3)]
+    single_source(engine, monkeypatch, first, [make_item("n3", ["BTC"]), first[1]])
+
+    await engine.aggregate_news()
+    clock[0] = 1
+    await engine.aggregate_news()
+
+    assert list(engine.news_cache) == ["n2", "n3", "n1"]
+    assert engine.news_cache["n1"][1] == 1
+
+
+async def test_orchestrator_processes_highest_confidence_first(engine, monkeypatch):
+    from jesse_mcp.orchestrator import TradingSystemOrchestrator
+
+    symbols = ["AAA", "BBB", "CCC", "DDD", "EEE", "FFF"]
+    # First-seen symbols carry the weakest sentiment
+    items = [
+        make_item(f"n{k}", [symbol], sentiment_score=0.2 + 0.1 * k)
+        for k, symbol in enumerate(symbols)
+    ]
+
+    async def fake_aggregate():
+        return items
+
+    monkeypatch.setattr(engine, "aggregate_news", fake_aggregate)
+    opportunities = await engine.run_discovery_cycle(symbols)
+
+    orchestrator = TradingSystemOrchestrator.__new__(TradingSystemOrchestrator)
+    seen = []
+
+    async def record(opportunity):
+        seen.append(opportunity.symbol)
+        return {"approved": False}
+
+    orchestrator._validate_opportunity = record
+    await orchestrator._process_opportunities(opportunities)
+
+    assert seen == ["FFF", "EEE", "DDD", "CCC", "BBB"]
+    assert [o.symbol for o in engine.get_top_opportunities(2)] == ["FFF", "EEE"]
@@ -106,6 +106,46 @@ class TestStrategy
         assert result.line is not None
         assert result.fix_hint is not None
 
+    def test_validate_syntax_reports_compile_time_errors(self):
+        """Test errors raised after parsing (e.g. 'return' outside function) still fail."""
+        from jesse_mcp.core.strategy_validator import get_validator
+
+        validator = get_validator()
+        result = validator.validate_syntax("x = 1\nreturn x\n")
+
+        assert result.passed is False
+        assert result.line == 2
+        assert "outside function" in result.error
+
+    def test_repeated_syntax_errors_do_not_reuse_the_exception(self):
+        """Test cached analyses keep no exception whose traceback grows per call."""
+        from jesse_mcp.core.strategy_validation.static import _analyze
+        from jesse_mcp.core.strategy_validator import get_validator
+
+        validator = get_validator()
+        code = "class Broken(\n"
+
+        first = validator.validate_syntax(code)
+        second = validator.validate_syntax(code)
+
+        assert first.to_dict() == second.to_dict()
+        assert not any(
+            isinstance(arg, BaseException) for arg in _analyze(code).syntax_error_args
+        )
+
+    def test_passing_results_are_not_shared(self):
+        """Test mutating one passing result cannot leak into later validations."""
+        from jesse_mcp.core.strategy_validator import get_validator
+
+        validator = get_validator()
+        first = validator.validate_syntax("x = 1\n")
+        first.warnings.append("mutated")
+        first.to_dict()["metrics"]["mutated"] = True
+
+        second = validator.validate_syntax("y = 2\n")
+        assert second.warnings == []
+        assert second.to_dict()["metrics"] == {}
+
 
 class TestStrategyValidatorImports:
     """Tests for import validation level."""
@@ -185,6 +225,26 @@ class TestStrategy(Strategy):
 
         assert result.passed is True
 
+    def test_validate_methods_ignores_docstring_mentions(self):
+        """Test methods named only in docstrings or comments are still missing."""
+        from jesse_mcp.core.strategy_validator import get_validator
+
+        validator = get_validator()
+        code = '''
+from jesse.strategies import Strategy
+
+class TestStrategy(Strategy):
+    """Implements def should_long(self) and def go_long(self) later."""
+
+    # def should_short(self): ...
+    def go_short(self):
+        pass
+'''
+        result = validator.validate_methods(code)
+
+        assert result.passed is False
+        assert result.fix_hint == "should_long,go_long,should_short"
+
 
 class TestFullValidation:
     """Tests for full validation across all levels."""
@@ -234,6 +294,65 @@ class InvalidStrategy:
         assert result["passed"] is False
         assert len(result["errors"]) > 0
 
+    def test_full_validation_skips_levels_after_syntax_error(self):
+        """Test syntax failures short-circuit the remaining levels."""
+        from jesse_mcp.core.strategy_validator import get_validator
+
+        validator = get_validator()
+        result = validator.full_validation("class Broken(Strategy)\n    pass\n")
+
+        assert [e["level"] for e in result["errors"]] == ["syntax"]
+        assert result["levels"]["methods"]["error"] == "skipped: syntax failed"
+        assert result["levels"]["methods"]["passed"] is False
+
+    def test_full_validation_cache_returns_independent_copies(self):
+        """Test memoized results are not shared between callers."""
+        from jesse_mcp.core.strategy_validator import StrategyValidator
+
+        validator = StrategyValidator(cache_size=1)
+        code = "class CachedStrategy:\n    pass\n"
+
+        first = validator.full_validation(code)
+        first["errors"].clear()
+        second = validator.full_validation(code)
+
+        assert len(second["errors"]) > 0
+        second["levels"]["syntax"]["warnings"].append("mutated")
+        second["errors"][0]["error"] = "mutated"
+        third = validator.full_validation(code)
+        assert third["levels"]["syntax"]["warnings"] == []
+        assert third["errors"][0]["error"] != "mutated"
+
+        validator.full_validation("class Other:\n    pass\n")
+        assert len(validator._result_cache) == 1
+
+    def test_validate_many_matches_single_validation(self):
+        """Test batch validation returns per-source results in order."""
+        from jesse_mcp.core.strategy_validator import get_validator
+
+        validator = get_validator()
+        codes = [f"class S{i}:\n    pass\n" for i in range(3)] + ["class Broken(\n"]
+
+        results = validator.validate_many(codes, max_workers=2)
+
+        assert len(results) == 4
+        assert results[0] == validator.full_validation(codes[0])
+        assert results[3]["errors"][0]["level"] == "syntax"
+
+    def test_static_validation_accepts_file_path(self, tmp_path):
+        """Test a strategy file path validates the same as its source text."""
+        from jesse_mcp.core.strategy_validation import get_static_validator
+
+        source = (
+            "from jesse.strategies import Strategy\n\nclass PathStrategy(Strategy):\n    pass\n"
+        )
+        path = tmp_path / "PathStrategy.py"
+        path.write_text(source)
+
+        validator = get_static_validator()
+
+        assert validator.full_static_validation(path) == validator.full_static_validation(source)
+
 
 class TestStrategyBuilderRefinement:
     """Tests for the refinement loop."""
@@ -297,6 +416,24 @@ class TestStrategyBuilderRefinement:
         assert len(history) == 2
         assert success is False
 
+    def test_fix_method_errors_ignores_mentions_in_comments(self):
+        """Test method fixes only count real def lines, not comments."""
+        from jesse_mcp.core.strategy_builder import StrategyBuilder
+
+        builder = StrategyBuilder(Mock())
+        code = """
+from jesse.strategies import Strategy
+
+class CommentStrategy(Strategy):
+    # TODO: def should_long(self) once signals are ready
+    def go_long(self):
+        pass
+"""
+        fixed = builder._fix_method_errors(code, {"fix_hint": "should_long,go_long"})
+
+        assert fixed.count("def should_long(self)") == 2
+        assert fixed.count("def go_long(self)") == 1
+
 
 class TestStrategySpec:
     """Tests for StrategySpec dataclass."""
@@ -476,6 +613,56 @@ class DryRunTestStrategy(Strategy):
         assert result.passed is True
         assert len(result.warnings) > 0
 
+    def test_dry_run_reuses_result_for_unchanged_code(self):
+        """Test identical code and spec skip the second backtest."""
+        from jesse_mcp.core.strategy_validation import DryRunValidator
+
+        client = Mock()
+        client.backtest.return_value = {"metrics": {"total_trades": 3, "win_rate": 0.5}}
+        validator = DryRunValidator(lambda: client)
+        spec = {"name": "CachedStrategy", "timeframe": "1h"}
+
+        first = validator.run_dry_run("class CachedStrategy: pass", spec)
+        second = validator.run_dry_run("class CachedStrategy: pass", spec)
+        validator.run_dry_run("class CachedStrategy: pass", {**spec, "timeframe": "4h"})
+
+        assert second == first
+        assert second is not first
+        assert client.backtest.call_count == 2
+
+    def test_dry_run_does_not_cache_backtest_errors(self):
+        """Test a failed backtest is retried rather than remembered."""
+        from jesse_mcp.core.strategy_validation import DryRunValidator
+
+        client = Mock()
+        client.backtest.side_effect = [
+            {"error": "timeout"},
+            {"metrics": {"total_trades": 1, "win_rate": 1.0}},
+        ]
+        validator = DryRunValidator(lambda: client)
+        spec = {"name": "FlakyStrategy"}
+
+        first = validator.run_dry_run("class FlakyStrategy: pass", spec)
+        second = validator.run_dry_run("class FlakyStrategy: pass", spec)
+
+        assert first.passed is False
+        assert second.passed is True
+        assert client.backtest.call_count == 2
+
+    def test_dry_run_cache_evicts_least_recently_used(self):
+        """Test the dry-run cache stays within its size."""
+        from jesse_mcp.core.strategy_validation import DryRunValidator
+
+        client = Mock()
+        client.backtest.return_value = {"metrics": {"total_trades": 3, "win_rate": 0.5}}
+        validator = DryRunValidator(lambda: client, cache_size=2)
+
+        for name in ("A", "B", "A", "C", "A", "B"):
+            validator.run_dry_run(f"class {name}: pass", {"name": name})
+
+        assert client.backtest.call_count == 4
+        assert len(validator._cache) == 2
+
 
 class TestIndicatorValidation:
     """Tests for indicator validation level."""
@@ -571,6 +758,21 @@ class NotAStrategy:
         assert result.passed is False
         assert "strategy" in result.error.lower()
 
+    def test_nested_strategy_class_detected(self):
+        """Test a Strategy subclass nested inside another class is found."""
+        from jesse_mcp.core.strategy_validator import get_validator
+
+        validator = get_validator()
+        code = """
+class Container:
+    class NestedStrategy(Strategy):
+        def should_long(self):
+            return False
+"""
+        result = validator.validate_structure(code)
+
+        assert result.passed is True
+
 
 class TestStrategyBuilderCodeGeneration:
     """Tests for strategy code generation."""
@@ -593,6 +795,25 @@ class TestStrategyBuilderCodeGeneration:
 
         assert "This is a test description for the strategy" in code
 
+    def test_generate_initial_renders_risk_per_trade_as_before(self):
+        """Test the docstring keeps the plain float rendering of the risk percentage."""
+        from jesse_mcp.core.strategy_builder import StrategySpec, get_strategy_builder
+        from jesse_mcp.core.strategy_validator import get_validator
+
+        builder = get_strategy_builder(get_validator())
+        spec = StrategySpec(
+            name="RiskTestStrategy",
+            description="Risk rendering",
+            strategy_type="trend_following",
+            indicators=["atr"],
+            risk_per_trade=0.02,
+        )
+
+        code = builder.generate_initial(spec)
+
+        assert "Risk per Trade: 2.0%" in code
+        assert "{'name': 'risk_per_trade', 'type': float, 'default': 0.01, 'min': 0.001" in code
+
     def test_generate_initial_includes_hyperparameters(self):
         """Test generated code includes hyperparameters."""
         from jesse_mcp.core.strategy_builder import StrategySpec, get_strategy_builder
@@ -613,6 +834,39 @@ class TestStrategyBuilderCodeGeneration:
         assert "hyperparameters" in code
         assert "fast_period" in code or "period" in code
 
+    def test_generated_hyperparameters_are_not_shared_between_instances(self):
+        """Test the shared hyperparameters are built once and cannot be mutated."""
+        from jesse_mcp.core.strategy_builder import (
+            STRATEGY_IMPORTS,
+            StrategySpec,
+            get_strategy_builder,
+        )
+        from jesse_mcp.core.strategy_validator import get_validator
+
+        builder = get_strategy_builder(get_validator())
+        spec = StrategySpec(
+            name="SharedHyperparamStrategy",
+            description="Test hyperparameter isolation",
+            strategy_type="trend_following",
+            indicators=["rsi"],
+        )
+        code = builder.generate_initial(spec).replace(STRATEGY_IMPORTS, "")
+
+        class FakeStrategy:
+            pass
+
+        namespace = {"Strategy": FakeStrategy}
+        exec(code, namespace)
+        cls = namespace["SharedHyperparamStrategy"]
+
+        tuned = cls().hyperparameters
+        with pytest.raises(TypeError):
+            tuned[0]["default"] = 99
+
+        assert isinstance(tuned, tuple)
+        assert cls().hyperparameters is tuned
+        assert tuned[0]["default"] == 14
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
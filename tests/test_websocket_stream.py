@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Test WebSocket streaming client (no live server; the socket is never opened)
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from jesse_mcp.core.websocket_stream import JesseWebSocketClient
+
+
+class FakeWebSocket:
+    """Serves canned frames, then cancels the receive loop"""
+
+    def __init__(self, frames):
+        self.frames = list(frames)
+        self.sent = []
+
+    async def recv(self):
+        if not self.frames:
+            raise asyncio.CancelledError
+        return self.frames.pop(0)
+
+    async def send(self, frame):
+        self.sent.append(frame)
+
+
+@pytest.fixture
+def client():
+    ws_client = JesseWebSocketClient(ws_url="ws://localhost:0/ws", reconnect=False)
+    ws_client._running = True
+    return ws_client
+
+
+async def test_messages_yields_queued_messages(client):
+    client._enqueue({"type": "backtest_progress", "progress": 10})
+    client._enqueue({"type": "backtest_progress", "progress": 20})
+
+    received = []
+    async for message in client.messages():
+        received.append(message["progress"])
+        if len(received) == 2:
+            break
+
+    assert received == [10, 20]
+
+
+async def test_messages_stops_on_close(client):
+    async def consume():
+        return [message async for message in client.messages()]
+
+    consumer = asyncio.create_task(consume())
+    await asyncio.sleep(0)
+    await client.close()
+
+    assert await asyncio.wait_for(consumer, timeout=1.0) == []
+
+
+async def test_receive_loop_dispatches_sync_and_async_handlers(client):
+    seen = []
+
+    async def async_handler(message):
+        seen.append(("async", message["progress"]))
+
+    def sync_handler(message):
+        seen.append(("sync", message["progress"]))
+
+    def removed_handler(message):
+        seen.append(("removed", message["progress"]))
+
+    client.on_message(async_handler)
+    client.on_message(sync_handler)
+    client.on_message(removed_handler)
+    client.remove_handler(removed_handler)
+    client._ws = FakeWebSocket(['{"type": "backtest_progress", "progress": 5}'])
+
+    await client._receive_loop()
+
+    assert seen == [("sync", 5), ("async", 5)]
+    assert client._messages.popleft()["progress"] == 5
+
+
+async def test_reconnect_backoff_grows_with_full_jitter(client, monkeypatch):
+    from jesse_mcp.core import websocket_stream
+
+    windows = []
+    monkeypatch.setattr(
+        websocket_stream.random, "uniform", lambda lo, hi: windows.append(hi)
+    )
+    monkeypatch.setattr(websocket_stream.asyncio, "sleep", _no_sleep)
+    monkeypatch.setattr(client, "connect", _fail_connect)
+    client.reconnect_delay = 5.0
+
+    for _ in range(6):
+        await client._attempt_reconnect()
+
+    assert windows == [5.0, 10.0, 20.0, 40.0, 60.0, 60.0]
+
+
+async def _no_sleep(delay):
+    return None
+
+
+async def _fail_connect():
+    return False
+
+
+def test_full_queue_drops_oldest_progress_message():
+    client = JesseWebSocketClient(ws_url="ws://localhost:0/ws", queue_maxsize=2)
+
+    for progress in (1, 2, 3):
+        client._enqueue({"type": "backtest_progress", "progress": progress})
+
+    assert client._messages.popleft()["progress"] == 2
+    assert client._messages.popleft()["progress"] == 3
+
+
+def test_full_queue_keeps_terminal_messages():
+    client = JesseWebSocketClient(ws_url="ws://localhost:0/ws", queue_maxsize=2)
+    complete = {"type": "backtest_complete", "backtest_id": "bt-1"}
+
+    client._enqueue({"type": "backtest_progress", "progress": 1})
+    client._enqueue(complete)
+    client._enqueue({"type": "backtest_progress", "progress": 2})
+    assert list(client._messages) == [
+        complete,
+        {"type": "backtest_progress", "progress": 2},
+    ]
+
+    error = {"type": "error", "error": "boom"}
+    client._enqueue(error)
+    client._enqueue({"type": "backtest_progress", "progress": 3})
+    assert list(client._messages) == [complete, error]
+
+
+async def test_subscription_frames_are_cached_and_replayed(client):
+    client._ws = FakeWebSocket([])
+    client._connected = True
+
+    writer = asyncio.create_task(client._writer_loop())
+
+    await client.subscribe_backtest("bt-1")
+    (channel,) = client._subscriptions
+    await client._send_subscription(channel)
+    await client.unsubscribe_backtest("bt-1")
+    await client._send_queue.join()
+    writer.cancel()
+
+    subscribe_frames = [f for f in client._ws.sent if '"subscribe"' in f]
+    assert len(subscribe_frames) == 2
+    assert subscribe_frames[0] is subscribe_frames[1]
+    assert client._subscriptions == {}
+
+
+async def test_close_sends_queued_unsubscribes_first(client):
+    from jesse_mcp.core.websocket_stream import BacktestProgressTracker
+
+    ws = FakeWebSocket([])
+    client._ws = ws
+    client._connected = True
+    client._writer_task = asyncio.create_task(client._writer_loop())
+    tracker = BacktestProgressTracker("bt-1", ws_client=client)
+
+    await tracker.close()
+    await client.close()
+
+    assert [json.loads(frame) for frame in ws.sent] == [
+        {"action": "unsubscribe", "channel": "backtest:bt-1"}
+    ]
+    assert client._writer_task is None
+
+
+async def test_tracker_routes_by_resolved_message_id(client):
+    from jesse_mcp.core.websocket_stream import BacktestProgressTracker
+
+    tracker = BacktestProgressTracker("bt-1", ws_client=client)
+    progress = []
+    tracker.on_progress(progress.append)
+    client._watch("bt-1", tracker._handle_message)
+    client._ws = FakeWebSocket(
+        [
+            '{"type": "backtest_progress", "backtest_id": "bt-1", "progress": 40}',
+            '{"type": "backtest_progress", "backtest_id": "bt-2", "progress": 90}',
+        ]
+    )
+
+    await client._receive_loop()
+
+    assert progress == [40]
+    assert client._messages.popleft() == {
+        "type": "backtest_progress",
+        "backtest_id": "bt-1",
+        "progress": 40,
+    }
+
+
+async def test_receive_loop_skips_non_object_frames(client):
+    seen = []
+    client.on_message(seen.append)
+    client._ws = FakeWebSocket(["[1, 2]", '"pong"', '{"type": "heartbeat"}'])
+
+    await client._receive_loop()
+
+    assert seen == [{"type": "heartbeat"}]
+    assert list(client._messages) == [{"type": "heartbeat"}]
+
+
+def test_optimization_tracker_dispatches_by_type():
+    from jesse_mcp.core.websocket_stream import OptimizationProgressTracker
+
+    tracker = OptimizationProgressTracker("opt-1", ws_client=object())
+    trials, best, errors = [], [], []
+    tracker.on_trial(trials.append)
+    tracker.on_best(best.append)
+    tracker.on_error(errors.append)
+
+    trial = {"type": "optimization_trial", "is_best": True}
+    tracker._handle_message(trial)
+    tracker._handle_message({"type": "optimization_error", "error": "boom"})
+    tracker._handle_message({"type": "heartbeat"})
+
+    assert trials == [trial]
+    assert best == [trial]
+    assert errors == ["boom"]
+
+
+async def test_trackers_share_the_running_loops_client():
+    from jesse_mcp.core import websocket_stream
+
+    backtest = websocket_stream.BacktestProgressTracker("bt-1")
+    optimization = websocket_stream.OptimizationProgressTracker("opt-1")
+    shared = websocket_stream.get_websocket_client()
+    assert backtest._client is shared
+    assert optimization._client is shared
+
+    shared._watch("bt-1", backtest._handle_message)
+    await backtest.close()
+    assert shared._id_handlers == {}
+
+    await websocket_stream.close_websocket_client()
+    assert websocket_stream.get_websocket_client() is not shared
+    await websocket_stream.close_websocket_client()
+
+
+async def test_concurrent_connects_open_one_socket(client, monkeypatch):
+    from jesse_mcp.core import websocket_stream
+
+    client._running = False
+    opened = []
+
+    async def fake_connect(url, **kwargs):
+        await asyncio.sleep(0)
+        ws = FakeWebSocket([])
+        opened.append(ws)
+        return ws
+
+    monkeypatch.setattr(websocket_stream.websockets, "connect", fake_connect)
+
+    results = await asyncio.gather(client.connect(), client.connect())
+
+    assert results == [True, True]
+    assert len(opened) == 1
+    await client.close()
+
+
+def test_tracker_created_outside_a_loop_closes_its_own_client(monkeypatch):
+    from jesse_mcp.core import websocket_stream
+
+    tracker = websocket_stream.OptimizationProgressTracker("opt-1")
+    assert tracker._owns_client
+    closed = []
+
+    async def fake_close():
+        closed.append(True)
+
+    monkeypatch.setattr(tracker._client, "close", fake_close)
+    asyncio.run(tracker.close())
+
+    assert closed == [True]
+
+
+async def test_tracker_leaves_the_shared_client_open(client, monkeypatch):
+    from jesse_mcp.core.websocket_stream import BacktestProgressTracker
+
+    tracker = BacktestProgressTracker("bt-1", ws_client=client)
+    closed = []
+
+    async def fake_close():
+        closed.append(True)
+
+    monkeypatch.setattr(client, "close", fake_close)
+    await tracker.close()
+
+    assert closed == []
+
+
+def test_trackers_work_across_successive_event_loops():
+    from jesse_mcp.core import websocket_stream
+
+    async def track():
+        tracker = websocket_stream.BacktestProgressTracker("bt-1")
+        client = tracker._client
+        client._running = True
+        # Waiting binds the client's event to this loop
+        consumer = asyncio.create_task(client.messages().__anext__())
+        await asyncio.sleep(0)
+        client._enqueue({"type": "backtest_progress", "progress": 1})
+        # Left open, like a tool call that never closes the shared client
+        return client, await asyncio.wait_for(consumer, timeout=1.0)
+
+    first, first_message = asyncio.run(track())
+    second, second_message = asyncio.run(track())
+
+    assert first is not second
+    assert first_message["progress"] == second_message["progress"] == 1
+
+
+async def test_large_frames_are_decoded_off_the_event_loop(client, monkeypatch):
+    from jesse_mcp.core import websocket_stream
+
+    offloaded = []
+
+    async def fake_to_thread(func, *args):
+        offloaded.append(len(args[0]))
+        return func(*args)
+
+    monkeypatch.setattr(websocket_stream, "JESSE_WS_THREAD_PARSE_BYTES", 64)
+    monkeypatch.setattr(websocket_stream.asyncio, "to_thread", fake_to_thread)
+    small = '{"type": "heartbeat"}'
+    large = '{"type": "optimization_complete", "trials": [%s]}' % ",".join(["1"] * 50)
+    client._ws = FakeWebSocket([small, large])
+
+    await client._receive_loop()
+
+    assert offloaded == [len(large)]
+    assert len(client._messages) == 2
+
+
+async def test_wait_for_complete_returns_matching_terminal_message(client):
+    waiter = asyncio.create_task(client.wait_for_complete("bt-1", timeout=1.0))
+    await asyncio.sleep(0)
+    client._ws = FakeWebSocket(
+        [
+            '{"type": "backtest_complete", "backtest_id": "bt-2"}',
+            '{"type": "backtest_progress", "backtest_id": "bt-1"}',
+            '{"type": "backtest_complete", "backtest_id": "bt-1"}',
+        ]
+    )
+
+    await client._receive_loop()
+
+    result = await waiter
+    assert result == {"type": "backtest_complete", "backtest_id": "bt-1"}
+    assert client._completion_futures == {}
+
+
+async def test_wait_for_complete_after_the_complete_message_arrived(client):
+    client._ws = FakeWebSocket(['{"type": "backtest_complete", "backtest_id": "bt-1"}'])
+
+    await client._receive_loop()
+
+    result = await client.wait_for_complete("bt-1", timeout=0.01)
+    assert result == {"type": "backtest_complete", "backtest_id": "bt-1"}
+    assert client._completion_futures == {}
+
+
+def test_remembered_results_are_bounded(client, monkeypatch):
+    from jesse_mcp.core import websocket_stream
+
+    monkeypatch.setattr(websocket_stream, "MAX_RECENT_RESULTS", 2)
+    for backtest_id in ("bt-1", "bt-2", "bt-3"):
+        client._resolve_completion(backtest_id, {"type": "backtest_complete"})
+
+    assert list(client._recent_results) == ["bt-2", "bt-3"]
+
+
+async def test_wait_for_complete_times_out_and_unregisters(client):
+    assert await client.wait_for_complete("bt-1", timeout=0.01) is None
+    assert client._completion_futures == {}
+
+
+def test_backtest_tracker_skips_repeated_progress():
+    from jesse_mcp.core.websocket_stream import BacktestProgressTracker
+
+    tracker = BacktestProgressTracker("bt-1", ws_client=object())
+    progress = []
+    tracker.on_progress(progress.append)
+
+    for value in (10, 10, 11, 11, 11, 12):
+        tracker._handle_message({"type": "backtest_progress", "progress": value})
+
+    assert progress == [10, 11, 12]
+
+
+def test_optimization_tracker_samples_trials_but_keeps_best():
+    from jesse_mcp.core.websocket_stream import OptimizationProgressTracker
+
+    tracker = OptimizationProgressTracker(
+        "opt-1", ws_client=object(), trial_sample_rate=3
+    )
+    trials = []
+    tracker.on_trial(lambda trial: trials.append(trial["number"]))
+
+    for number in range(1, 8):
+        tracker._handle_message(
+            {
+                "type": "optimization_trial",
+                "number": number,
+                "is_best": number == 5,
+            }
+        )
+
+    assert trials == [3, 5, 6]
+
+
+async def test_subscription_channels_use_plain_type_values(client):
+    await client.subscribe_backtest("bt-1")
+    await client.subscribe_candle_import("Binance", "BTC-USDT", "1h")
+
+    assert list(client._subscriptions) == [
+        "backtest:bt-1",
+        "candle_import:Binance:BTC-USDT:1h",
+    ]